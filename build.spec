@@ -15,6 +15,8 @@ a = Analysis(
     datas=[
         (ctk_path, 'customtkinter/'),
     ],
+    # Provider modules and SDKs are imported lazily (importlib / inside
+    # functions), so PyInstaller cannot find them on its own.
     hiddenimports=[
         'google.genai',
         'google.genai.types',
@@ -28,6 +30,7 @@ a = Analysis(
         'PIL',
         'PIL.Image',
         'requests',
+        'httpx',
         'customtkinter',
         'providers',
         'providers.base',
@@ -35,11 +38,30 @@ a = Analysis(
         'providers.runway',
         'providers.kling',
         'providers.minimax',
+        'providers.router',
+        'providers.composite',
+        'providers.key_pool',
+        'providers.assets',
+        'providers.download',
+        'providers.transport',
+        'providers.rate_limit',
         'core',
         'core.config',
         'core.prompt_engine',
         'core.task_manager',
         'core.frame_utils',
+        'core.poller',
+        'core.journal',
+        'core.video_cache',
+        'core.enhance_cache',
+        'core.retry',
+        'core.async_engine',
+        'core.pipeline',
+        'core.script',
+        'core.events',
+        'gui.scene_table',
+        'gui.log_panel',
+        'gui.ref_images',
         'gui',
         'gui.app',
         'gui.settings_dialog',
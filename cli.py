@@ -0,0 +1,228 @@
+"""
+Headless batch runner: enhance a scene script and generate every video without the GUI.
+
+    python cli.py scenes.txt -o /data/videos --provider kling --style "cinematic, 4K"
+
+Progress is written to stdout as JSON lines, one event per line:
+    {"event": "log", "time": ..., "level": "info", "message": "..."}
+    {"event": "scene", "time": ..., "scene_id": 3, "status": "completed", ...}
+    {"event": "done", "time": ..., "completed": 40, "failed": 2, "total": 42}
+Exit code is 0 when every scene completed, 1 if any failed, 2 on setup errors.
+"""
+import sys
+import os
+import json
+import time
+import signal
+import logging
+import argparse
+import threading
+
+# Ensure project root is in path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from core.config import load_config, get_api_key
+from core.script import load_script, to_scene_dicts
+from core.prompt_engine import enhance_prompts_chunked
+from core.pipeline import (apply_rate_limits, create_provider, build_scene_tasks,
+                           build_pending_tasks, create_task_manager, create_video_cache,
+                           enhance_options, warm_up, PromptFeed)
+from providers import PROVIDER_NAMES
+
+
+class JsonEmitter:
+    """Writes one JSON object per line; safe to call from worker threads."""
+
+    def __init__(self, stream=sys.stdout, min_level: int = logging.INFO):
+        self.stream = stream
+        self.min_level = min_level
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields):
+        line = json.dumps({"event": event, "time": round(time.time(), 3), **fields},
+                          ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def log(self, message: str, level: int = logging.INFO):
+        if level >= self.min_level:
+            self.emit("log", level=logging.getLevelName(level).lower(), message=message)
+
+
+def parse_args(argv=None, config: dict = None):
+    settings = (config or {}).get("settings", {})
+    p = argparse.ArgumentParser(description="Generate videos for a scene script without the GUI.")
+    p.add_argument("script", help="TXT or CSV scene script (same formats as Import in the app)")
+    p.add_argument("-o", "--output", default=settings.get("output_folder"),
+                   help="output folder (default: from config)")
+    p.add_argument("-p", "--provider", default=settings.get("provider", "kling"),
+                   choices=list(PROVIDER_NAMES) + ["router"])
+    p.add_argument("--style", default="", help="global style prefix")
+    p.add_argument("--style-file", help="read the style prefix from a file")
+    p.add_argument("--no-enhance", action="store_true", help="skip ChatGPT enhancement")
+    p.add_argument("--enhanced-json", help="use this enhance result instead of calling ChatGPT "
+                                          "(written there after enhancing if it does not exist)")
+    p.add_argument("--incremental", action="store_true",
+                   help="with an existing --enhanced-json: keep its character bible and "
+                        "enhance only new or edited scenes")
+    p.add_argument("--stream", action="store_true",
+                   help="start generating each scene as soon as ChatGPT has enhanced it "
+                        "(not with --dry-run)")
+    p.add_argument("--model", default=settings.get("chatgpt_model", "gpt-4o"), help="ChatGPT model")
+    p.add_argument("--no-chain", action="store_true", help="disable frame chaining")
+    p.add_argument("--seed", type=int, default=int(settings.get("consistent_seed", 0)))
+    p.add_argument("--duration", type=int, default=int(settings.get("duration", 8)))
+    p.add_argument("--resolution", default=settings.get("resolution", "720p"),
+                   choices=["720p", "1080p"])
+    p.add_argument("--engine", choices=["threads", "asyncio"], help="override settings.engine")
+    p.add_argument("--resume", action="store_true",
+                   help="skip finished scenes and re-attach running jobs from the run journal")
+    p.add_argument("--no-cache", action="store_true",
+                   help="always generate, even if an identical scene was generated before")
+    p.add_argument("--subject-ref", action="append", default=[], help="subject reference image")
+    p.add_argument("--bg-ref", action="append", default=[], help="background reference image")
+    p.add_argument("--veo-model", default="veo-3.0")
+    p.add_argument("--aspect-ratio", default="16:9", choices=["16:9", "9:16"])
+    p.add_argument("--no-audio", action="store_true")
+    p.add_argument("--negative-prompt", default="cartoon, anime, text, watermark, blurry, low quality")
+    p.add_argument("--log-level", default="info", choices=["debug", "info", "warning", "error"],
+                   help="debug includes every status poll")
+    p.add_argument("--dry-run", action="store_true", help="print the plan and exit")
+    return p.parse_args(argv)
+
+
+def enhance(args, config: dict, scenes: list[dict], out: JsonEmitter,
+            on_scene=None) -> dict | None:
+    if args.no_enhance:
+        return None
+    previous = None
+    if args.enhanced_json and os.path.isfile(args.enhanced_json):
+        with open(args.enhanced_json, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        if not args.incremental:
+            out.log(f"Using enhanced prompts from {args.enhanced_json}")
+            return previous
+
+    openai_key = get_api_key(config, "openai")
+    if not openai_key:
+        raise RuntimeError("OpenAI API key required for enhancement (or pass --no-enhance)")
+
+    style = args.style
+    if args.style_file:
+        with open(args.style_file, "r", encoding="utf-8") as f:
+            style = f.read().strip()
+
+    out.log(f"Sending {len(scenes)} scenes to ChatGPT...")
+    result = enhance_prompts_chunked(openai_key, scenes, style, args.model,
+                                     previous=previous, on_scene=on_scene,
+                                     **enhance_options(config))
+    out.log(f"ChatGPT enhanced {len(result.get('scenes', []))} scenes")
+    if args.enhanced_json:
+        with open(args.enhanced_json, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    return result
+
+
+def run(argv=None) -> int:
+    config = load_config()
+    args = parse_args(argv, config)
+    out = JsonEmitter(min_level=getattr(logging, args.log_level.upper()))
+
+    if args.engine:
+        config["settings"]["engine"] = args.engine
+    apply_rate_limits(config)
+
+    try:
+        scenes = to_scene_dicts(load_script(args.script))
+    except OSError as e:
+        out.emit("error", message=f"Cannot read script: {e}")
+        return 2
+    if not scenes:
+        out.emit("error", message="No scenes in script")
+        return 2
+    if not args.output:
+        out.emit("error", message="No output folder (pass --output)")
+        return 2
+
+    provider = create_provider(config, args.provider, {
+        "model": args.veo_model,
+        "aspect_ratio": args.aspect_ratio,
+        "resolution": args.resolution,
+        "generate_audio": not args.no_audio,
+        "negative_prompt": args.negative_prompt,
+        "subject_refs": list(args.subject_ref),
+        "bg_refs": list(args.bg_ref),
+    })
+    if provider is None:
+        out.emit("error", message=f"No API key for {args.provider} in config")
+        return 2
+    warm_up(provider)   # overlaps with enhancement
+
+    stream = args.stream and not (args.no_enhance or args.dry_run)
+    if stream:
+        tasks = build_pending_tasks(scenes)   # prompts arrive while the first scenes render
+    else:
+        try:
+            enhanced = enhance(args, config, scenes, out)
+        except Exception as e:
+            out.emit("error", message=f"Enhancement failed: {e}")
+            return 2
+        tasks = build_scene_tasks(scenes, enhanced)
+    manager = create_task_manager(
+        config, provider, args.output,
+        frame_chaining=not args.no_chain,
+        seed=args.seed,
+        duration=args.duration,
+        resolution=args.resolution,
+        subject_refs=list(args.subject_ref),
+        bg_refs=list(args.bg_ref),
+        resume=args.resume,
+        cache=None if args.no_cache else create_video_cache(config),
+    )
+    manager.load_scenes(tasks)
+
+    out.emit("plan", scenes=len(tasks), segments=len(manager.get_segments()),
+             provider=provider.name, parallel=manager.max_concurrent,
+             est_cost=round(manager.estimate_cost(), 2), output=args.output)
+    if args.dry_run:
+        return 0
+
+    def on_update(event):
+        out.emit("scene", scene_id=event.scene_id, status=event.status,
+                 video_path=event.video_path or None, error=event.error or None)
+
+    done = threading.Event()
+    manager.set_callbacks(on_update=on_update, on_log=out.log, on_complete=done.set)
+
+    def on_signal(signum, frame):
+        out.log("Stopping...")
+        manager.stop()
+
+    signal.signal(signal.SIGINT, on_signal)
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, on_signal)
+
+    manager.start()
+    if stream:
+        feed = PromptFeed(manager)
+
+        def run_enhance():
+            try:
+                feed.finish(enhance(args, config, scenes, out, on_scene=feed.on_scene))
+            except Exception as e:
+                out.emit("error", message=f"Enhancement failed: {e}")
+                feed.fail(f"Enhancement failed: {e}")
+
+        threading.Thread(target=run_enhance, daemon=True).start()
+    while not done.wait(0.5):
+        pass
+
+    completed = sum(1 for t in manager.scenes if t.status == "completed")
+    failed = sum(1 for t in manager.scenes if t.status == "failed")
+    out.emit("done", completed=completed, failed=failed, total=len(manager.scenes))
+    return 0 if completed == len(manager.scenes) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -0,0 +1,281 @@
+import os
+import queue
+import logging
+import time
+import asyncio
+import threading
+
+from core import poller
+from core.task_manager import TaskManager, SceneTask
+from core.retry import PERMANENT, classify_error, classify_message, retry_after
+
+
+class AsyncTaskManager(TaskManager):
+    """
+    TaskManager driven by one asyncio event loop instead of a thread per segment.
+
+    Scenes are coroutines that use the providers' async API (asubmit_*,
+    acheck_status, adownload_video), so hundreds of jobs can be in flight at
+    once. The loop runs on the TaskManager's background thread and reports
+    through the same callbacks, so the GUI does not need to know which engine
+    is in use.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._journal_queue: queue.Queue = queue.Queue()
+        self._journal_thread: threading.Thread | None = None
+        self._journal_lock = threading.Lock()   # orders direct writes after queued ones
+
+    def _run(self):
+        # Journal writes fsync; they go to one writer thread so the event loop
+        # never waits on the disk
+        with self._journal_lock:
+            self._journal_thread = threading.Thread(target=self._journal_writer, daemon=True,
+                                                    name="journal")
+            self._journal_thread.start()
+        try:
+            asyncio.run(self._arun())
+        finally:
+            self._close_journal_writer()
+
+    def _close_journal_writer(self):
+        """Flush queued journal entries and stop the writer (later writes go direct)."""
+        with self._journal_lock:
+            if self._journal_thread is None:
+                return
+            self._journal_queue.put(None)
+            self._journal_thread.join()
+            self._journal_thread = None
+
+    def _write_journal(self, entry: dict):
+        with self._journal_lock:
+            if self._journal_thread is None:
+                super()._write_journal(entry)   # not running: write directly
+            else:
+                self._journal_queue.put(entry)
+
+    def _journal_writer(self):
+        """Write queued entries in order, batching whatever has queued up into one fsync."""
+        done = False
+        while not done:
+            entries = [self._journal_queue.get()]
+            while True:
+                try:
+                    entries.append(self._journal_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in entries:
+                done = True
+                entries = entries[:entries.index(None)]
+            if not entries:
+                continue
+            try:
+                self.journal.record_many(entries)
+            except OSError as e:
+                self._log(f"Journal write failed: {e}", logging.WARNING)
+
+    async def _arun(self):
+        self._blocked_until: dict[str, float] = {}  # provider name -> Retry-After deadline
+        pending = self._prepare_run()
+        if pending:
+            slots = asyncio.Semaphore(self.max_concurrent)
+            await asyncio.gather(*(self._arun_segment(seg, slots) for seg in pending))
+        try:
+            await self.provider.aclose()
+        except Exception:
+            pass
+        await asyncio.to_thread(self._close_journal_writer)
+        self._finish_run()
+
+    async def _arun_segment(self, segment: list[SceneTask], slots: asyncio.Semaphore):
+        async with slots:
+            try:
+                await self._arun_chain(segment)
+            except Exception as e:
+                self._fail_segment(segment, e)
+
+    async def _arun_chain(self, scenes: list[SceneTask]):
+        last_frame_path = None
+        prev_done = None
+
+        for scene in scenes:
+            while self._running and not scene.ready.is_set():
+                await asyncio.sleep(0.5)
+            if not self._running or scene.status == "failed":
+                break
+            self._restore_streamed(scene)
+            if scene.cut_before:
+                last_frame_path = prev_done = None
+
+            if scene.status != "completed":
+                if prev_done is not None:
+                    last_frame_path = await asyncio.to_thread(self._chain_frame, prev_done)
+                    prev_done = None
+                await self._aprocess_scene(scene, last_frame_path)
+
+            if scene.status == "completed" and self.frame_chaining:
+                prev_done = scene
+
+    async def _aprocess_scene(self, scene: SceneTask, first_frame_path: str = None):
+        save_path = os.path.join(self.output_folder, f"{scene.scene_id}.mp4")
+        ref_image, ref_mode = self._pick_reference(first_frame_path)
+        key = await asyncio.to_thread(self._cache_key, scene, ref_image)
+
+        if scene.status == "processing" and scene.task_id:
+            self._log(f"Scene {scene.scene_id}: Re-attaching to task {scene.task_id[:20]}...")
+            await self._agenerate(scene, ref_image, ref_mode, save_path, key)
+        elif not await self._areuse_cached(scene, key, save_path):
+            try:
+                if await self._asubmit(scene, ref_image, ref_mode):
+                    await self._agenerate(scene, ref_image, ref_mode, save_path, key)
+            finally:
+                self._release(key)
+
+    async def _agenerate(self, scene: SceneTask, ref_image: str | None, ref_mode: str,
+                         save_path: str, key: str | None):
+        while True:
+            result = await self._apoll(scene)
+            if result is None:
+                return  # stopped
+            if result.get("status") == "completed":
+                scene.video_url = result.get("video_url", "")
+                self._log(f"Scene {scene.scene_id}: Generation complete! Downloading...")
+                break
+
+            scene.status = "failed"
+            scene.error = result.get("error", "Unknown error")
+            self._log(f"Scene {scene.scene_id}: FAILED - {scene.error}", logging.ERROR)
+            self._update(scene)
+            error_class = result.get("error_class") or classify_message(scene.error)
+            if not await self._aretry(scene, error_class):
+                return
+            if not await self._asubmit(scene, ref_image, ref_mode):
+                return
+
+        if scene.video_url:
+            await self._adownload(scene, save_path)
+            await asyncio.to_thread(self._store_cached, scene, key)
+
+    async def _areuse_cached(self, scene: SceneTask, key: str | None, save_path: str) -> bool:
+        """_reuse_cached without blocking the loop while an identical scene generates."""
+        if key is None:
+            return False
+        while True:
+            if await asyncio.to_thread(self._fetch_cached, scene, key, save_path):
+                return True
+            event = self._claim(key)
+            if event is None:
+                return False
+            self._log(f"Scene {scene.scene_id}: Identical to a scene being generated, waiting...")
+            while self._running and not event.is_set():
+                await asyncio.sleep(0.5)
+            if not self._running:
+                return True
+
+    async def _asubmit(self, scene: SceneTask, ref_image: str | None, ref_mode: str) -> bool:
+        prompt = scene.enhanced_prompt
+        while self._running:
+            scene.status = "submitting"
+            self._update(scene)
+            try:
+                if ref_image:
+                    self._log(f"Scene {scene.scene_id}: Submitting ({ref_mode})...")
+                    scene.task_id = await self.provider.asubmit_image_to_video(
+                        prompt, ref_image, self.duration, self.resolution, self.seed
+                    )
+                else:
+                    self._log(f"Scene {scene.scene_id}: Submitting (text-to-video)...")
+                    scene.task_id = await self.provider.asubmit_text_to_video(
+                        prompt, self.duration, self.resolution, self.seed
+                    )
+            except Exception as e:
+                scene.status = "failed"
+                scene.error = str(e)
+                self._log(f"Scene {scene.scene_id}: Submit FAILED - {e}", logging.ERROR)
+                self._update(scene)
+                if await self._aretry(scene, classify_error(e), retry_after(e)):
+                    continue
+                return False
+
+            scene.status = "processing"
+            self._update(scene)
+            self._log(f"Scene {scene.scene_id}: Processing (task_id: {scene.task_id[:20]}...)")
+            return True
+        return False
+
+    async def _apoll(self, scene: SceneTask) -> dict | None:
+        """Poll on the same adaptive schedule as StatusPoller. None if stopped."""
+        name = self.provider.name
+        started = time.monotonic()
+        polls = errors = 0
+        delay = poller.next_interval(name, 0)
+
+        while self._running:
+            blocked = self._blocked_until.get(name, 0) - time.monotonic()
+            await self._asleep(max(delay, blocked))
+            if not self._running:
+                break
+
+            polls += 1
+            try:
+                result = await self.provider.acheck_status(scene.task_id)
+            except Exception as e:
+                if classify_error(e) == PERMANENT:
+                    return {"status": "failed", "error": str(e), "error_class": PERMANENT}
+                self._log(f"Scene {scene.scene_id}: Poll error: {e}", logging.WARNING)
+                errors += 1
+                delay = retry_after(e)
+                if delay is not None:
+                    self._blocked_until[name] = max(self._blocked_until.get(name, 0),
+                                                    time.monotonic() + delay)
+                else:
+                    delay = poller.error_backoff(errors)
+                continue
+
+            errors = 0
+            elapsed = time.monotonic() - started
+            status = result.get("status", "")
+            if status in ("completed", "failed"):
+                if status == "completed":
+                    poller.record_duration(name, elapsed)
+                return result
+            self._log(f"Scene {scene.scene_id}: Still processing... (poll #{polls})", logging.DEBUG)
+            delay = poller.next_interval(name, elapsed)
+        return None
+
+    async def _adownload(self, scene: SceneTask, save_path: str):
+        while True:
+            scene.status = "downloading"
+            self._update(scene)
+            try:
+                await self.provider.adownload_video(scene.video_url, save_path)
+                scene.video_path = save_path
+                scene.status = "completed"
+                scene.error = ""
+                self._log(f"Scene {scene.scene_id}: Downloaded -> {save_path}")
+                break
+            except Exception as e:
+                scene.status = "failed"
+                scene.error = str(e)
+                self._log(f"Scene {scene.scene_id}: Download FAILED - {e}", logging.ERROR)
+                if not await self._aretry(scene, classify_error(e), retry_after(e)):
+                    break
+        self._update(scene)
+
+    async def _aretry(self, scene: SceneTask, error_class: str,
+                      wait_hint: float | None = None) -> bool:
+        delay = self._retry_delay(scene, error_class, wait_hint)
+        if delay is None:
+            return False
+        await self._asleep(delay)
+        return self._running
+
+    async def _asleep(self, seconds: float):
+        """Sleep, waking early (within 1 s) if the run is stopped."""
+        deadline = time.monotonic() + seconds
+        while self._running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, 1.0))
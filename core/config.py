@@ -1,5 +1,6 @@
 import json
 import os
+import re
 
 CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".ai-video-tool")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
@@ -21,6 +22,27 @@ DEFAULT_CONFIG = {
         "consistent_seed": 0,
         "chatgpt_enhance": True,
         "chatgpt_model": "gpt-4o",
+        "enhance_cache": True,   # reuse ChatGPT results for unchanged scenes
+        "enhance_concurrency": 4,  # ChatGPT chunk requests at once (after the first)
+        "max_concurrent": {
+            "veo3": 2,
+            "runway": 4,
+            "kling": 4,
+            "minimax": 4,
+        },
+        "engine": "threads",  # "threads" or "asyncio" (for very large batches)
+        "generation_cache": True,   # reuse videos generated earlier from identical inputs
+        "generation_cache_gb": 20,  # size limit, least recently used videos are evicted
+        "http2": False,       # asyncio engine only; needs the h2 package (pip install httpx[http2])
+        "routing_latency_slo": 900,  # seconds before Auto routing re-routes a job, 0 = off
+        "routing_cost_weight": 60,   # seconds of latency Auto routing trades for $1
+        # Calls per minute per API key (0 = unlimited); daily_quota = submits per day per key
+        "rate_limits": {
+            "veo3": {"submit": 10, "poll": 60, "download": 30, "daily_quota": 0},
+            "runway": {"submit": 20, "poll": 120, "download": 30, "daily_quota": 0},
+            "kling": {"submit": 10, "poll": 60, "download": 30, "daily_quota": 0},
+            "minimax": {"submit": 10, "poll": 60, "download": 30, "daily_quota": 0},
+        },
     },
 }
 
@@ -45,4 +67,42 @@ def save_config(config: dict):
 
 
 def get_api_key(config: dict, provider: str) -> str:
-    return config.get("api_keys", {}).get(provider, "")
+    keys = get_api_keys(config, provider)
+    return keys[0] if keys else ""
+
+
+def get_api_keys(config: dict, provider: str) -> list[str]:
+    """All keys configured for a provider, in order."""
+    return parse_api_keys(config.get("api_keys", {}).get(provider, ""))
+
+
+def parse_api_keys(value) -> list[str]:
+    """Split a comma/newline separated key string (or a list) into unique keys."""
+    if isinstance(value, str):
+        value = re.split(r"[,;\s]+", value)
+    keys = []
+    for key in value or []:
+        key = str(key).strip()
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+def get_max_concurrent(config: dict, provider: str) -> int:
+    """Max number of scenes kept in flight at once for a provider."""
+    limits = config.get("settings", {}).get("max_concurrent", {})
+    default = DEFAULT_CONFIG["settings"]["max_concurrent"].get(provider, 1)
+    try:
+        return max(1, int(limits.get(provider, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def get_rate_limits(config: dict) -> dict:
+    """Per-provider rate limits with defaults filled in for missing entries."""
+    limits = json.loads(json.dumps(DEFAULT_CONFIG["settings"]["rate_limits"]))
+    saved = config.get("settings", {}).get("rate_limits", {})
+    for provider, values in saved.items():
+        if isinstance(values, dict):
+            limits.setdefault(provider, {}).update(values)
+    return limits
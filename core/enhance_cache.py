@@ -0,0 +1,55 @@
+import os
+import json
+import threading
+
+MAX_ENTRIES = 20000
+
+
+class EnhanceCache:
+    """
+    ChatGPT enhancement results by request hash, kept in one JSON file.
+
+    Values are small dicts (an enhanced scene, or the character bible and
+    style guide a chunk established). The file is loaded on first use and
+    rewritten after every put; the oldest entries are dropped beyond
+    max_entries.
+    """
+
+    def __init__(self, path: str, max_entries: int = MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: dict | None = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            value = self._load().get(key)
+        return dict(value) if value is not None else None
+
+    def put(self, entries: dict[str, dict]):
+        if not entries:
+            return
+        with self._lock:
+            cached = self._load()
+            for key, value in entries.items():
+                cached.pop(key, None)   # re-insert as newest
+                cached[key] = value
+            for key in list(cached)[:max(0, len(cached) - self.max_entries)]:
+                del cached[key]
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                tmp = self.path + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(cached, f, ensure_ascii=False)
+                os.replace(tmp, self.path)
+            except OSError:
+                pass   # the cache only saves time; enhancing still works without it
@@ -0,0 +1,53 @@
+import time
+import threading
+
+
+class SceneEvent:
+    """Snapshot of one scene's state at the moment it changed."""
+
+    __slots__ = ("scene_id", "status", "task_id", "video_path", "error", "time")
+
+    def __init__(self, scene_id: int, status: str, task_id: str = "",
+                 video_path: str = "", error: str = ""):
+        self.scene_id = scene_id
+        self.status = status
+        self.task_id = task_id
+        self.video_path = video_path
+        self.error = error
+        self.time = time.time()
+
+    @classmethod
+    def of(cls, scene) -> "SceneEvent":
+        return cls(scene.scene_id, scene.status, scene.task_id, scene.video_path, scene.error)
+
+
+class SceneEventQueue:
+    """
+    Thread-safe queue of scene state changes, coalesced per scene.
+
+    Workers push from any thread; the consumer drains at its own pace and
+    gets only the latest event for each scene that changed since the last
+    drain, so a slow consumer never falls behind and memory stays bounded
+    by the number of scenes.
+    """
+
+    def __init__(self):
+        self._pending: dict[int, SceneEvent] = {}
+        self._lock = threading.Lock()
+
+    def push(self, event: SceneEvent):
+        with self._lock:
+            # Re-insert so drain order follows the latest change
+            self._pending.pop(event.scene_id, None)
+            self._pending[event.scene_id] = event
+
+    def drain(self) -> list[SceneEvent]:
+        with self._lock:
+            if not self._pending:
+                return []
+            events, self._pending = list(self._pending.values()), {}
+        return events
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
@@ -1,9 +1,22 @@
 import subprocess
 import shutil
+import hashlib
+import functools
+import threading
 import os
+from collections import OrderedDict
 
+TAIL_SECONDS = 1.0          # decode starts at the keyframe before this point from the end
+HASH_CHUNK = 1024 * 1024    # bytes hashed from each end of the video
+MEMO_SIZE = 512
 
+_memo: OrderedDict = OrderedDict()   # video fingerprint -> (frame path, _file_stamp of it)
+_memo_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
 def find_ffmpeg() -> str:
+    """Path to ffmpeg, looked up once per process (not cached while missing)."""
     path = shutil.which("ffmpeg")
     if path:
         return path
@@ -21,15 +34,46 @@ def find_ffmpeg() -> str:
     )
 
 
-def extract_last_frame(video_path: str, output_path: str = None) -> str:
-    """Extract the last frame of a video as PNG for frame chaining."""
-    ffmpeg = find_ffmpeg()
-    if output_path is None:
-        base = os.path.splitext(video_path)[0]
-        output_path = f"{base}_lastframe.png"
+@functools.lru_cache(maxsize=1)
+def _av():
+    """PyAV module if installed, else None. Decoding in-process avoids an ffmpeg spawn."""
+    try:
+        import av
+        return av
+    except ImportError:
+        return None
 
+
+def _fingerprint(video_path: str) -> str:
+    """Content hash from the size and both ends of the file (the moov atom lives at one of them)."""
+    size = os.path.getsize(video_path)
+    h = hashlib.sha1(str(size).encode())
+    with open(video_path, "rb") as f:
+        h.update(f.read(HASH_CHUNK))
+        if size > 2 * HASH_CHUNK:
+            f.seek(-HASH_CHUNK, os.SEEK_END)
+            h.update(f.read(HASH_CHUNK))
+    return h.hexdigest()
+
+
+def _extract_av(av, video_path: str, output_path: str):
+    with av.open(video_path) as container:
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        if container.duration:
+            # Duration is in av.time_base (microseconds); seek lands on a keyframe before
+            container.seek(max(0, container.duration - int(TAIL_SECONDS * av.time_base)))
+        last = None
+        for frame in container.decode(stream):
+            last = frame
+    if last is None:
+        raise RuntimeError(f"No video frames in {video_path}")
+    last.to_image().save(output_path, compress_level=1)
+
+
+def _extract_ffmpeg(video_path: str, output_path: str):
     cmd = [
-        ffmpeg,
+        find_ffmpeg(),
         "-sseof", "-0.5",
         "-i", video_path,
         "-frames:v", "1",
@@ -38,6 +82,58 @@ def extract_last_frame(video_path: str, output_path: str = None) -> str:
         output_path,
     ]
     subprocess.run(cmd, capture_output=True, check=True)
+
+
+def _file_stamp(path: str) -> tuple[int, int] | None:
+    """(size, mtime_ns) of path, None if it is gone."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def extract_last_frame(video_path: str, output_path: str = None) -> str:
+    """
+    Extract the last frame of a video as PNG for frame chaining.
+
+    Uses PyAV when it is installed, ffmpeg otherwise. Results are memoized
+    by video content, so the same video is only decoded once per process.
+    """
+    if output_path is None:
+        base = os.path.splitext(video_path)[0]
+        output_path = f"{base}_lastframe.png"
+
+    key = _fingerprint(video_path)
+    with _memo_lock:
+        cached, stamp = _memo.get(key, (None, None))
+        if cached and _file_stamp(cached) == stamp:
+            _memo.move_to_end(key)
+        elif cached:
+            del _memo[key]   # deleted, or overwritten since it was extracted
+            cached = None
+    if cached:
+        if os.path.abspath(cached) != os.path.abspath(output_path):
+            shutil.copyfile(cached, output_path)
+        return output_path
+
+    av = _av()
+    if av is not None:
+        try:
+            _extract_av(av, video_path, output_path)
+        except Exception:
+            av = None   # something PyAV cannot decode, let ffmpeg try
+    if av is None:
+        _extract_ffmpeg(video_path, output_path)
     if not os.path.isfile(output_path):
         raise RuntimeError(f"Failed to extract last frame from {video_path}")
+
+    with _memo_lock:
+        # output_path now holds this video's frame, not whatever it was memoized for
+        for other in [k for k, (path, _) in _memo.items()
+                      if os.path.abspath(path) == os.path.abspath(output_path)]:
+            del _memo[other]
+        _memo[key] = (output_path, _file_stamp(output_path))
+        while len(_memo) > MEMO_SIZE:
+            _memo.popitem(last=False)
     return output_path
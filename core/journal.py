@@ -0,0 +1,91 @@
+import os
+import json
+import time
+import hashlib
+import threading
+
+JOURNAL_FILE = "run_journal.jsonl"
+
+
+def scene_key(provider_name: str, prompt: str) -> str:
+    """Identifies what was sent for a scene, so edited scenes are never re-attached."""
+    return hashlib.sha1(f"{provider_name}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def journal_namespace(entry: dict) -> str:
+    """Task id namespace of an entry (older journals only recorded the provider name)."""
+    return entry.get("task_ns", entry.get("provider", ""))
+
+
+class RunJournal:
+    """
+    Append-only JSONL journal of scene state, kept in the output folder.
+
+    Every state change of a scene (task_id received, completed, failed, chain
+    frame extracted) is appended and fsynced, so a crashed or closed run can be
+    resumed: finished scenes are skipped and in-flight jobs are re-polled
+    instead of being submitted (and paid for) again.
+    """
+
+    def __init__(self, folder: str):
+        self.path = os.path.join(folder, JOURNAL_FILE)
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.path)
+
+    def reset(self):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w", encoding="utf-8"):
+                pass
+
+    def record(self, entry: dict):
+        self.record_many([entry])
+
+    def record_many(self, entries: list[dict]):
+        """Append several entries with a single fsync."""
+        now = time.time()
+        lines = "".join(json.dumps(dict(e, time=now), ensure_ascii=False) + "\n" for e in entries)
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def load(self) -> dict[int, dict]:
+        """Latest recorded state per scene_id."""
+        state: dict[int, dict] = {}
+        if not self.exists():
+            return state
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn write from a crash
+                sid = entry.get("scene_id")
+                if sid is None:
+                    continue
+                state.setdefault(sid, {}).update(entry)
+        return state
+
+    def summarize(self, keys: dict[int, str] | None,
+                  task_namespace: str = None) -> tuple[int, int]:
+        """
+        Count (completed, in_flight) journal entries that still match the
+        given {scene_id: scene_key} mapping (all of them if keys is None,
+        for prompts that are still being streamed). In-flight jobs only count
+        if their task ids are in task_namespace (when given).
+        """
+        completed = in_flight = 0
+        for sid, entry in self.load().items():
+            if keys is not None and keys.get(sid) != entry.get("key"):
+                continue
+            if entry.get("status") == "completed" and os.path.isfile(entry.get("video_path", "")):
+                completed += 1
+            elif (entry.get("task_id") and entry.get("status") in ("processing", "downloading")
+                  and task_namespace in (None, journal_namespace(entry))):
+                in_flight += 1
+        return completed, in_flight
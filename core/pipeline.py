@@ -0,0 +1,199 @@
+"""Run setup shared by the GUI and the headless CLI (no UI imports here)."""
+import os
+import threading
+
+from core.config import get_api_keys, get_max_concurrent, get_rate_limits, CONFIG_DIR
+from core.prompt_engine import DEFAULT_CONCURRENCY, is_hard_cut
+from core.task_manager import TaskManager, SceneTask
+from core.async_engine import AsyncTaskManager
+from core.poller import POLL_WORKERS
+from core.video_cache import VideoCache
+from core.enhance_cache import EnhanceCache
+from providers import PROVIDER_NAMES, get_provider_class
+from providers.router import RoutingProvider
+from providers.key_pool import KeyPoolProvider
+from providers.composite import CompositeProvider
+from providers import rate_limit, transport
+
+
+def apply_rate_limits(config: dict):
+    rate_limit.configure(get_rate_limits(config), os.path.join(CONFIG_DIR, "quota.json"))
+
+
+def create_provider(config: dict, name: str, veo_options: dict = None):
+    """
+    Build the provider for a run, or None if it has no API key.
+
+    name is one of PROVIDER_NAMES or "router" (every provider that has a
+    key). Several keys for one provider are pooled. Only the provider
+    modules used are imported. veo_options are passed to Veo3Provider (model,
+    aspect_ratio, resolution, generate_audio, ...).
+    """
+    if name == "router":
+        members = [p for p in (_create_keyed(config, n, veo_options) for n in PROVIDER_NAMES)
+                   if p is not None]
+        if not members:
+            return None
+        settings = config.get("settings", {})
+        return RoutingProvider(
+            members,
+            capacities={p.name: provider_capacity(config, p) for p in members},
+            latency_slo=float(settings.get("routing_latency_slo", 900)),
+            cost_weight=float(settings.get("routing_cost_weight", 60)),
+        )
+    if name not in PROVIDER_NAMES:
+        raise ValueError(f"Unknown provider: {name}")
+    return _create_keyed(config, name, veo_options)
+
+
+def _create_keyed(config: dict, name: str, veo_options: dict = None):
+    """One provider per configured API key, pooled when there are several."""
+    api_keys = get_api_keys(config, name)
+    if not api_keys:
+        return None   # without a key the provider module is never imported
+    provider_cls = get_provider_class(name)
+    options = (veo_options or {}) if name == "veo3" else {}
+    providers = [provider_cls(api_key, **options) for api_key in api_keys]
+    if len(providers) == 1:
+        return providers[0]
+    return KeyPoolProvider(providers, get_max_concurrent(config, name))
+
+
+def warm_up(provider):
+    """
+    Open the provider's connections (and create SDK clients) in the background,
+    so the first submit does not pay for them. Safe to call more than once.
+    """
+    threading.Thread(target=provider.warm_up, daemon=True, name="warm-up").start()
+
+
+def provider_capacity(config: dict, provider) -> int:
+    """Jobs to keep in flight: per-key limit, times keys for pooled providers."""
+    if isinstance(provider, CompositeProvider):
+        return provider.total_capacity()
+    return get_max_concurrent(config, provider.name)
+
+
+def quota_keys(provider) -> dict[str, int]:
+    """Provider name -> number of API keys in use, for rate_limit.quota_summary."""
+    members = ([m.provider for m in provider.members.values()]
+               if isinstance(provider, RoutingProvider) else [provider])
+    return {p.name: p.key_count if isinstance(p, KeyPoolProvider) else 1 for p in members}
+
+
+def build_scene_tasks(scenes: list[dict], enhanced: dict = None) -> list[SceneTask]:
+    """
+    SceneTasks from raw scenes ({"id", "prompt", "cut"}) and, optionally, the
+    enhance_prompts result. The style guide is appended to each enhanced prompt.
+    """
+    enhanced_scenes = {}
+    hard_cuts = set()
+    style = ""
+    if enhanced:
+        style = enhanced.get("style_guide", "")
+        for s in enhanced.get("scenes", []):
+            enhanced_scenes[s["id"]] = s.get("enhanced_prompt", "")
+            if is_hard_cut(s):
+                hard_cuts.add(s["id"])
+
+    tasks = []
+    for raw in scenes:
+        sid = raw["id"]
+        prompt = _with_style(enhanced_scenes.get(sid, ""), style)
+        cut = raw.get("cut", False) or sid in hard_cuts
+        tasks.append(SceneTask(sid, raw["prompt"], prompt, cut_before=cut and bool(tasks)))
+    return tasks
+
+
+def _with_style(prompt: str, style: str) -> str:
+    if prompt and style and style not in prompt:
+        return f"{prompt}. {style}"
+    return prompt
+
+
+def build_pending_tasks(scenes: list[dict]) -> list[SceneTask]:
+    """SceneTasks whose enhanced prompts are still to come (streamed in by a PromptFeed)."""
+    return [SceneTask(raw["id"], raw["prompt"], cut_before=raw.get("cut", False) and i > 0,
+                      ready=False)
+            for i, raw in enumerate(scenes)]
+
+
+class PromptFeed:
+    """
+    Hands streamed enhancement results to the pending SceneTasks of a
+    running TaskManager, so each scene starts generating as soon as its own
+    prompt is ready instead of after the whole script is enhanced.
+
+    Pass on_scene to enhance_prompts_chunked, then call finish(result) with
+    its return value, or fail(error) if it raised.
+    """
+
+    def __init__(self, manager: TaskManager):
+        self.manager = manager
+        self._tasks = {t.scene_id: t for t in manager.scenes}
+        self._first = manager.scenes[0].scene_id if manager.scenes else None
+        self._lock = threading.Lock()
+
+    def on_scene(self, scene: dict, bible: dict):
+        try:
+            task = self._tasks.get(int(scene.get("id")))
+        except (TypeError, ValueError):
+            return
+        if task is None:
+            return
+        with self._lock:
+            if task.ready.is_set():
+                return   # first version wins (retried chunks send scenes again)
+            task.set_enhanced(_with_style(scene.get("enhanced_prompt", ""),
+                                          bible.get("style_guide", "")),
+                              is_hard_cut(scene) and task.scene_id != self._first)
+
+    def finish(self, result: dict | None):
+        """Apply the final result; scenes it does not cover keep their original prompt."""
+        for scene in (result or {}).get("scenes", []):
+            self.on_scene(scene, result)
+        with self._lock:
+            for task in self._tasks.values():
+                if not task.ready.is_set():
+                    task.set_enhanced("")
+
+    def fail(self, error: str):
+        with self._lock:
+            self.manager.fail_unready(error)
+
+
+def create_enhance_cache(config: dict) -> EnhanceCache | None:
+    """The ChatGPT result cache under CONFIG_DIR, or None if settings.enhance_cache is off."""
+    if not config.get("settings", {}).get("enhance_cache", True):
+        return None
+    return EnhanceCache(os.path.join(CONFIG_DIR, "cache", "enhance.json"))
+
+
+def enhance_options(config: dict) -> dict:
+    """Keyword arguments for enhance_prompts_chunked from the settings."""
+    settings = config.get("settings", {})
+    return {
+        "cache": create_enhance_cache(config),
+        "max_concurrent": max(1, int(settings.get("enhance_concurrency", DEFAULT_CONCURRENCY))),
+    }
+
+
+def create_video_cache(config: dict) -> VideoCache | None:
+    """The generation cache under CONFIG_DIR, or None if settings.generation_cache is off."""
+    settings = config.get("settings", {})
+    if not settings.get("generation_cache", True):
+        return None
+    max_gb = float(settings.get("generation_cache_gb", 20))
+    return VideoCache(os.path.join(CONFIG_DIR, "cache", "videos"), int(max_gb * 1024 ** 3))
+
+
+def create_task_manager(config: dict, provider, output_folder: str, **options) -> TaskManager:
+    """TaskManager (or AsyncTaskManager, per settings.engine) sized for the provider."""
+    engine = config.get("settings", {}).get("engine", "threads")
+    manager_cls = AsyncTaskManager if engine == "asyncio" else TaskManager
+    options.setdefault("max_concurrent", provider_capacity(config, provider))
+    options.setdefault("cache", create_video_cache(config))
+    # Every in-flight job can hold a connection, plus the status poller's workers
+    transport.configure(pool_size=options["max_concurrent"] + POLL_WORKERS,
+                        http2=bool(config.get("settings", {}).get("http2", False)))
+    return manager_cls(provider=provider, output_folder=output_folder, **options)
@@ -0,0 +1,203 @@
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from statistics import median
+from typing import Callable
+
+from providers.base import BaseProvider
+from core.retry import retry_after, classify_error, PERMANENT
+
+MIN_INTERVAL = 2         # seconds, used around the expected finish time
+MAX_INTERVAL = 30        # seconds, used far away from it
+DEFAULT_EXPECTED = 120   # seconds, until we have history for a provider
+HISTORY_SIZE = 20
+POLL_WORKERS = 4
+
+# provider name -> recent generation durations (seconds), shared across runs
+_history: dict[str, deque] = {}
+_history_lock = threading.Lock()
+
+
+def record_duration(provider_name: str, seconds: float):
+    with _history_lock:
+        _history.setdefault(provider_name, deque(maxlen=HISTORY_SIZE)).append(seconds)
+
+
+def expected_duration(provider_name: str) -> float:
+    with _history_lock:
+        samples = list(_history.get(provider_name, ()))
+    return median(samples) if samples else DEFAULT_EXPECTED
+
+
+def next_interval(provider_name: str, elapsed: float) -> float:
+    """
+    Seconds until the next poll of a job that has been running `elapsed` seconds.
+
+    Far before the expected finish we poll slowly, close to it we poll every
+    MIN_INTERVAL, and once overdue the interval grows back towards MAX_INTERVAL.
+    """
+    remaining = expected_duration(provider_name) - elapsed
+    if remaining > 0:
+        interval = remaining / 2
+    else:
+        interval = MIN_INTERVAL + (-remaining) / 10
+    return max(MIN_INTERVAL, min(interval, MAX_INTERVAL))
+
+
+def error_backoff(errors: int) -> float:
+    """Seconds to wait after `errors` consecutive failed polls (no Retry-After)."""
+    return min(MAX_INTERVAL, MIN_INTERVAL * 2 ** errors)
+
+
+class PollHandle:
+    """One in-flight task watched by the poller. Owners block on wait()."""
+
+    def __init__(self, provider: BaseProvider, task_id: str,
+                 on_poll: Callable | None = None):
+        self.provider = provider
+        self.task_id = task_id
+        self.on_poll = on_poll  # on_poll(handle, error) after every non-final poll
+        self.submitted_at = time.monotonic()
+        self.next_poll = self.submitted_at + next_interval(provider.name, 0)
+        self.polls = 0
+        self.errors = 0
+        self.result: dict | None = None
+        self._busy = False
+        self._event = threading.Event()
+
+    def wait(self, timeout: float = None) -> dict | None:
+        """Block until the task finishes (or timeout). Returns the final status dict."""
+        self._event.wait(timeout)
+        return self.result
+
+    @property
+    def done(self) -> bool:
+        return self._event.is_set()
+
+
+class StatusPoller:
+    """
+    Single poller for every in-flight task of a run.
+
+    Instead of each scene sleeping a fixed interval between check_status calls,
+    scenes register their task_id with watch() and wait on the returned handle.
+    The poller schedules each poll from the provider's learned generation time,
+    backs off on errors and Retry-After, and wakes the owner as soon as the task
+    completes or fails.
+    """
+
+    def __init__(self):
+        self._handles: dict[int, PollHandle] = {}
+        self._blocked_until: dict[str, float] = {}  # provider name -> Retry-After deadline
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._stopped = False
+
+    def watch(self, provider: BaseProvider, task_id: str,
+              on_poll: Callable | None = None) -> PollHandle:
+        handle = PollHandle(provider, task_id, on_poll)
+        with self._cond:
+            self._handles[id(handle)] = handle
+            self._ensure_started()
+            self._cond.notify()
+        return handle
+
+    def cancel(self, handle: PollHandle):
+        with self._cond:
+            self._handles.pop(id(handle), None)
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._handles.clear()
+            self._cond.notify()
+        if self._pool:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def _ensure_started(self):
+        if self._thread and self._thread.is_alive() and not self._stopped:
+            return
+        self._stopped = False
+        self._pool = ThreadPoolExecutor(max_workers=POLL_WORKERS, thread_name_prefix="poll")
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                now = time.monotonic()
+                due = []
+                next_due = None
+                for handle in self._handles.values():
+                    if handle._busy:
+                        continue
+                    ready_at = max(handle.next_poll,
+                                   self._blocked_until.get(handle.provider.name, 0))
+                    if ready_at <= now:
+                        due.append(handle)
+                    elif next_due is None or ready_at < next_due:
+                        next_due = ready_at
+                if not due:
+                    self._cond.wait(None if next_due is None else next_due - now)
+                    continue
+                for handle in due:
+                    handle._busy = True
+                pool = self._pool
+            for handle in due:
+                pool.submit(self._poll, handle)
+
+    def _poll(self, handle: PollHandle):
+        name = handle.provider.name
+        error = None
+        result = None
+        try:
+            result = handle.provider.check_status(handle.task_id)
+        except Exception as e:
+            error = e
+            if classify_error(e) == PERMANENT:
+                # e.g. unknown task or revoked key: polling again will not help.
+                # Marked permanent so the job is not resubmitted (and paid for
+                # twice) while it may still be rendering.
+                result = {"status": "failed", "error": str(e), "error_class": PERMANENT}
+
+        now = time.monotonic()
+        elapsed = now - handle.submitted_at
+        handle.polls += 1
+        status = (result or {}).get("status", "")
+
+        if status in ("completed", "failed"):
+            if status == "completed":
+                record_duration(name, elapsed)
+            with self._cond:
+                self._handles.pop(id(handle), None)
+            handle.result = result
+            handle._event.set()
+            return
+
+        if error is not None:
+            handle.errors += 1
+            wait = retry_after(error)
+            if wait is not None:
+                with self._cond:
+                    self._blocked_until[name] = max(self._blocked_until.get(name, 0), now + wait)
+            else:
+                wait = error_backoff(handle.errors)
+            handle.next_poll = now + wait
+        else:
+            handle.errors = 0
+            handle.next_poll = now + next_interval(name, elapsed)
+
+        if handle.on_poll:
+            try:
+                handle.on_poll(handle, error)
+            except Exception:
+                pass
+
+        with self._cond:
+            handle._busy = False
+            self._cond.notify()
@@ -1,5 +1,14 @@
+import re
 import json
-import openai
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from core.enhance_cache import EnhanceCache
+from core.retry import POLICIES, PERMANENT, TRANSIENT, classify_error, retry_after
+
+DEFAULT_CONCURRENCY = 4   # chunk requests in flight once the bible is established
 
 SYSTEM_PROMPT = """You are an expert film director and cinematographer specializing in wildlife/dinosaur documentaries.
 
@@ -22,6 +31,9 @@ Rules:
 
 4. Add transition_hint for each scene describing the ending state (pose, direction, lighting)
    so the next scene can start consistently.
+   Set hard_cut to true when a scene starts somewhere new (new location, new time of day,
+   unrelated subject) so it must NOT continue from the previous scene's ending; otherwise false.
+   Scenes marked "[CUT]" in the input are always hard cuts.
 
 5. If input is not English, translate naturally to English.
 
@@ -36,26 +48,32 @@ Output ONLY valid JSON (no markdown, no code fences):
       "id": 1,
       "original": "user's original text",
       "enhanced_prompt": "detailed English prompt under 800 chars",
-      "transition_hint": "ending state description"
+      "transition_hint": "ending state description",
+      "hard_cut": false
     }
   ]
 }"""
 
 
 def enhance_prompts(api_key: str, scenes: list[dict], style_prefix: str = "",
-                    model: str = "gpt-4o") -> dict:
+                    model: str = "gpt-4o", on_scene: Callable = None) -> dict:
     """
     Call ChatGPT to enhance scene prompts for consistency.
 
     Args:
         api_key: OpenAI API key
-        scenes: list of {"id": int, "prompt": str}
+        scenes: list of {"id": int, "prompt": str, "cut": bool (optional)}
         style_prefix: global style directive from user
         model: OpenAI model to use
+        on_scene: if given, the reply is streamed and on_scene(scene, header)
+            is called for each scene as soon as it is complete (header holds
+            the character_bible and style_guide written before the scenes)
 
     Returns:
         dict with character_bible, style_guide, scenes[]
     """
+    import openai   # imported here so the app starts without loading the SDK
+
     client = openai.OpenAI(api_key=api_key)
 
     user_content = ""
@@ -63,9 +81,10 @@ def enhance_prompts(api_key: str, scenes: list[dict], style_prefix: str = "",
         user_content += f"GLOBAL STYLE DIRECTIVE: {style_prefix}\n\n"
     user_content += "SCENES:\n"
     for scene in scenes:
-        user_content += f"Scene {scene['id']}: {scene['prompt']}\n"
+        cut = "[CUT] " if scene.get("cut") else ""
+        user_content += f"Scene {scene['id']}: {cut}{scene['prompt']}\n"
 
-    response = client.chat.completions.create(
+    request = dict(
         model=model,
         messages=[
             {"role": "system", "content": SYSTEM_PROMPT},
@@ -76,37 +95,318 @@ def enhance_prompts(api_key: str, scenes: list[dict], style_prefix: str = "",
         response_format={"type": "json_object"},
     )
 
-    result_text = response.choices[0].message.content
-    return json.loads(result_text)
+    if on_scene is None:
+        response = client.chat.completions.create(**request)
+        result_text = response.choices[0].message.content
+        return json.loads(result_text)
+
+    parser = SceneStream()
+    for chunk in client.chat.completions.create(stream=True, **request):
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            for scene in parser.feed(delta):
+                on_scene(scene, parser.header or {})
+    return json.loads(parser.text)
+
+
+class SceneStream:
+    """
+    Incremental parser for a streamed enhance reply.
+
+    feed() takes the next piece of text and returns the scene objects it
+    completed. header (character_bible, style_guide) is set once it has been
+    read; scenes are held back until then, so a reply that puts the header
+    after the "scenes" array releases them only when it is complete. text
+    is the whole reply so far.
+    """
+
+    _SCENES = re.compile(r'"scenes"\s*:\s*\[')
+    _HEADER = ("character_bible", "style_guide")
+
+    def __init__(self):
+        self.text = ""
+        self.header: dict | None = None
+        self._pos = -1          # scan position inside the scenes array, -1 until it starts
+        self._depth = 0         # object nesting inside the array
+        self._start = 0         # where the current scene object began
+        self._in_string = False
+        self._escape = False
+        self._closed = False
+        self._held: list[dict] = []
+
+    def feed(self, chunk: str) -> list[dict]:
+        searched = len(self.text)
+        self.text += chunk
+        if self._pos < 0:
+            match = self._SCENES.search(self.text, max(0, searched - 32))
+            if match is None:
+                return []
+            header = self._parse_header(self.text[:match.start()].rstrip().rstrip(",") + "}")
+            if header is not None and len(header) == len(self._HEADER):
+                self.header = header
+            self._pos = match.end()
+        self._held += self._scan()
+        if self.header is None and self._closed:
+            self.header = self._parse_header(self.text)   # (rest of the) header after the array
+        if self.header is None:
+            return []
+        found, self._held = self._held, []
+        return found
+
+    @classmethod
+    def _parse_header(cls, text: str) -> dict | None:
+        """The character_bible and style_guide a JSON object has, None if it does not parse."""
+        try:
+            reply = json.loads(text)
+        except ValueError:
+            return None
+        if not isinstance(reply, dict):
+            return None
+        return {k: reply[k] for k in cls._HEADER if k in reply}
+
+    def _scan(self) -> list[dict]:
+        found = []
+        text = self.text
+        i = self._pos
+        while i < len(text) and not self._closed:
+            c = text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+            elif c == '"':
+                self._in_string = True
+            elif c == "{":
+                if self._depth == 0:
+                    self._start = i
+                self._depth += 1
+            elif c == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        scene = json.loads(text[self._start:i + 1])
+                    except ValueError:
+                        scene = None
+                    if isinstance(scene, dict):
+                        found.append(scene)
+            elif c == "]" and self._depth == 0:
+                self._closed = True
+            i += 1
+        self._pos = i
+        return found
 
 
 def enhance_prompts_chunked(api_key: str, scenes: list[dict], style_prefix: str = "",
-                            model: str = "gpt-4o", chunk_size: int = 15) -> dict:
+                            model: str = "gpt-4o", chunk_size: int = 15,
+                            cache: EnhanceCache | None = None, previous: dict = None,
+                            max_concurrent: int = DEFAULT_CONCURRENCY,
+                            on_scene: Callable = None) -> dict:
     """
     For large scene lists (>15), split into chunks and process separately.
     First chunk establishes the character bible, subsequent chunks reuse it.
+
+    With a cache, scenes already enhanced under the same bible (same text,
+    style prefix and model) are taken from it instead of being sent again.
+    previous is an earlier result: if it was made with the same style prefix
+    and model and still shares scenes with this script (same prompt text and
+    cut, wherever they moved), its character bible, style guide and those
+    scenes are kept and only new or edited scenes are enhanced.
+
+    Chunks after the first only depend on its bible, so up to max_concurrent
+    of them run at once. Each chunk is retried on its own (rate limits,
+    timeouts) and cached as soon as it is done, so a failed run resumes
+    with the chunks that are still missing.
+
+    on_scene(scene, bible) streams the replies: it is called for each scene
+    as soon as it is known (cached ones first), from worker threads, and may
+    be called again for a scene whose chunk was retried.
     """
-    if len(scenes) <= chunk_size:
-        return enhance_prompts(api_key, scenes, style_prefix, model)
-
-    # Process first chunk to establish character bible
-    first_chunk = scenes[:chunk_size]
-    result = enhance_prompts(api_key, first_chunk, style_prefix, model)
-
-    character_bible = result.get("character_bible", "")
-    style_guide = result.get("style_guide", "")
-    all_scenes = list(result.get("scenes", []))
-
-    # Process remaining chunks with established bible
-    for i in range(chunk_size, len(scenes), chunk_size):
-        chunk = scenes[i:i + chunk_size]
-        extended_style = (
-            f"{style_prefix}\n\n"
-            f"ESTABLISHED CHARACTER BIBLE (must follow exactly):\n{character_bible}\n\n"
-            f"ESTABLISHED STYLE GUIDE (must follow exactly):\n{style_guide}"
-        )
-        chunk_result = enhance_prompts(api_key, chunk, extended_style, model)
-        all_scenes.extend(chunk_result.get("scenes", []))
-
-    result["scenes"] = all_scenes
-    return result
+    bible, enhanced = _pinned_bible(previous, scenes, style_prefix, model)
+    if bible is None:
+        # Process first chunk to establish character bible
+        bible, enhanced = _establish_bible(api_key, scenes[:chunk_size], style_prefix, model,
+                                           cache, on_scene)
+    elif on_scene:
+        for scene in enhanced.values():
+            on_scene(scene, bible)
+
+    keys = [_scene_key(model, style_prefix, bible, s) for s in scenes]
+    if cache is not None:
+        for scene, key in zip(scenes, keys):
+            if scene["id"] in enhanced:
+                continue
+            hit = cache.get(key)
+            if hit is not None:
+                enhanced[scene["id"]] = _for_input(hit, scene)
+                if on_scene:
+                    on_scene(enhanced[scene["id"]], bible)
+
+    # Process remaining (new or edited) scenes with established bible, in parallel
+    todo = [(s, k) for s, k in zip(scenes, keys) if s["id"] not in enhanced]
+    chunks = [todo[i:i + chunk_size] for i in range(0, len(todo), chunk_size)]
+    pinned_style = _pinned_style(style_prefix, bible)
+
+    # Later chunks echo the bible back; the established one is what counts
+    stream = (lambda scene, _: on_scene(scene, bible)) if on_scene else None
+
+    def run_chunk(chunk):
+        chunk_result = _enhance_with_retry(api_key, [s for s, _ in chunk], pinned_style, model,
+                                           stream)
+        return _store_scenes(chunk, chunk_result, cache)
+
+    if chunks:
+        workers = max(1, min(max_concurrent, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enhance") as pool:
+            # Results are merged in scene order below, whatever order chunks finish in
+            for future in [pool.submit(run_chunk, chunk) for chunk in chunks]:
+                enhanced.update(future.result())
+
+    return {
+        **bible,
+        "style_prefix": style_prefix,
+        "model": model,
+        "scenes": [enhanced[s["id"]] for s in scenes if s["id"] in enhanced],
+    }
+
+
+def _enhance_with_retry(api_key: str, scenes: list[dict], style_prefix: str,
+                        model: str, on_scene: Callable = None) -> dict:
+    """enhance_prompts, retried per core.retry policies (a truncated JSON reply is transient)."""
+    attempts: dict[str, int] = {}
+    while True:
+        try:
+            return enhance_prompts(api_key, scenes, style_prefix, model, on_scene)
+        except Exception as e:
+            error_class = TRANSIENT if isinstance(e, json.JSONDecodeError) else classify_error(e)
+            used = attempts.get(error_class, 0)
+            if error_class == PERMANENT or used >= POLICIES[error_class].max_attempts:
+                raise
+            attempts[error_class] = used + 1
+            time.sleep(POLICIES[error_class].delay(used, retry_after(e)))
+
+
+# ─── Enhancement cache ────────────────────────────────────────────
+
+def _scene_key(model: str, style_prefix: str, bible: dict, scene: dict) -> str:
+    """What a scene's enhancement depends on; bible is None for the chunk that establishes it."""
+    bible = bible or {}
+    blob = json.dumps([SYSTEM_PROMPT, model, style_prefix, bible.get("character_bible", ""),
+                       bible.get("style_guide", ""), scene["prompt"], bool(scene.get("cut"))],
+                      ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _pinned_style(style_prefix: str, bible: dict) -> str:
+    return (
+        f"{style_prefix}\n\n"
+        f"ESTABLISHED CHARACTER BIBLE (must follow exactly):\n{bible['character_bible']}\n\n"
+        f"ESTABLISHED STYLE GUIDE (must follow exactly):\n{bible['style_guide']}"
+    )
+
+
+def _pinned_bible(previous: dict | None, scenes: list[dict], style_prefix: str,
+                  model: str) -> tuple[dict | None, dict[int, dict]]:
+    """
+    The previous result's bible, if it still applies to this script, and its
+    enhanced scenes for the scenes that are unchanged (by new id).
+    """
+    if not previous or not previous.get("character_bible"):
+        return None, {}
+    if previous.get("style_prefix") != style_prefix or previous.get("model") != model:
+        return None, {}
+
+    by_id = {}
+    by_prompt: dict[str, list[dict]] = {}
+    for old in previous.get("scenes", []):
+        by_id.setdefault(old.get("id"), old)
+        by_prompt.setdefault(_source(old)[0], []).append(old)
+
+    def unchanged(old, scene):
+        prompt, cut = _source(old)
+        return prompt == scene["prompt"] and cut in (None, bool(scene.get("cut")))
+
+    reused = {}
+    for scene in scenes:
+        # Same place first, so duplicated prompts keep their own scene
+        old = by_id.get(scene["id"])
+        if old is None or not unchanged(old, scene):
+            old = next((o for o in by_prompt.get(scene["prompt"], []) if unchanged(o, scene)), None)
+        if old is not None:
+            reused[scene["id"]] = _for_input(old, scene)
+    # A script that shares no scenes with the previous one gets its own bible
+    if not reused:
+        return None, {}
+    return {"character_bible": previous["character_bible"],
+            "style_guide": previous.get("style_guide", "")}, reused
+
+
+def _source(scene: dict) -> tuple[str, bool | None]:
+    """Prompt text and cut an enhanced scene was made from (cut unknown in older results)."""
+    if "source_prompt" in scene:
+        return scene["source_prompt"], bool(scene.get("source_cut"))
+    return scene.get("original", ""), None
+
+
+def _for_input(enhanced: dict, scene: dict) -> dict:
+    """An enhanced scene filed under input scene, with the text and cut it was made from."""
+    return dict(enhanced, id=scene["id"], source_prompt=scene["prompt"],
+                source_cut=bool(scene.get("cut")))
+
+
+def _establish_bible(api_key: str, first_chunk: list[dict], style_prefix: str, model: str,
+                     cache: EnhanceCache | None,
+                     on_scene: Callable = None) -> tuple[dict, dict[int, dict]]:
+    """
+    Character bible and style guide from the first chunk (cached by its
+    scenes), and the chunk's enhanced scenes if it had to be sent.
+    """
+    chunk_key = hashlib.sha256("\n".join(
+        _scene_key(model, style_prefix, None, s) for s in first_chunk).encode()).hexdigest()
+    if cache is not None:
+        bible = cache.get(chunk_key)
+        if bible is not None:
+            return bible, {}
+
+    result = _enhance_with_retry(api_key, first_chunk, style_prefix, model, on_scene)
+    bible = {"character_bible": result.get("character_bible", ""),
+             "style_guide": result.get("style_guide", "")}
+    chunk = [(s, _scene_key(model, style_prefix, bible, s)) for s in first_chunk]
+    found = _store_scenes(chunk, result, cache)
+    if cache is not None:
+        cache.put({chunk_key: bible})
+    return bible, found
+
+
+def _store_scenes(chunk: list[tuple[dict, str]], result: dict,
+                  cache: EnhanceCache | None) -> dict[int, dict]:
+    """Enhanced scenes of one response by input scene id, written to the cache."""
+    returned = result.get("scenes", [])
+    by_id = {}
+    for scene in returned:
+        try:
+            by_id[int(scene.get("id"))] = scene
+        except (TypeError, ValueError):
+            continue
+    if not any(raw["id"] in by_id for raw, _ in chunk) and len(returned) == len(chunk):
+        by_id = {raw["id"]: scene for (raw, _), scene in zip(chunk, returned)}   # renumbered
+    found = {}
+    entries = {}
+    for raw, key in chunk:
+        scene = by_id.get(raw["id"])
+        if scene is not None:
+            found[raw["id"]] = _for_input(scene, raw)
+            entries[key] = scene
+    if cache is not None:
+        cache.put(entries)
+    return found
+
+
+def is_hard_cut(scene: dict) -> bool:
+    """True if an enhanced scene starts a new chain segment."""
+    value = scene.get("hard_cut", False)
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "yes", "1")
+    return bool(value)
@@ -0,0 +1,96 @@
+import json
+import random
+
+TRANSIENT = "transient"        # network errors, 5xx, timeouts: retry with backoff
+RATE_LIMITED = "rate_limited"  # 429 / quota: wait (Retry-After) and retry
+PERMANENT = "permanent"        # bad key, bad request, content policy: never retry
+
+_PERMANENT_HINTS = (
+    "policy", "safety", "moderation", "violat", "prohibited", "sensitive",
+    "inappropriate", "blocked", "not allowed", "invalid api key", "unauthorized",
+    "authentication", "permission denied", "invalid argument",
+)
+_RATE_LIMIT_HINTS = (
+    "rate limit", "ratelimit", "too many requests", "quota", "resource_exhausted",
+    "429", "concurrency limit", "throttl",
+)
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Exponential backoff with jitter; Retry-After is a lower bound."""
+        cap = min(self.max_delay, self.base_delay * 2 ** attempt)
+        delay = random.uniform(cap / 2, cap)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+POLICIES = {
+    TRANSIENT: RetryPolicy(max_attempts=2, base_delay=5, max_delay=60),
+    RATE_LIMITED: RetryPolicy(max_attempts=5, base_delay=15, max_delay=300),
+    PERMANENT: RetryPolicy(max_attempts=0, base_delay=0, max_delay=0),
+}
+
+
+def status_code(exc: Exception) -> int | None:
+    """HTTP status of a requests / httpx / google.genai / openai error, if any."""
+    response = getattr(exc, "response", None)
+    for obj in (response, exc):
+        for attr in ("status_code", "code"):
+            value = getattr(obj, attr, None)
+            if isinstance(value, int) and 100 <= value < 600:
+                return value
+    return None
+
+
+def retry_after(exc: Exception) -> float | None:
+    """Seconds from a Retry-After header on a failed HTTP call, if any."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_message(message: str) -> str:
+    """Classify a provider failure message (e.g. a failed task's error text)."""
+    text = (message or "").lower()
+    if any(h in text for h in _RATE_LIMIT_HINTS):
+        return RATE_LIMITED
+    if any(h in text for h in _PERMANENT_HINTS):
+        return PERMANENT
+    return TRANSIENT
+
+
+def classify_error(exc: Exception) -> str:
+    """Classify an exception raised by a provider call."""
+    code = status_code(exc)
+    if code is not None:
+        if code == 429:
+            return RATE_LIMITED
+        if code in (408, 409, 425) or code >= 500:
+            return TRANSIENT
+        if 400 <= code < 500:
+            # Some providers report quota exhaustion as 400/403
+            return RATE_LIMITED if classify_message(str(exc)) == RATE_LIMITED else PERMANENT
+    if isinstance(exc, json.JSONDecodeError) or "JSONDecodeError" in type(exc).__name__:
+        return TRANSIENT  # garbled or truncated response body (a ValueError subclass)
+    if isinstance(exc, (FileNotFoundError, IsADirectoryError, PermissionError,
+                        ValueError, KeyError, TypeError)):
+        return PERMANENT  # local problem, resubmitting will not help
+    if isinstance(exc, (ConnectionError, TimeoutError, OSError)):
+        return TRANSIENT
+    name = type(exc).__name__
+    if "Timeout" in name or "Connect" in name or "Transport" in name:
+        return TRANSIENT
+    return classify_message(str(exc))
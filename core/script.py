@@ -0,0 +1,264 @@
+import csv
+import os
+import re
+from bisect import bisect_right
+
+# Scene header pattern: "Scene 1 – Title ...", "Scene 2 - Title ...", "Canh 3: ..."
+_SCENE_PATTERN = re.compile(
+    r'^(?:Scene|Canh)\s+\d+\s*[–\-:.]',
+    re.IGNORECASE
+)
+
+# Hard cut marker on its own line: "---", "===", "CUT" or "[CUT]".
+# The next scene starts a new chain segment (no frame chaining across the cut).
+_CUT_PATTERN = re.compile(
+    r'^(?:-{3,}|={3,}|\[?CUT\]?)$',
+    re.IGNORECASE
+)
+
+
+def parse_scene_text(text: str) -> list[str]:
+    """
+    Parse scene text that may be multi-line per scene.
+
+    Supports 2 formats:
+      1. "Scene X – Title description..." (multi-line, separated by Scene headers)
+      2. Simple one-line-per-scene (no Scene headers)
+
+    Returns list of prompt strings (without the "Scene X – Title" prefix).
+    """
+    return [prompt for prompt, _ in parse_scene_blocks(text)]
+
+
+def parse_scene_blocks(text: str) -> list[tuple[str, bool]]:
+    """
+    Same as parse_scene_text, but also reports hard cuts.
+
+    Returns list of (prompt, cut_before) where cut_before is True when a cut
+    marker line appears between the previous scene and this one.
+    """
+    text = text.strip()
+    if not text:
+        return []
+
+    lines = text.split("\n")
+
+    # Check if text contains Scene headers
+    has_scene_headers = any(_SCENE_PATTERN.match(l.strip()) for l in lines if l.strip())
+
+    if has_scene_headers:
+        # Multi-line mode: group lines between Scene headers
+        scenes = []
+        current_lines = []
+        current_cut = False
+        pending_cut = False
+
+        for line in lines:
+            stripped = line.strip()
+            if not stripped:
+                continue
+
+            if _CUT_PATTERN.match(stripped):
+                pending_cut = True
+                continue
+
+            if _SCENE_PATTERN.match(stripped):
+                # Save previous scene
+                if current_lines:
+                    scenes.append((" ".join(current_lines), current_cut))
+                # Start new scene - remove "Scene X – Title" prefix
+                cleaned = _strip_header(stripped)
+                current_lines = [cleaned] if cleaned else []
+                current_cut = pending_cut
+                pending_cut = False
+            else:
+                # Continuation line of current scene
+                current_lines.append(stripped)
+
+        # Don't forget the last scene
+        if current_lines:
+            scenes.append((" ".join(current_lines), current_cut))
+
+        return _drop_leading_cut(scenes)
+
+    else:
+        # Simple mode: each non-empty line is one scene
+        scenes = []
+        pending_cut = False
+        for l in lines:
+            stripped = l.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            if _CUT_PATTERN.match(stripped):
+                pending_cut = True
+                continue
+            scenes.append((stripped, pending_cut))
+            pending_cut = False
+        return _drop_leading_cut(scenes)
+
+
+def _strip_header(line: str) -> str:
+    """"Scene 3 – Title text" -> "Title text"."""
+    for sep in ["–", "-", ":"]:
+        if sep in line:
+            parts = line.split(sep, 1)
+            if any(kw in parts[0].lower() for kw in ["scene", "canh"]):
+                return parts[1].strip()
+    return line
+
+
+def _drop_leading_cut(scenes: list[tuple[str, bool]]) -> list[tuple[str, bool]]:
+    # The first scene always starts a segment, a cut before it means nothing
+    if scenes and scenes[0][1]:
+        scenes[0] = (scenes[0][0], False)
+    return scenes
+
+
+# ─── Incremental parsing ─────────────────────────────────────────
+
+# Line kinds
+_BLANK, _CUT, _HEADER, _COMMENT, _TEXT = range(5)
+
+
+def _classify(line: str) -> tuple[int, str]:
+    stripped = line.strip()
+    if not stripped:
+        return _BLANK, ""
+    if _CUT_PATTERN.match(stripped):
+        return _CUT, ""
+    if _SCENE_PATTERN.match(stripped):
+        return _HEADER, _strip_header(stripped)
+    if stripped.startswith("#"):
+        return _COMMENT, stripped
+    return _TEXT, stripped
+
+
+class SceneParser:
+    """
+    parse_scene_blocks for text that is edited a little at a time.
+
+    Lines are classified once and grouped into segments: a scene header (or,
+    without headers, a scene line) starts a segment that runs to the next
+    one, with the lines before the first as a preamble. update() diffs the
+    new text against the previous lines and re-scans only the segments that
+    touch the changed lines; the rest are kept with shifted offsets. The
+    result always equals parse_scene_blocks(text).
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._lines: list[str] = [""]
+        self._kinds: list[tuple[int, str]] = [(_BLANK, "")]
+        self._headers = 0                  # header lines; > 0 switches to header mode
+        self._starts: list[int] = [0]      # first line of each segment, [0] = preamble
+        self._segments: list[tuple[str, bool]] = [("", False)]   # (prompt, has cut line)
+        self.scenes: list[tuple[str, bool]] = []
+
+    def update(self, text: str) -> list[tuple[str, bool]]:
+        """Parse text, reusing everything outside the edited lines."""
+        if text == self._text:
+            return self.scenes
+        old, new = self._lines, text.split("\n")
+
+        # Changed region: old[p:old_end] was replaced by new[p:new_end]
+        n = min(len(old), len(new))
+        p = 0
+        while p < n and old[p] == new[p]:
+            p += 1
+        s = 0
+        while s < n - p and old[-1 - s] == new[-1 - s]:
+            s += 1
+        old_end, new_end = len(old) - s, len(new) - s
+
+        kinds = [_classify(line) for line in new[p:new_end]]
+        was_header_mode = self._headers > 0
+        self._headers += (sum(1 for k, _ in kinds if k == _HEADER)
+                          - sum(1 for k, _ in self._kinds[p:old_end] if k == _HEADER))
+        self._kinds[p:old_end] = kinds
+        self._lines, self._text = new, text
+
+        if (self._headers > 0) != was_header_mode:
+            # Boundaries mean something else now, regroup everything
+            self._starts, self._segments = self._scan(0, len(new), True)
+        else:
+            self._rescan(p, old_end, len(old), new_end - old_end)
+        self.scenes = self._assemble()
+        return self.scenes
+
+    def _is_boundary(self, kind: int) -> bool:
+        return kind == _HEADER if self._headers else kind == _TEXT
+
+    def _rescan(self, p: int, old_end: int, old_len: int, delta: int):
+        starts = self._starts
+        # From the segment holding the line before the edit (it may merge
+        # with the next one) to the one holding the last replaced line
+        lo = max(0, bisect_right(starts, p - 1) - 1)
+        hi = max(lo, bisect_right(starts, max(old_end - 1, p - 1)) - 1)
+        end = starts[hi + 1] if hi + 1 < len(starts) else old_len
+
+        new_starts, new_segments = self._scan(starts[lo], end + delta, lo == 0)
+        self._starts = starts[:lo] + new_starts + [x + delta for x in starts[hi + 1:]]
+        self._segments = self._segments[:lo] + new_segments + self._segments[hi + 1:]
+
+    def _scan(self, lo: int, hi: int, preamble: bool) -> tuple[list[int], list[tuple[str, bool]]]:
+        """Segments for lines lo..hi, which start at a boundary unless preamble."""
+        header_mode = self._headers > 0
+        starts, segments = [], []
+        parts, cut = [], False
+
+        def close():
+            segments.append((" ".join(parts), cut))
+
+        if preamble:
+            starts.append(lo)
+        for i in range(lo, hi):
+            kind, value = self._kinds[i]
+            if self._is_boundary(kind):
+                if starts:
+                    close()
+                starts.append(i)
+                parts, cut = ([value] if value else []), False
+            elif kind == _CUT:
+                cut = True
+            elif kind == _TEXT or (kind == _COMMENT and header_mode):
+                parts.append(value)
+        if starts:
+            close()
+        return starts, segments
+
+    def _assemble(self) -> list[tuple[str, bool]]:
+        # A scene is cut from the previous one when a cut marker appears in
+        # the segment before it, even if that segment had no text
+        scenes = []
+        prev_cut = False
+        for prompt, cut in self._segments:
+            if prompt:
+                scenes.append((prompt, prev_cut))
+            prev_cut = cut
+        return _drop_leading_cut(scenes)
+
+
+def load_script(path: str) -> list[tuple[str, bool]]:
+    """
+    Read scenes from a TXT or CSV file.
+
+    CSV files need a "prompt" column and may have a "cut" column (1/true/yes/x).
+    Returns list of (prompt, cut_before) like parse_scene_blocks.
+    """
+    if os.path.splitext(path)[1].lower() == ".csv":
+        scenes = []
+        with open(path, "r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                prompt = (row.get("prompt") or "").strip()
+                cut = (row.get("cut") or "").strip().lower() in ("1", "true", "yes", "x")
+                if prompt:
+                    scenes.append((prompt, cut and bool(scenes)))
+        return scenes
+
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_scene_blocks(f.read())
+
+
+def to_scene_dicts(blocks: list[tuple[str, bool]]) -> list[dict]:
+    """[(prompt, cut)] -> [{"id", "prompt", "cut"}], numbered from 1."""
+    return [{"id": i + 1, "prompt": p, "cut": cut} for i, (p, cut) in enumerate(blocks)]
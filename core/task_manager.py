@@ -1,33 +1,52 @@
 import os
-import time
+import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
 from providers.base import BaseProvider
+from providers.assets import content_hash
 from core.frame_utils import extract_last_frame
-
-POLL_INTERVAL = 10  # seconds
-MAX_RETRIES = 1
+from core.poller import StatusPoller, PollHandle
+from core.journal import RunJournal, journal_namespace, scene_key
+from core.events import SceneEvent, SceneEventQueue
+from core.video_cache import VideoCache, cache_key
+from core.retry import POLICIES, PERMANENT, classify_error, classify_message, retry_after
 
 
 class SceneTask:
-    def __init__(self, scene_id: int, prompt: str, enhanced_prompt: str = ""):
+    def __init__(self, scene_id: int, prompt: str, enhanced_prompt: str = "",
+                 cut_before: bool = False, ready: bool = True):
         self.scene_id = scene_id
         self.prompt = prompt
         self.enhanced_prompt = enhanced_prompt or prompt
+        self.cut_before = cut_before  # Hard cut: starts a new chain segment
         self.status = "pending"  # pending, submitting, processing, downloading, completed, failed
         self.task_id = ""
         self.video_url = ""
         self.video_path = ""
+        self.last_frame = ""  # Extracted last frame, used to chain the next scene
         self.error = ""
         self.retries = 0
+        self.attempts: dict[str, int] = {}  # error class -> retries used
+        self.ready = threading.Event()  # Set once enhanced_prompt is final (streamed enhancement)
+        if ready:
+            self.ready.set()
+
+    def set_enhanced(self, enhanced_prompt: str, cut_before: bool = False):
+        """Fill in a streamed prompt (the original prompt if empty) and mark the scene ready."""
+        self.enhanced_prompt = enhanced_prompt or self.prompt
+        self.cut_before = self.cut_before or cut_before
+        self.ready.set()
 
 
 class TaskManager:
     def __init__(self, provider: BaseProvider, output_folder: str,
                  frame_chaining: bool = True, seed: int = 0,
                  duration: int = 8, resolution: str = "720p",
-                 subject_refs: list[str] = None, bg_refs: list[str] = None):
+                 subject_refs: list[str] = None, bg_refs: list[str] = None,
+                 max_concurrent: int = 1, resume: bool = False,
+                 cache: VideoCache | None = None):
         self.provider = provider
         self.output_folder = output_folder
         self.frame_chaining = frame_chaining
@@ -36,26 +55,118 @@ class TaskManager:
         self.resolution = resolution
         self.subject_refs = subject_refs or []  # Paths to subject/character reference images
         self.bg_refs = bg_refs or []            # Paths to background/scene reference images
+        self.max_concurrent = max(1, max_concurrent)  # Segments in flight at once
+        self.resume = resume  # Re-attach to jobs recorded in the run journal
+        self.cache = cache    # Reuse videos already generated with identical inputs
         self.scenes: list[SceneTask] = []
+        self.journal = RunJournal(output_folder)
+        self._unrestored: dict[int, dict] = {}  # Journal entries of scenes still being enhanced
+        self.poller = StatusPoller()
+        self.events = SceneEventQueue()  # Scene state changes, drained by the UI
         self._running = False
+        self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
+        self._claims: dict[str, threading.Event] = {}  # cache key -> set when generated
+        self._claims_lock = threading.Lock()
         self._on_update: Callable | None = None
         self._on_log: Callable | None = None
         self._on_complete: Callable | None = None
 
     def set_callbacks(self, on_update: Callable = None, on_log: Callable = None,
                       on_complete: Callable = None):
+        """
+        on_update(event: SceneEvent) is called from worker threads on every
+        scene state change. UIs should drain self.events on a timer instead.
+        on_log(msg, level) gets a logging level (DEBUG for per-poll chatter).
+        """
         self._on_update = on_update
         self._on_log = on_log
         self._on_complete = on_complete
 
-    def _log(self, msg: str):
+    def _log(self, msg: str, level: int = logging.INFO):
         if self._on_log:
-            self._on_log(msg)
+            self._on_log(msg, level)
+
+    def _update(self, scene: SceneTask):
+        """Journal a scene state change and publish it as an event."""
+        self._record(scene)
+        self._emit(scene)
 
-    def _update(self):
+    def _emit(self, scene: SceneTask):
+        event = SceneEvent.of(scene)
+        self.events.push(event)
         if self._on_update:
-            self._on_update()
+            self._on_update(event)
+
+    def scene_key(self, scene: SceneTask) -> str:
+        return scene_key(self.provider.name, scene.enhanced_prompt)
+
+    def _record(self, scene: SceneTask):
+        self._write_journal({
+            "scene_id": scene.scene_id,
+            "key": self.scene_key(scene),
+            "provider": self.provider.name,
+            "task_ns": self.provider.task_namespace(),
+            "status": scene.status,
+            "task_id": scene.task_id,
+            "video_url": scene.video_url,
+            "video_path": scene.video_path,
+            "last_frame": scene.last_frame,
+            "error": scene.error,
+        })
+
+    def _write_journal(self, entry: dict):
+        try:
+            self.journal.record(entry)
+        except OSError as e:
+            self._log(f"Scene {entry['scene_id']}: Journal write failed: {e}", logging.WARNING)
+
+    def _restore_from_journal(self):
+        """
+        Apply journal state to scenes whose prompt and provider are unchanged.
+        Scenes still waiting for a streamed prompt are restored once it is
+        final (see _restore_streamed), when their key is known.
+        """
+        state = self.journal.load()
+        self._unrestored = {s.scene_id: state[s.scene_id] for s in self.scenes
+                            if not s.ready.is_set() and s.scene_id in state}
+        done = attached = 0
+        for scene in self.scenes:
+            if scene.ready.is_set():
+                restored = self._restore_scene(scene, state.get(scene.scene_id))
+                done += restored == "completed"
+                attached += restored == "processing"
+        self._log(f"Resume: {done} scene(s) already done, {attached} in-flight job(s) re-attached"
+                  + (f", {len(self._unrestored)} checked once enhanced" if self._unrestored else ""))
+        for scene in self.scenes:
+            if scene.status != "pending":
+                self._emit(scene)
+
+    def _restore_streamed(self, scene: SceneTask):
+        """Restore a scene whose streamed prompt just became final, if the journal has it."""
+        entry = self._unrestored.pop(scene.scene_id, None)
+        if scene.status == "pending" and self._restore_scene(scene, entry):
+            self._log(f"Scene {scene.scene_id}: Resumed ({scene.status}) from the run journal")
+            self._emit(scene)
+
+    def _restore_scene(self, scene: SceneTask, entry: dict | None) -> str | None:
+        """Apply one journal entry if it matches the scene; the restored status, else None."""
+        if not entry or entry.get("key") != self.scene_key(scene):
+            return None
+        status = entry.get("status")
+        if status == "completed" and os.path.isfile(entry.get("video_path", "")):
+            scene.status = "completed"
+            scene.video_path = entry["video_path"]
+            scene.video_url = entry.get("video_url", "")
+            scene.last_frame = entry.get("last_frame", "")
+        elif (entry.get("task_id") and status in ("processing", "downloading")
+              and journal_namespace(entry) == self.provider.task_namespace()):
+            # Submitted in a previous session: poll it again instead of resubmitting
+            scene.status = "processing"
+            scene.task_id = entry["task_id"]
+        else:
+            return None
+        return scene.status
 
     def load_scenes(self, scenes: list[SceneTask]):
         self.scenes = scenes
@@ -68,140 +179,356 @@ class TaskManager:
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
 
     def stop(self):
         self._running = False
+        self._stop_event.set()
 
-    def _run(self):
-        os.makedirs(self.output_folder, exist_ok=True)
-        last_frame_path = None
+    @property
+    def is_running(self) -> bool:
+        return self._running
 
+    def get_segments(self) -> list[list[SceneTask]]:
+        """
+        Split scenes into chain segments.
+
+        With frame chaining each segment runs serially (last frame -> next scene)
+        and a new segment starts at every hard cut. Without chaining every scene
+        is its own segment.
+        """
+        if not self.frame_chaining:
+            return [[s] for s in self.scenes]
+        segments: list[list[SceneTask]] = []
         for scene in self.scenes:
-            if not self._running:
-                self._log("Generation stopped by user.")
-                break
+            if not segments or scene.cut_before:
+                segments.append([])
+            segments[-1].append(scene)
+        return segments
 
-            if scene.status == "completed":
-                # Resume: skip completed, but get last frame if needed
-                video_path = scene.video_path
-                if self.frame_chaining and os.path.isfile(video_path):
-                    try:
-                        last_frame_path = extract_last_frame(video_path)
-                    except Exception:
-                        last_frame_path = None
-                continue
+    def _run(self):
+        pending = self._prepare_run()
+        if pending:
+            workers = min(self.max_concurrent, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="segment") as pool:
+                for segment in pending:
+                    pool.submit(self._run_segment, segment)
+        self._finish_run()
 
-            self._process_scene(scene, last_frame_path)
+    def _prepare_run(self) -> list[list[SceneTask]]:
+        """Restore or reset the journal and return the segments that still have work."""
+        os.makedirs(self.output_folder, exist_ok=True)
+        if self.resume:
+            self._restore_from_journal()
+        else:
+            self.journal.reset()
 
-            if scene.status == "completed" and self.frame_chaining:
-                try:
-                    last_frame_path = extract_last_frame(scene.video_path)
-                    self._log(f"Scene {scene.scene_id}: Extracted last frame for chaining")
-                except Exception as e:
-                    self._log(f"Scene {scene.scene_id}: Frame extraction failed: {e}")
-                    last_frame_path = None
+        segments = self.get_segments()
+        pending = [seg for seg in segments if any(s.status != "completed" for s in seg)]
+        if pending:
+            workers = min(self.max_concurrent, len(pending))
+            if self.frame_chaining:
+                self._log(f"Running {len(segments)} chain segment(s), {workers} in parallel")
+            else:
+                self._log(f"Running {len(pending)} scenes, {workers} in parallel")
+        return pending
 
+    def _finish_run(self):
+        self.poller.stop()
+        if not self._running:
+            self._log("Generation stopped by user.")
         self._running = False
         if self._on_complete:
             self._on_complete()
 
-    def _process_scene(self, scene: SceneTask, first_frame_path: str = None):
-        prompt = scene.enhanced_prompt
-        save_path = os.path.join(self.output_folder, f"{scene.scene_id}.mp4")
+    def fail_unready(self, error: str):
+        """Fail scenes still waiting for a streamed prompt (enhancement failed)."""
+        for scene in self.scenes:
+            if not scene.ready.is_set():
+                scene.status = "failed"
+                scene.error = error
+                scene.ready.set()
+                self._update(scene)
+
+    def _wait_ready(self, scene: SceneTask) -> bool:
+        """Block until the scene's prompt is final. False if the run was stopped."""
+        while self._running and not scene.ready.wait(1.0):
+            pass
+        return self._running
 
-        # Determine which image to use as reference
-        ref_image = None
-        ref_mode = "text-to-video"
+    def _fail_segment(self, segment: list[SceneTask], error: Exception):
+        for scene in segment:
+            if scene.status not in ("completed", "failed"):
+                scene.status = "failed"
+                scene.error = str(error)
+        self._log(f"Scene {segment[0].scene_id}+: Segment FAILED - {error}", logging.ERROR)
+        for scene in segment:
+            self._update(scene)
+
+    def _run_segment(self, segment: list[SceneTask]):
+        try:
+            self._run_chain(segment)
+        except Exception as e:
+            self._fail_segment(segment, e)
+
+    def _run_chain(self, scenes: list[SceneTask]):
+        """Run scenes one by one, feeding each last frame into the next scene."""
+        last_frame_path = None
+        prev_done = None   # last completed scene whose frame has not been extracted yet
+
+        for scene in scenes:
+            if not self._wait_ready(scene) or scene.status == "failed":
+                break   # stopped, or enhancement failed (later scenes have no prompt either)
+            self._restore_streamed(scene)
+            if scene.cut_before:
+                # A hard cut ChatGPT reported after the segments were planned
+                last_frame_path = prev_done = None
+
+            if scene.status != "completed":
+                # Only the scene about to run needs a frame: on resume, runs
+                # of finished scenes are skipped without decoding anything
+                if prev_done is not None:
+                    last_frame_path = self._chain_frame(prev_done)
+                    prev_done = None
+                self._process_scene(scene, last_frame_path)
+
+            if scene.status == "completed" and self.frame_chaining:
+                prev_done = scene
+
+    def _chain_frame(self, scene: SceneTask) -> str | None:
+        """Last frame of a completed scene, extracted on first use."""
+        if os.path.isfile(scene.last_frame):
+            return scene.last_frame
+        try:
+            scene.last_frame = extract_last_frame(scene.video_path)
+            self._record(scene)
+            self._log(f"Scene {scene.scene_id}: Extracted last frame for chaining")
+            return scene.last_frame
+        except Exception as e:
+            self._log(f"Scene {scene.scene_id}: Frame extraction failed: {e}", logging.WARNING)
+            return None
 
-        if first_frame_path and self.frame_chaining and self.provider.supports_image_to_video:
+    def _pick_reference(self, first_frame_path: str = None) -> tuple[str | None, str]:
+        """Which image to use as reference, and a label for the log."""
+        if not self.provider.supports_image_to_video:
+            return None, "text-to-video"
+        if first_frame_path and self.frame_chaining:
             # Priority 1: Frame chaining (last frame of previous scene)
-            ref_image = first_frame_path
-            ref_mode = "image-to-video, frame chaining"
-        elif self.subject_refs and self.provider.supports_image_to_video:
+            return first_frame_path, "image-to-video, frame chaining"
+        if self.subject_refs:
             # Priority 2: Subject reference image (for first scene or when no chaining)
-            ref_image = self.subject_refs[0]
-            ref_mode = "image-to-video, subject reference"
-        elif self.bg_refs and self.provider.supports_image_to_video:
+            return self.subject_refs[0], "image-to-video, subject reference"
+        if self.bg_refs:
             # Priority 3: Background reference image
-            ref_image = self.bg_refs[0]
-            ref_mode = "image-to-video, background reference"
+            return self.bg_refs[0], "image-to-video, background reference"
+        return None, "text-to-video"
+
+    def _process_scene(self, scene: SceneTask, first_frame_path: str = None):
+        save_path = os.path.join(self.output_folder, f"{scene.scene_id}.mp4")
+        ref_image, ref_mode = self._pick_reference(first_frame_path)
+        key = self._cache_key(scene, ref_image)
+
+        if scene.status == "processing" and scene.task_id:
+            # Resume: job was submitted in a previous session
+            self._log(f"Scene {scene.scene_id}: Re-attaching to task {scene.task_id[:20]}...")
+            self._generate(scene, ref_image, ref_mode, save_path, key)
+        elif not self._reuse_cached(scene, key, save_path):
+            try:
+                if self._submit(scene, ref_image, ref_mode):
+                    self._generate(scene, ref_image, ref_mode, save_path, key)
+            finally:
+                self._release(key)
+
+    def _generate(self, scene: SceneTask, ref_image: str | None, ref_mode: str,
+                  save_path: str, key: str | None):
+        """Wait for the submitted job (resubmitting failed ones), then download and cache it."""
+        while True:
+            result = self._await_result(scene)
+            if result is None:
+                return  # stopped
+            if result.get("status") == "completed":
+                scene.video_url = result.get("video_url", "")
+                self._log(f"Scene {scene.scene_id}: Generation complete! Downloading...")
+                break
 
-        # Submit
-        scene.status = "submitting"
-        self._update()
-        try:
-            if ref_image:
-                self._log(f"Scene {scene.scene_id}: Submitting ({ref_mode})...")
-                scene.task_id = self.provider.submit_image_to_video(
-                    prompt, ref_image, self.duration, self.resolution, self.seed
-                )
-            else:
-                self._log(f"Scene {scene.scene_id}: Submitting (text-to-video)...")
-                scene.task_id = self.provider.submit_text_to_video(
-                    prompt, self.duration, self.resolution, self.seed
-                )
-        except Exception as e:
             scene.status = "failed"
-            scene.error = str(e)
-            self._log(f"Scene {scene.scene_id}: Submit FAILED - {e}")
-            self._update()
-            if scene.retries < MAX_RETRIES:
-                scene.retries += 1
-                self._log(f"Scene {scene.scene_id}: Retrying ({scene.retries}/{MAX_RETRIES})...")
-                time.sleep(5)
-                self._process_scene(scene, first_frame_path)
-            return
+            scene.error = result.get("error", "Unknown error")
+            self._log(f"Scene {scene.scene_id}: FAILED - {scene.error}", logging.ERROR)
+            self._update(scene)
+            # A failed poll keeps its own class; only provider failures are read from the text
+            error_class = result.get("error_class") or classify_message(scene.error)
+            if not self._retry(scene, error_class):
+                return
+            if not self._submit(scene, ref_image, ref_mode):
+                return
+
+        if scene.video_url:
+            self._download(scene, save_path)
+            self._store_cached(scene, key)
+
+    # ─── Generation cache ─────────────────────────────────────────
+
+    def _cache_key(self, scene: SceneTask, ref_image: str | None) -> str | None:
+        """Cache key for what would be sent for the scene, or None if it is not cacheable."""
+        if self.cache is None:
+            return None
+        try:
+            identity = self.provider.cache_identity()
+            if identity is None:
+                return None
+            identity.update(prompt=scene.enhanced_prompt, seed=self.seed,
+                            duration=self.duration, resolution=self.resolution,
+                            image=content_hash(ref_image) if ref_image else "")
+        except OSError:
+            return None
+        return cache_key(identity)
+
+    def _claim(self, key: str) -> threading.Event | None:
+        """None if the caller now generates key; otherwise the event set once it is generated."""
+        with self._claims_lock:
+            event = self._claims.get(key)
+            if event is None:
+                self._claims[key] = threading.Event()
+            return event
+
+    def _release(self, key: str | None):
+        with self._claims_lock:
+            event = self._claims.pop(key, None)
+        if event is not None:
+            event.set()
 
-        # Poll status
-        scene.status = "processing"
-        self._update()
-        self._log(f"Scene {scene.scene_id}: Processing (task_id: {scene.task_id[:20]}...)")
+    def _fetch_cached(self, scene: SceneTask, key: str, save_path: str) -> bool:
+        if not self.cache.fetch(key, save_path):
+            return False
+        scene.video_path = save_path
+        scene.status = "completed"
+        scene.error = ""
+        self._log(f"Scene {scene.scene_id}: Reused cached video -> {save_path}")
+        self._update(scene)
+        return True
 
-        poll_count = 0
+    def _reuse_cached(self, scene: SceneTask, key: str | None, save_path: str) -> bool:
+        """
+        True if the scene needs no generation: its video was in the cache, or
+        the run was stopped while waiting for an identical scene. Otherwise the
+        caller holds the claim on key and must _release it.
+        """
+        if key is None:
+            return False
+        while True:
+            if self._fetch_cached(scene, key, save_path):
+                return True
+            event = self._claim(key)
+            if event is None:
+                return False
+            self._log(f"Scene {scene.scene_id}: Identical to a scene being generated, waiting...")
+            while self._running and not event.wait(1.0):
+                pass
+            if not self._running:
+                return True
+
+    def _store_cached(self, scene: SceneTask, key: str | None):
+        if key is None or scene.status != "completed":
+            return
+        try:
+            self.cache.store(key, scene.video_path)
+        except OSError as e:
+            self._log(f"Scene {scene.scene_id}: Cache write failed: {e}", logging.WARNING)
+
+    def _submit(self, scene: SceneTask, ref_image: str | None, ref_mode: str) -> bool:
+        """Submit the scene, retrying per error class. Returns True once a task_id is held."""
+        prompt = scene.enhanced_prompt
         while self._running:
-            time.sleep(POLL_INTERVAL)
-            poll_count += 1
+            scene.status = "submitting"
+            self._update(scene)
             try:
-                result = self.provider.check_status(scene.task_id)
+                if ref_image:
+                    self._log(f"Scene {scene.scene_id}: Submitting ({ref_mode})...")
+                    scene.task_id = self.provider.submit_image_to_video(
+                        prompt, ref_image, self.duration, self.resolution, self.seed
+                    )
+                else:
+                    self._log(f"Scene {scene.scene_id}: Submitting (text-to-video)...")
+                    scene.task_id = self.provider.submit_text_to_video(
+                        prompt, self.duration, self.resolution, self.seed
+                    )
             except Exception as e:
-                self._log(f"Scene {scene.scene_id}: Poll error: {e}")
-                continue
+                scene.status = "failed"
+                scene.error = str(e)
+                self._log(f"Scene {scene.scene_id}: Submit FAILED - {e}", logging.ERROR)
+                self._update(scene)
+                if self._retry(scene, classify_error(e), retry_after(e)):
+                    continue
+                return False
 
-            status = result.get("status", "")
-            if status == "completed":
-                scene.video_url = result.get("video_url", "")
-                self._log(f"Scene {scene.scene_id}: Generation complete! Downloading...")
+            scene.status = "processing"
+            self._update(scene)
+            self._log(f"Scene {scene.scene_id}: Processing (task_id: {scene.task_id[:20]}...)")
+            return True
+        return False
+
+    def _await_result(self, scene: SceneTask) -> dict | None:
+        """Block until the poller reports a final status. None if the run was stopped."""
+        handle = self.poller.watch(self.provider, scene.task_id,
+                                   on_poll=lambda h, err: self._on_poll(scene, h, err))
+        result = None
+        while self._running and result is None:
+            result = handle.wait(timeout=1.0)
+        if result is None:
+            self.poller.cancel(handle)
+        return result
+
+    def _download(self, scene: SceneTask, save_path: str):
+        while True:
+            scene.status = "downloading"
+            self._update(scene)
+            try:
+                self.provider.download_video(scene.video_url, save_path)
+                scene.video_path = save_path
+                scene.status = "completed"
+                scene.error = ""
+                self._log(f"Scene {scene.scene_id}: Downloaded -> {save_path}")
                 break
-            elif status == "failed":
+            except Exception as e:
                 scene.status = "failed"
-                scene.error = result.get("error", "Unknown error")
-                self._log(f"Scene {scene.scene_id}: FAILED - {scene.error}")
-                self._update()
-                if scene.retries < MAX_RETRIES:
-                    scene.retries += 1
-                    self._log(f"Scene {scene.scene_id}: Retrying ({scene.retries}/{MAX_RETRIES})...")
-                    time.sleep(5)
-                    self._process_scene(scene, first_frame_path)
-                return
-            else:
-                self._log(f"Scene {scene.scene_id}: Still processing... (poll #{poll_count})")
+                scene.error = str(e)
+                self._log(f"Scene {scene.scene_id}: Download FAILED - {e}", logging.ERROR)
+                if not self._retry(scene, classify_error(e), retry_after(e)):
+                    break
+        self._update(scene)
 
-        if not scene.video_url:
-            return
+    def _retry(self, scene: SceneTask, error_class: str, wait_hint: float | None = None) -> bool:
+        """Sleep the backoff delay and return True if the failure should be retried."""
+        delay = self._retry_delay(scene, error_class, wait_hint)
+        if delay is None:
+            return False
+        self._stop_event.wait(delay)
+        return self._running
 
-        # Download
-        scene.status = "downloading"
-        self._update()
-        try:
-            self.provider.download_video(scene.video_url, save_path)
-            scene.video_path = save_path
-            scene.status = "completed"
-            self._log(f"Scene {scene.scene_id}: Downloaded -> {save_path}")
-        except Exception as e:
-            scene.status = "failed"
-            scene.error = str(e)
-            self._log(f"Scene {scene.scene_id}: Download FAILED - {e}")
+    def _retry_delay(self, scene: SceneTask, error_class: str,
+                     wait_hint: float | None = None) -> float | None:
+        """
+        Backoff delay before retrying a failure of the given class, or None if the
+        scene should not be retried. Permanent errors are never retried.
+        """
+        policy = POLICIES[error_class]
+        used = scene.attempts.get(error_class, 0)
+        if error_class == PERMANENT or used >= policy.max_attempts:
+            if error_class == PERMANENT:
+                self._log(f"Scene {scene.scene_id}: Permanent error, not retrying", logging.WARNING)
+            return None
+
+        scene.attempts[error_class] = used + 1
+        scene.retries += 1
+        delay = policy.delay(used, wait_hint)
+        self._log(f"Scene {scene.scene_id}: Retrying in {delay:.0f}s "
+                  f"({error_class} {used + 1}/{policy.max_attempts})...", logging.WARNING)
+        return delay
 
-        self._update()
+    def _on_poll(self, scene: SceneTask, handle: PollHandle, error: Exception | None):
+        if error is not None:
+            self._log(f"Scene {scene.scene_id}: Poll error: {error}", logging.WARNING)
+        else:
+            self._log(f"Scene {scene.scene_id}: Still processing... (poll #{handle.polls})", logging.DEBUG)
@@ -0,0 +1,92 @@
+import os
+import json
+import shutil
+import hashlib
+import threading
+
+DEFAULT_MAX_GB = 20
+
+
+def cache_key(identity: dict) -> str:
+    """Key for everything that determines a generated video (see TaskManager._cache_key)."""
+    blob = json.dumps(identity, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class VideoCache:
+    """
+    Content-addressed store of generated videos, shared by all runs.
+
+    A video is filed under the key of what produced it (provider, model,
+    prompt, input images, seed, ...), so a scene that was already generated
+    (an unchanged scene on a rerun, or a duplicate in the same script) is
+    linked into the output folder instead of being generated and paid for
+    again. Files are hard-linked where possible, so a cached video costs no
+    extra disk space while its output copy exists. The least recently used
+    videos are evicted once the cache is larger than max_bytes.
+    """
+
+    def __init__(self, folder: str, max_bytes: int = DEFAULT_MAX_GB * 1024 ** 3):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.folder, key[:2], key + ".mp4")
+
+    def fetch(self, key: str, save_path: str) -> bool:
+        """Place the cached video for key at save_path. False on a miss."""
+        path = self._path(key)
+        with self._lock:
+            if not os.path.isfile(path):
+                return False
+            try:
+                os.utime(path)   # mark as recently used
+                _place(path, save_path)
+            except OSError:
+                return False
+        return True
+
+    def store(self, key: str, video_path: str):
+        """Add a finished video under key, then evict down to max_bytes."""
+        path = self._path(key)
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            _place(video_path, path)
+            self._evict()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.folder):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)   # output folders keep their own link
+                total -= size
+            except OSError:
+                pass
+
+
+def _place(src: str, dst: str):
+    """Hard-link src to dst (copy across file systems), replacing dst atomically."""
+    tmp = dst + ".link"
+    try:
+        os.remove(tmp)
+    except OSError:
+        pass
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
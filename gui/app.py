@@ -1,18 +1,22 @@
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import threading
-import time
+import logging
 import os
 
-from core.config import load_config, save_config, get_api_key
-from core.prompt_engine import enhance_prompts_chunked
-from core.task_manager import TaskManager, SceneTask
+from core.config import load_config, save_config, get_api_key, CONFIG_DIR
+from core.prompt_engine import enhance_prompts_chunked, is_hard_cut
+from core.task_manager import TaskManager
+from core.journal import RunJournal, scene_key
+from core.pipeline import (apply_rate_limits, create_provider, build_scene_tasks,
+                           build_pending_tasks, create_task_manager, enhance_options,
+                           quota_keys, warm_up, PromptFeed)
 from gui.settings_dialog import SettingsDialog
 from gui.prompt_editor import PromptEditor
-from providers.veo3 import Veo3Provider
-from providers.runway import RunwayProvider
-from providers.kling import KlingProvider
-from providers.minimax import MinimaxProvider
+from gui.scene_table import SceneTable
+from gui.log_panel import LogPanel
+from gui.ref_images import RefImageStrip
+from providers import rate_limit
 
 # Theme
 ctk.set_appearance_mode("dark")
@@ -29,20 +33,14 @@ DARK_BG = "#1a1a1a"
 INPUT_BG = "#1e1e1e"
 
 PROVIDERS = {
-    "Kling AI": ("kling", KlingProvider),
-    "Minimax Hailuo": ("minimax", MinimaxProvider),
-    "Runway Gen-4": ("runway", RunwayProvider),
-    "Google Veo 3": ("veo3", Veo3Provider),
+    "Kling AI": "kling",
+    "Minimax Hailuo": "minimax",
+    "Runway Gen-4": "runway",
+    "Google Veo 3": "veo3",
+    "Auto (Multi-Provider)": "router",
 }
 
-STATUS_COLORS = {
-    "pending": GRAY,
-    "submitting": ORANGE,
-    "processing": ACCENT,
-    "downloading": ACCENT,
-    "completed": GREEN,
-    "failed": RED,
-}
+UI_REFRESH_MS = 100  # progress events are drained and applied at this cadence
 
 STATUS_ICONS = {
     "pending": "  ",
@@ -64,9 +62,15 @@ class App(ctk.CTk):
         self.config_data = load_config()
         self.task_manager: TaskManager | None = None
         self.enhanced_data: dict | None = None
-        self.scene_labels: dict[int, ctk.CTkLabel] = {}
+        self._scene_status: dict[int, str] = {}  # last status shown per scene
+        self._completed = 0
+        self._refresh_job = None
+        self._quota_providers: dict[str, int] = {}  # provider name -> API keys in use
 
+        apply_rate_limits(self.config_data)
         self._build_ui()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.after(500, self._warm_up_provider)
 
     def _build_ui(self):
         # ========== TOP BAR ==========
@@ -103,7 +107,8 @@ class App(ctk.CTk):
 
         self._add_labeled_widget(row1, "Provider",
             ctk.CTkOptionMenu(row1, variable=(sv := ctk.StringVar(value="Kling AI")),
-                              values=list(PROVIDERS.keys()), width=160, height=34))
+                              values=list(PROVIDERS.keys()), width=160, height=34,
+                              command=lambda _: self._warm_up_provider()))
         self.provider_var = sv
 
         self._add_labeled_widget(row1, "Resolution",
@@ -204,7 +209,6 @@ class App(ctk.CTk):
         ref_inner.pack(fill="x", padx=15, pady=(0, 12))
 
         # Subject reference
-        self.subject_refs: list[str] = []
         subj_frame = ctk.CTkFrame(ref_inner, fg_color=INPUT_BG, corner_radius=8)
         subj_frame.pack(side="left", fill="both", expand=True, padx=(0, 6))
 
@@ -216,14 +220,10 @@ class App(ctk.CTk):
                       fg_color="#3a3a3a", hover_color="#4a4a4a",
                       command=self._add_subject_ref).pack(side="right")
 
-        self.subj_preview_frame = ctk.CTkFrame(subj_frame, fg_color="transparent")
-        self.subj_preview_frame.pack(fill="x", padx=10, pady=(0, 8))
-        self.subj_label = ctk.CTkLabel(self.subj_preview_frame, text="No images",
-                                       font=("Segoe UI", 11), text_color=GRAY)
-        self.subj_label.pack(anchor="w")
+        self.subject_strip = RefImageStrip(subj_frame, on_problem=self._on_ref_problem)
+        self.subject_strip.pack(fill="x", padx=10, pady=(0, 8))
 
         # Background reference
-        self.bg_refs: list[str] = []
         bg_frame = ctk.CTkFrame(ref_inner, fg_color=INPUT_BG, corner_radius=8)
         bg_frame.pack(side="left", fill="both", expand=True, padx=(6, 0))
 
@@ -235,11 +235,8 @@ class App(ctk.CTk):
                       fg_color="#3a3a3a", hover_color="#4a4a4a",
                       command=self._add_bg_ref).pack(side="right")
 
-        self.bg_preview_frame = ctk.CTkFrame(bg_frame, fg_color="transparent")
-        self.bg_preview_frame.pack(fill="x", padx=10, pady=(0, 8))
-        self.bg_label = ctk.CTkLabel(self.bg_preview_frame, text="No images",
-                                     font=("Segoe UI", 11), text_color=GRAY)
-        self.bg_label.pack(anchor="w")
+        self.bg_strip = RefImageStrip(bg_frame, on_problem=self._on_ref_problem)
+        self.bg_strip.pack(fill="x", padx=10, pady=(0, 8))
 
         # ========== PROMPT EDITOR ==========
         self.prompt_editor = PromptEditor(self.main_scroll)
@@ -305,6 +302,8 @@ class App(ctk.CTk):
         self.progress_label = ctk.CTkLabel(prog_top, text="Ready",
                                            font=("Segoe UI", 12, "bold"), text_color=ACCENT)
         self.progress_label.pack(side="right")
+        self.quota_label = ctk.CTkLabel(prog_top, text="", font=("Segoe UI", 11), text_color=GRAY)
+        self.quota_label.pack(side="right", padx=(0, 15))
 
         self.progress_bar = ctk.CTkProgressBar(progress_inner, height=8,
                                                 progress_color=GREEN, corner_radius=4)
@@ -312,21 +311,15 @@ class App(ctk.CTk):
         self.progress_bar.set(0)
 
         # Scene status list
-        self.scene_list_frame = ctk.CTkFrame(progress_inner, fg_color="transparent")
-        self.scene_list_frame.pack(fill="x")
+        self.scene_table = SceneTable(progress_inner)
+        self.scene_table.pack(fill="x")
 
         # ========== LOG ==========
         log_card = ctk.CTkFrame(self.main_scroll, fg_color=CARD_BG, corner_radius=12)
         log_card.pack(fill="x")
 
-        log_header = ctk.CTkFrame(log_card, fg_color="transparent")
-        log_header.pack(fill="x", padx=15, pady=(10, 0))
-        ctk.CTkLabel(log_header, text="Log", font=("Segoe UI", 13, "bold")).pack(side="left")
-
-        self.log_text = ctk.CTkTextbox(log_card, height=120, font=("Consolas", 11),
-                                       fg_color="#0d0d0d", text_color="#00ff88",
-                                       corner_radius=8, state="disabled")
-        self.log_text.pack(fill="x", padx=15, pady=(5, 12))
+        self.log_panel = LogPanel(log_card, log_path=os.path.join(CONFIG_DIR, "logs", "app.log"))
+        self.log_panel.pack(fill="x")
 
     def _add_labeled_widget(self, parent, label, widget):
         ctk.CTkLabel(parent, text=label, font=("Segoe UI", 12, "bold"),
@@ -335,119 +328,86 @@ class App(ctk.CTk):
 
     # ─── Reference Images ─────────────────────────────────────────
 
+    @property
+    def subject_refs(self) -> list[str]:
+        return self.subject_strip.paths
+
+    @property
+    def bg_refs(self) -> list[str]:
+        return self.bg_strip.paths
+
     def _add_subject_ref(self):
         paths = filedialog.askopenfilenames(
             title="Select Subject / Character Images",
             filetypes=[("Images", "*.png *.jpg *.jpeg *.webp"), ("All files", "*.*")]
         )
-        for p in paths:
-            if p and p not in self.subject_refs:
-                self.subject_refs.append(p)
-        self._refresh_ref_preview(self.subj_preview_frame, self.subj_label,
-                                  self.subject_refs, "subject")
+        self.subject_strip.add(paths)
 
     def _add_bg_ref(self):
         paths = filedialog.askopenfilenames(
             title="Select Background / Scene Images",
             filetypes=[("Images", "*.png *.jpg *.jpeg *.webp"), ("All files", "*.*")]
         )
-        for p in paths:
-            if p and p not in self.bg_refs:
-                self.bg_refs.append(p)
-        self._refresh_ref_preview(self.bg_preview_frame, self.bg_label,
-                                  self.bg_refs, "bg")
-
-    def _refresh_ref_preview(self, frame, label, ref_list, ref_type):
-        for w in frame.winfo_children():
-            w.destroy()
-
-        if not ref_list:
-            label = ctk.CTkLabel(frame, text="No images",
-                                 font=("Segoe UI", 11), text_color=GRAY)
-            label.pack(anchor="w")
-            return
+        self.bg_strip.add(paths)
 
-        row = ctk.CTkFrame(frame, fg_color="transparent")
-        row.pack(fill="x")
-
-        for i, path in enumerate(ref_list):
-            item = ctk.CTkFrame(row, fg_color="#333333", corner_radius=6)
-            item.pack(side="left", padx=(0, 6), pady=2)
-
-            try:
-                from PIL import Image
-                img = Image.open(path)
-                img.thumbnail((50, 50))
-                ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=(50, 50))
-                ctk.CTkLabel(item, image=ctk_img, text="").pack(side="left", padx=4, pady=4)
-            except Exception:
-                pass
-
-            name = os.path.basename(path)
-            if len(name) > 15:
-                name = name[:12] + "..."
-            ctk.CTkLabel(item, text=name, font=("Segoe UI", 10),
-                         text_color="#aaaaaa").pack(side="left", padx=(0, 4))
-
-            ctk.CTkButton(item, text="x", width=24, height=24,
-                          fg_color="#555555", hover_color=RED,
-                          font=("Segoe UI", 11),
-                          command=lambda idx=i, rt=ref_type: self._remove_ref(idx, rt)
-                          ).pack(side="left", padx=(0, 4))
-
-        total = len(ref_list)
-        ctk.CTkLabel(row, text=f"{total} image{'s' if total > 1 else ''}",
-                     font=("Segoe UI", 10), text_color=GRAY).pack(side="left", padx=8)
-
-    def _remove_ref(self, idx, ref_type):
-        if ref_type == "subject":
-            self.subject_refs.pop(idx)
-            self._refresh_ref_preview(self.subj_preview_frame, self.subj_label,
-                                      self.subject_refs, "subject")
-        else:
-            self.bg_refs.pop(idx)
-            self._refresh_ref_preview(self.bg_preview_frame, self.bg_label,
-                                      self.bg_refs, "bg")
+    def _on_ref_problem(self, path: str, problem: str):
+        self._log(f"Reference image {os.path.basename(path)}: {problem}", logging.WARNING)
 
     # ─── Actions ──────────────────────────────────────────────────
 
+    def _on_close(self):
+        if self.task_manager:
+            self.task_manager.stop()
+        self.log_panel.close()
+        self.destroy()
+
     def _open_settings(self):
-        SettingsDialog(self)
+        dialog = SettingsDialog(self)
+        self.wait_window(dialog)
         self.config_data = load_config()
+        apply_rate_limits(self.config_data)
+
+    def _update_quota_label(self):
+        summary = rate_limit.quota_summary(self._quota_providers)
+        self.quota_label.configure(text=f"Today: {summary}" if summary else "")
 
     def _browse_output(self):
         folder = filedialog.askdirectory(title="Select Output Folder")
         if folder:
             self.output_var.set(folder)
 
-    def _log(self, msg: str):
-        timestamp = time.strftime("%H:%M:%S")
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", f"[{timestamp}]  {msg}\n")
-        self.log_text.see("end")
-        self.log_text.configure(state="disabled")
+    def _log(self, msg: str, level: int = logging.INFO):
+        self.log_panel.write(msg, level)
 
     def _get_provider(self):
         name = self.provider_var.get()
-        key_name, provider_cls = PROVIDERS[name]
-        api_key = get_api_key(self.config_data, key_name)
-        if not api_key:
-            messagebox.showerror("Error", f"No API key for {name}.\nOpen Settings to add it.")
-            return None
-
-        if key_name == "veo3":
-            return provider_cls(
-                api_key,
-                model=self.veo_model_var.get(),
-                aspect_ratio=self.aspect_var.get(),
-                resolution=self.res_var.get(),
-                generate_audio=self.audio_var.get(),
-                no_watermark=self.no_wm_var.get(),
-                negative_prompt=self.neg_prompt_var.get(),
-                subject_refs=list(self.subject_refs),
-                bg_refs=list(self.bg_refs),
-            )
-        return provider_cls(api_key)
+        key_name = PROVIDERS[name]
+        provider = create_provider(self.config_data, key_name, self._veo_options())
+        if provider is None:
+            if key_name == "router":
+                messagebox.showerror("Error", "No video provider API keys.\nOpen Settings to add them.")
+            else:
+                messagebox.showerror("Error", f"No API key for {name}.\nOpen Settings to add it.")
+        return provider
+
+    def _warm_up_provider(self):
+        """Connect to the selected provider in the background while the user edits."""
+        key_name = PROVIDERS[self.provider_var.get()]
+        provider = create_provider(self.config_data, key_name, self._veo_options())
+        if provider is not None:
+            warm_up(provider)
+
+    def _veo_options(self) -> dict:
+        return {
+            "model": self.veo_model_var.get(),
+            "aspect_ratio": self.aspect_var.get(),
+            "resolution": self.res_var.get(),
+            "generate_audio": self.audio_var.get(),
+            "no_watermark": self.no_wm_var.get(),
+            "negative_prompt": self.neg_prompt_var.get(),
+            "subject_refs": list(self.subject_refs),
+            "bg_refs": list(self.bg_refs),
+        }
 
     # ─── Enhance ──────────────────────────────────────────────────
 
@@ -467,10 +427,13 @@ class App(ctk.CTk):
 
         style = self.prompt_editor.get_style_prefix()
         model = self.config_data.get("settings", {}).get("chatgpt_model", "gpt-4o")
+        options = enhance_options(self.config_data)
+        previous = self.enhanced_data   # incremental: only new or edited scenes are sent
 
         def run():
             try:
-                result = enhance_prompts_chunked(openai_key, scenes, style, model)
+                result = enhance_prompts_chunked(openai_key, scenes, style, model,
+                                                 previous=previous, **options)
                 self.after(0, lambda: self._on_enhance_done(result))
             except Exception as e:
                 self.after(0, lambda: self._on_enhance_error(str(e)))
@@ -487,7 +450,8 @@ class App(ctk.CTk):
 
         preview = f"CHARACTER BIBLE:\n{bible}\n\nSTYLE: {style}\n"
         for s in scenes:
-            preview += f"\n#{s['id']}: {s['enhanced_prompt']}\n"
+            cut = "  [CUT]" if is_hard_cut(s) else ""
+            preview += f"\n#{s['id']}{cut}: {s['enhanced_prompt']}\n"
 
         self.preview_text.configure(state="normal")
         self.preview_text.delete("1.0", "end")
@@ -499,7 +463,7 @@ class App(ctk.CTk):
 
     def _on_enhance_error(self, error: str):
         self.enhance_btn.configure(state="normal", text="Enhance Prompts (ChatGPT)")
-        self._log(f"ChatGPT ERROR: {error}")
+        self._log(f"ChatGPT ERROR: {error}", logging.ERROR)
         messagebox.showerror("ChatGPT Error", error)
 
     def _update_cost(self):
@@ -528,82 +492,74 @@ class App(ctk.CTk):
             messagebox.showwarning("Warning", "Select output folder.")
             return
 
-        # Build scene tasks
-        enhanced_scenes = {}
-        if self.enhanced_data and self.enhance_var.get():
-            for s in self.enhanced_data.get("scenes", []):
-                enhanced_scenes[s["id"]] = s.get("enhanced_prompt", "")
-
-        scene_tasks = []
-        for raw in scenes_raw:
-            sid = raw["id"]
-            enhanced = enhanced_scenes.get(sid, "")
-            if enhanced and self.enhanced_data:
-                style = self.enhanced_data.get("style_guide", "")
-                if style and style not in enhanced:
-                    enhanced = f"{enhanced}. {style}"
-            task = SceneTask(sid, raw["prompt"], enhanced)
-            scene_tasks.append(task)
+        # Build scene tasks. Not enhanced yet: stream the enhancement, each
+        # scene starts generating as soon as ChatGPT has written its prompt
+        openai_key = get_api_key(self.config_data, "openai")
+        stream = self.enhance_var.get() and self.enhanced_data is None and bool(openai_key)
+        if stream:
+            scene_tasks = build_pending_tasks(scenes_raw)
+        else:
+            enhanced = self.enhanced_data if self.enhance_var.get() else None
+            scene_tasks = build_scene_tasks(scenes_raw, enhanced)
+
+        # Offer to resume a previous run into the same folder. Streamed
+        # prompts are not known yet: those scenes are matched once enhanced
+        resume = False
+        journal = RunJournal(output)
+        if journal.exists():
+            keys = None if stream else {t.scene_id: scene_key(provider.name, t.enhanced_prompt)
+                                        for t in scene_tasks}
+            done, in_flight = journal.summarize(keys, provider.task_namespace())
+            if done or in_flight:
+                unchanged = "\n(scenes whose enhanced prompt is unchanged)" if stream else ""
+                answer = messagebox.askyesnocancel("Resume Previous Run",
+                    f"A previous run was found in this folder:\n\n"
+                    f"{done} scene(s) already generated\n"
+                    f"{in_flight} job(s) still rendering on the provider\n\n"
+                    f"Yes = resume (skip finished, re-attach running jobs){unchanged}\n"
+                    f"No = start over")
+                if answer is None:
+                    return
+                resume = answer
 
         # Task manager
-        self.task_manager = TaskManager(
-            provider=provider,
-            output_folder=output,
+        self.task_manager = create_task_manager(
+            self.config_data, provider, output,
             frame_chaining=self.chain_var.get(),
             seed=int(self.seed_var.get() or 0),
             duration=int(self.dur_var.get()),
             resolution=self.res_var.get(),
             subject_refs=list(self.subject_refs),
             bg_refs=list(self.bg_refs),
+            resume=resume,
         )
         self.task_manager.load_scenes(scene_tasks)
+        self._quota_providers = quota_keys(provider)
+        self._update_quota_label()
         self.task_manager.set_callbacks(
-            on_update=lambda: self.after(0, self._update_progress),
-            on_log=lambda msg: self.after(0, self._log, msg),
+            on_log=self.log_panel.write,  # thread-safe, flushed to the widget in batches
             on_complete=lambda: self.after(0, self._on_generation_complete),
         )
 
         # Build scene status list
-        for w in self.scene_list_frame.winfo_children():
-            w.destroy()
-        self.scene_labels.clear()
-
-        # Header
-        header = ctk.CTkFrame(self.scene_list_frame, fg_color="#222222", corner_radius=6)
-        header.pack(fill="x", pady=(0, 2))
-        ctk.CTkLabel(header, text="#", width=40, font=("Segoe UI", 11, "bold"),
-                     text_color=GRAY).pack(side="left", padx=8)
-        ctk.CTkLabel(header, text="Scene Prompt", font=("Segoe UI", 11, "bold"),
-                     text_color=GRAY).pack(side="left", fill="x", expand=True)
-        ctk.CTkLabel(header, text="Status", width=120, font=("Segoe UI", 11, "bold"),
-                     text_color=GRAY).pack(side="right", padx=8)
-
-        for t in scene_tasks:
-            row = ctk.CTkFrame(self.scene_list_frame, fg_color="transparent", height=28)
-            row.pack(fill="x", pady=1)
-            row.pack_propagate(False)
-
-            ctk.CTkLabel(row, text=str(t.scene_id), width=40,
-                         font=("Consolas", 11), text_color=GRAY).pack(side="left", padx=8)
-
-            short = t.prompt[:55] + "..." if len(t.prompt) > 55 else t.prompt
-            ctk.CTkLabel(row, text=short, font=("Segoe UI", 11),
-                         text_color="#cccccc", anchor="w").pack(side="left", fill="x", expand=True)
-
-            status_lbl = ctk.CTkLabel(row, text="Pending", width=120,
-                                      font=("Segoe UI", 11, "bold"), text_color=GRAY)
-            status_lbl.pack(side="right", padx=8)
-            self.scene_labels[t.scene_id] = status_lbl
+        self.scene_table.set_scenes(scene_tasks)
+        self._scene_status = {t.scene_id: t.status for t in scene_tasks}
+        self._completed = 0
 
         # Cost confirmation
         cost = self.task_manager.estimate_cost()
         n = len(scene_tasks)
         chain_txt = "ON" if self.chain_var.get() else "OFF"
+        segments = len(self.task_manager.get_segments())
+        parallel_txt = str(min(self.task_manager.max_concurrent, segments))
+        if self.chain_var.get():
+            parallel_txt += f"  ({segments} chain segment{'s' if segments != 1 else ''})"
         if not messagebox.askyesno("Confirm Generation",
             f"Generate {n} videos?\n\n"
             f"Provider: {self.provider_var.get()}\n"
             f"Est. cost: ~${cost:.2f}\n"
-            f"Frame chaining: {chain_txt}\n\n"
+            f"Frame chaining: {chain_txt}\n"
+            f"Parallel jobs: {parallel_txt}\n\n"
             f"Output: {output}\n"
             f"Files: 1.mp4, 2.mp4 ... {n}.mp4"):
             return
@@ -611,8 +567,32 @@ class App(ctk.CTk):
         self.gen_btn.configure(state="disabled")
         self.stop_btn.configure(state="normal")
         self.progress_bar.set(0)
-        self._log(f"Starting: {n} scenes | {self.provider_var.get()} | chain={chain_txt}")
+        resume_txt = " | resume" if resume else ""
+        self._log(f"Starting: {n} scenes | {self.provider_var.get()} | chain={chain_txt}{resume_txt}")
         self.task_manager.start()
+        if stream:
+            self._stream_enhancement(openai_key, scenes_raw, PromptFeed(self.task_manager))
+        self._schedule_refresh()
+
+    def _stream_enhancement(self, openai_key: str, scenes: list[dict], feed: PromptFeed):
+        self.enhance_btn.configure(state="disabled", text="Enhancing...")
+        self._log(f"Streaming {len(scenes)} scenes through ChatGPT, generating as they arrive...")
+        style = self.prompt_editor.get_style_prefix()
+        model = self.config_data.get("settings", {}).get("chatgpt_model", "gpt-4o")
+        options = enhance_options(self.config_data)
+
+        def run():
+            try:
+                result = enhance_prompts_chunked(openai_key, scenes, style, model,
+                                                 on_scene=feed.on_scene, **options)
+            except Exception as e:
+                feed.fail(f"Enhancement failed: {e}")
+                self.after(0, lambda: self._on_enhance_error(str(e)))
+                return
+            feed.finish(result)
+            self.after(0, lambda: self._on_enhance_done(result))
+
+        threading.Thread(target=run, daemon=True).start()
 
     def _stop_generation(self):
         if self.task_manager:
@@ -621,37 +601,40 @@ class App(ctk.CTk):
         self.stop_btn.configure(state="disabled")
         self._log("Generation stopped by user.")
 
+    def _schedule_refresh(self):
+        if self._refresh_job is None:
+            self._refresh_job = self.after(UI_REFRESH_MS, self._refresh_tick)
+
+    def _refresh_tick(self):
+        self._refresh_job = None
+        self._update_progress()
+        if self.task_manager and self.task_manager.is_running:
+            self._schedule_refresh()
+
     def _update_progress(self):
+        """Apply scene events queued since the last call; only changed rows are touched."""
         if not self.task_manager:
             return
+        events = self.task_manager.events.drain()
+        if not events:
+            return
 
-        completed = 0
-        total = len(self.task_manager.scenes)
-
-        for t in self.task_manager.scenes:
-            lbl = self.scene_labels.get(t.scene_id)
-            if not lbl:
+        changes = {}
+        for ev in events:
+            previous = self._scene_status.get(ev.scene_id)
+            if previous == ev.status:
                 continue
+            self._scene_status[ev.scene_id] = ev.status
+            self._completed += (ev.status == "completed") - (previous == "completed")
+            changes[ev.scene_id] = ev.status
+        self.scene_table.apply(changes)
 
-            display_map = {
-                "pending": "Pending",
-                "submitting": "Submitting...",
-                "processing": "Generating...",
-                "downloading": "Downloading...",
-                "completed": "Done",
-                "failed": "FAILED",
-            }
-            display = display_map.get(t.status, t.status)
-            color = STATUS_COLORS.get(t.status, GRAY)
-            lbl.configure(text=display, text_color=color)
-
-            if t.status == "completed":
-                completed += 1
-
+        total = len(self._scene_status)
         if total > 0:
-            pct = completed / total
+            pct = self._completed / total
             self.progress_bar.set(pct)
-            self.progress_label.configure(text=f"{completed}/{total}  ({pct*100:.0f}%)")
+            self.progress_label.configure(text=f"{self._completed}/{total}  ({pct*100:.0f}%)")
+        self._update_quota_label()
 
     def _on_generation_complete(self):
         self.gen_btn.configure(state="normal")
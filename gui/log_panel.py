@@ -0,0 +1,149 @@
+import os
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+import customtkinter as ctk
+
+GRAY = "#7f8c8d"
+
+MAX_LINES = 2000                      # lines kept in memory and in the widget
+FLUSH_MS = 200                        # widget is updated in one batch at this cadence
+LOG_FILE_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 5
+
+LEVELS = {
+    "Debug": logging.DEBUG,
+    "Info": logging.INFO,
+    "Warning": logging.WARNING,
+    "Error": logging.ERROR,
+}
+
+LEVEL_COLORS = {
+    logging.DEBUG: "#5f8f75",
+    logging.INFO: "#00ff88",
+    logging.WARNING: "#f39c12",
+    logging.ERROR: "#e74c3c",
+}
+
+
+class LogPanel(ctk.CTkFrame):
+    """
+    Log view backed by a bounded ring buffer.
+
+    write() is safe from any thread and only appends to memory; the textbox
+    is updated in one batch every FLUSH_MS on the UI thread and never holds
+    more than MAX_LINES. Every line, debug included, also goes to a rotating
+    log file, written by a QueueListener thread so the UI never waits on disk.
+    """
+
+    def __init__(self, parent, log_path: str = None, height: int = 120):
+        super().__init__(parent, fg_color="transparent")
+        self._lines: deque = deque(maxlen=MAX_LINES)    # (time, level, msg), for re-filtering
+        self._pending: deque = deque(maxlen=MAX_LINES)  # not yet in the widget
+        self._lock = threading.Lock()
+        self._shown = 0                                 # lines currently in the widget
+        self._file_logger = None
+        self._listener = None
+        if log_path:
+            self._start_file_sink(log_path)
+        self._build_ui(height)
+        self._flush_job = self.after(FLUSH_MS, self._flush)
+
+    def _build_ui(self, height: int):
+        header = ctk.CTkFrame(self, fg_color="transparent")
+        header.pack(fill="x", padx=15, pady=(10, 0))
+        ctk.CTkLabel(header, text="Log", font=("Segoe UI", 13, "bold")).pack(side="left")
+
+        self.level_var = ctk.StringVar(value="Info")
+        ctk.CTkOptionMenu(header, variable=self.level_var, values=list(LEVELS),
+                          width=100, height=26,
+                          command=lambda _: self._rerender()).pack(side="right")
+        ctk.CTkLabel(header, text="Level", font=("Segoe UI", 11),
+                     text_color=GRAY).pack(side="right", padx=(0, 5))
+
+        self.text = ctk.CTkTextbox(self, height=height, font=("Consolas", 11),
+                                   fg_color="#0d0d0d", text_color="#00ff88",
+                                   corner_radius=8, state="disabled")
+        self.text.pack(fill="x", padx=15, pady=(5, 12))
+        for level, color in LEVEL_COLORS.items():
+            self.text.tag_config(logging.getLevelName(level), foreground=color)
+
+    def _start_file_sink(self, log_path: str):
+        try:
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            handler = RotatingFileHandler(log_path, maxBytes=LOG_FILE_BYTES,
+                                          backupCount=LOG_FILE_BACKUPS, encoding="utf-8")
+        except OSError:
+            return
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(message)s"))
+        log_queue = queue.SimpleQueue()
+        self._listener = QueueListener(log_queue, handler)
+        self._listener.start()
+
+        logger = logging.getLogger("ai_video_tool.log")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        logger.handlers = [QueueHandler(log_queue)]
+        self._file_logger = logger
+
+    # ─── Public ───────────────────────────────────────────────────
+
+    def write(self, msg: str, level: int = logging.INFO):
+        """Add a line. Safe to call from any thread."""
+        entry = (time.time(), level, msg)
+        with self._lock:
+            self._lines.append(entry)
+            self._pending.append(entry)
+        if self._file_logger:
+            self._file_logger.log(level, msg)
+
+    def close(self):
+        """Flush the file sink. Call before the window is destroyed."""
+        if self._flush_job:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
+
+    # ─── Widget ───────────────────────────────────────────────────
+
+    def _flush(self):
+        with self._lock:
+            batch = list(self._pending)
+            self._pending.clear()
+        min_level = LEVELS[self.level_var.get()]
+        batch = [e for e in batch if e[1] >= min_level]
+        if batch:
+            self.text.configure(state="normal")
+            self._insert(batch)
+            self.text.see("end")
+            self.text.configure(state="disabled")
+        self._flush_job = self.after(FLUSH_MS, self._flush)
+
+    def _insert(self, entries: list):
+        for ts, level, msg in entries:
+            stamp = time.strftime("%H:%M:%S", time.localtime(ts))
+            self.text.insert("end", f"[{stamp}]  {msg}\n", logging.getLevelName(level))
+        self._shown += len(entries)
+        excess = self._shown - MAX_LINES
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
+            self._shown = MAX_LINES
+
+    def _rerender(self):
+        """Rebuild the widget from the ring buffer after the level filter changed."""
+        min_level = LEVELS[self.level_var.get()]
+        with self._lock:
+            entries = [e for e in self._lines if e[1] >= min_level]
+            self._pending.clear()
+        self.text.configure(state="normal")
+        self.text.delete("1.0", "end")
+        self._shown = 0
+        self._insert(entries)
+        self.text.see("end")
+        self.text.configure(state="disabled")
@@ -1,15 +1,19 @@
 import customtkinter as ctk
 from tkinter import filedialog
-import csv
-import os
+
+from core.script import SceneParser, load_script, to_scene_dicts
 
 CARD_BG = "#2b2b2b"
 ACCENT = "#3498db"
 
+PARSE_DELAY_MS = 150   # re-parse once typing pauses, not on every key
+
 
 class PromptEditor(ctk.CTkFrame):
     def __init__(self, parent):
         super().__init__(parent, fg_color="transparent")
+        self._parser = SceneParser()
+        self._parse_job = None
         self._build_ui()
 
     def _build_ui(self):
@@ -57,14 +61,14 @@ class PromptEditor(ctk.CTkFrame):
                       fg_color="#3a3a3a", hover_color="#e74c3c",
                       command=self._clear).pack(side="left", padx=8)
 
-        ctk.CTkLabel(toolbar, text="One scene per line",
+        ctk.CTkLabel(toolbar, text="One scene per line  ·  \"---\" = hard cut",
                      font=("Segoe UI", 11), text_color="#7f8c8d").pack(side="right")
 
         # Text area
         self.prompt_text = ctk.CTkTextbox(prompt_frame, font=("Consolas", 12),
                                           fg_color="#1e1e1e", corner_radius=8)
         self.prompt_text.pack(fill="both", expand=True, padx=12, pady=(0, 10))
-        self.prompt_text.bind("<KeyRelease>", lambda e: self._update_count())
+        self.prompt_text.bind("<KeyRelease>", lambda e: self._schedule_parse())
 
     def _import_file(self):
         path = filedialog.askopenfilename(
@@ -74,112 +78,50 @@ class PromptEditor(ctk.CTkFrame):
         if not path:
             return
 
-        scenes = []
-        ext = os.path.splitext(path)[1].lower()
-
-        if ext == ".csv":
-            with open(path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    prompt = row.get("prompt", "").strip()
-                    if prompt:
-                        scenes.append(prompt)
-        else:
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
-            scenes = _parse_scene_text(content)
-
+        scenes = load_script(path)
         if scenes:
+            lines = []
+            for prompt, cut in scenes:
+                if cut:
+                    lines.append("---")
+                lines.append(prompt)
             self.prompt_text.delete("1.0", "end")
-            self.prompt_text.insert("1.0", "\n".join(scenes))
+            self.prompt_text.insert("1.0", "\n".join(lines))
             self._update_count()
 
     def _clear(self):
         self.prompt_text.delete("1.0", "end")
         self._update_count()
 
+    def _schedule_parse(self):
+        if self._parse_job is not None:
+            self.after_cancel(self._parse_job)
+        self._parse_job = self.after(PARSE_DELAY_MS, self._update_count)
+
+    def _parse(self) -> list[tuple[str, bool]]:
+        """Bring the cached scene list up to date with the textbox."""
+        if self._parse_job is not None:
+            self.after_cancel(self._parse_job)
+            self._parse_job = None
+        return self._parser.update(self.prompt_text.get("1.0", "end-1c"))
+
     def _update_count(self):
-        scenes = self.get_scenes()
+        scenes = self._parse()
         n = len(scenes)
-        self.count_label.configure(text=f"{n} scene{'s' if n != 1 else ''}")
+        text = f"{n} scene{'s' if n != 1 else ''}"
+        segments = 1 + sum(1 for _, cut in scenes if cut)
+        if n and segments > 1:
+            text += f"  ·  {segments} segments"
+        self.count_label.configure(text=text)
 
     def get_style_prefix(self) -> str:
         return self.style_text.get("1.0", "end").strip()
 
     def get_scenes(self) -> list[dict]:
-        text = self.prompt_text.get("1.0", "end").strip()
-        if not text:
-            return []
-        prompts = _parse_scene_text(text)
-        return [{"id": i + 1, "prompt": p} for i, p in enumerate(prompts)]
+        return to_scene_dicts(self._parse())
 
     def set_scenes_text(self, text: str):
         self.prompt_text.delete("1.0", "end")
         self.prompt_text.insert("1.0", text)
         self._update_count()
 
-
-import re
-
-# Scene header pattern: "Scene 1 – Title ...", "Scene 2 - Title ...", "Canh 3: ..."
-_SCENE_PATTERN = re.compile(
-    r'^(?:Scene|Canh)\s+\d+\s*[–\-:.]',
-    re.IGNORECASE
-)
-
-
-def _parse_scene_text(text: str) -> list[str]:
-    """
-    Parse scene text that may be multi-line per scene.
-
-    Supports 2 formats:
-      1. "Scene X – Title description..." (multi-line, separated by Scene headers)
-      2. Simple one-line-per-scene (no Scene headers)
-
-    Returns list of prompt strings (without the "Scene X – Title" prefix).
-    """
-    text = text.strip()
-    if not text:
-        return []
-
-    lines = text.split("\n")
-
-    # Check if text contains Scene headers
-    has_scene_headers = any(_SCENE_PATTERN.match(l.strip()) for l in lines if l.strip())
-
-    if has_scene_headers:
-        # Multi-line mode: group lines between Scene headers
-        scenes = []
-        current_lines = []
-
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                continue
-
-            if _SCENE_PATTERN.match(stripped):
-                # Save previous scene
-                if current_lines:
-                    scenes.append(" ".join(current_lines))
-                # Start new scene - remove "Scene X – Title" prefix
-                cleaned = stripped
-                for sep in ["–", "-", ":"]:
-                    if sep in cleaned:
-                        parts = cleaned.split(sep, 1)
-                        if any(kw in parts[0].lower() for kw in ["scene", "canh"]):
-                            cleaned = parts[1].strip()
-                            break
-                current_lines = [cleaned] if cleaned else []
-            else:
-                # Continuation line of current scene
-                current_lines.append(stripped)
-
-        # Don't forget the last scene
-        if current_lines:
-            scenes.append(" ".join(current_lines))
-
-        return scenes
-
-    else:
-        # Simple mode: each non-empty line is one scene
-        return [l.strip() for l in lines if l.strip() and not l.strip().startswith("#")]
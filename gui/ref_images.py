@@ -0,0 +1,215 @@
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import customtkinter as ctk
+
+GRAY = "#7f8c8d"
+RED = "#e74c3c"
+ITEM_BG = "#333333"
+
+THUMB_SIZE = (50, 50)
+CACHE_SIZE = 256          # decoded thumbnails kept in memory
+POLL_MS = 50              # how often the UI picks up finished decodes
+DECODE_WORKERS = 2
+
+SUPPORTED_FORMATS = ("PNG", "JPEG", "WEBP")
+MIN_SIDE = 256            # smaller references are too blurry to help the provider
+MAX_PIXELS = 50_000_000   # refuse absurdly large images
+
+
+class ImageInfo:
+    """Header data and thumbnail for one reference image, computed once."""
+
+    def __init__(self, width: int = 0, height: int = 0, fmt: str = "",
+                 problem: str = "", thumb=None):
+        self.width = width
+        self.height = height
+        self.format = fmt
+        self.problem = problem    # "" when the image is usable as a reference
+        self.thumb = thumb        # PIL image, THUMB_SIZE at most
+
+
+def _cache_key(path: str):
+    st = os.stat(path)
+    return path, st.st_mtime_ns, st.st_size
+
+
+def _load(path: str) -> ImageInfo:
+    """Validate the header and decode a thumbnail. Runs on a worker thread."""
+    from PIL import Image
+
+    try:
+        with Image.open(path) as img:
+            info = ImageInfo(img.width, img.height, img.format or "")
+            if info.format not in SUPPORTED_FORMATS:
+                info.problem = f"unsupported format {info.format or '?'}"
+            elif min(img.size) < MIN_SIDE:
+                info.problem = f"too small ({img.width}x{img.height})"
+            elif img.width * img.height > MAX_PIXELS:
+                info.problem = f"too large ({img.width}x{img.height})"
+            # JPEG can decode at a reduced scale directly, far cheaper for 4K photos
+            img.draft("RGB", (THUMB_SIZE[0] * 2, THUMB_SIZE[1] * 2))
+            thumb = img.convert("RGB")
+            thumb.thumbnail(THUMB_SIZE)
+            info.thumb = thumb
+            return info
+    except Exception as e:
+        return ImageInfo(problem=f"cannot read image: {e}")
+
+
+class ThumbnailCache:
+    """
+    Thumbnails keyed by (path, mtime, size), so an edited file is decoded again.
+
+    get() returns a cached entry, or None after scheduling the decode on a
+    worker pool; the callback then runs on the UI thread from poll().
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict = OrderedDict()   # key -> ImageInfo
+        self._waiters: dict = {}                     # key -> [callback(path, info)]
+        self._done: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=DECODE_WORKERS, thread_name_prefix="thumb")
+
+    def get(self, path: str, on_ready) -> ImageInfo | None:
+        try:
+            key = _cache_key(path)
+        except OSError as e:
+            return ImageInfo(problem=f"cannot read image: {e.strerror or e}")
+        with self._lock:
+            info = self._entries.get(key)
+            if info is not None:
+                self._entries.move_to_end(key)
+                return info
+            waiters = self._waiters.setdefault(key, [])
+            waiters.append(on_ready)
+            if len(waiters) == 1:
+                self._pool.submit(self._decode, key)
+        return None
+
+    def _decode(self, key):
+        info = _load(key[0])
+        with self._lock:
+            self._entries[key] = info
+            while len(self._entries) > CACHE_SIZE:
+                self._entries.popitem(last=False)
+        self._done.put((key, info))
+
+    def poll(self):
+        """Run callbacks for decodes finished since the last call (UI thread)."""
+        while True:
+            try:
+                key, info = self._done.get_nowait()
+            except queue.Empty:
+                return
+            with self._lock:
+                waiters = self._waiters.pop(key, [])
+            for callback in waiters:
+                callback(key[0], info)
+
+    def pending(self) -> bool:
+        with self._lock:
+            return bool(self._waiters)
+
+
+_cache = ThumbnailCache()  # shared by every strip in the app
+
+
+class RefImageStrip(ctk.CTkFrame):
+    """
+    Row of reference image thumbnails.
+
+    Items are created once per image and updated in place when the thumbnail
+    arrives from the decode pool; removing an image only destroys its item.
+    on_problem(path, message) is called once per image that fails validation.
+    """
+
+    def __init__(self, parent, on_problem=None):
+        super().__init__(parent, fg_color="transparent")
+        self.paths: list[str] = []
+        self.on_problem = on_problem
+        self._items: dict[str, tuple] = {}   # path -> (frame, image label, name label)
+        self._images: dict[str, ctk.CTkImage] = {}
+        self._poll_job = None
+
+        self.row = ctk.CTkFrame(self, fg_color="transparent")
+        self.row.pack(fill="x")
+        self.count_label = ctk.CTkLabel(self.row, text="No images",
+                                        font=("Segoe UI", 11), text_color=GRAY)
+        self.count_label.pack(side="left", padx=8)
+
+    def add(self, paths):
+        for path in paths:
+            if not path or path in self._items:
+                continue
+            self.paths.append(path)
+            self._add_item(path)
+            info = _cache.get(path, self._apply)
+            if info is not None:
+                self._apply(path, info)
+        self._update_count()
+        self._schedule_poll()
+
+    def remove(self, path: str):
+        if path not in self._items:
+            return
+        self.paths.remove(path)
+        self._items.pop(path)[0].destroy()
+        self._images.pop(path, None)
+        self._update_count()
+
+    def _add_item(self, path: str):
+        item = ctk.CTkFrame(self.row, fg_color=ITEM_BG, corner_radius=6)
+        item.pack(side="left", padx=(0, 6), pady=2, before=self.count_label)
+
+        # Placeholder until the thumbnail is decoded
+        image_lbl = ctk.CTkLabel(item, text="...", width=THUMB_SIZE[0], height=THUMB_SIZE[1],
+                                 text_color=GRAY)
+        image_lbl.pack(side="left", padx=4, pady=4)
+
+        name = os.path.basename(path)
+        if len(name) > 15:
+            name = name[:12] + "..."
+        name_lbl = ctk.CTkLabel(item, text=name, font=("Segoe UI", 10), text_color="#aaaaaa")
+        name_lbl.pack(side="left", padx=(0, 4))
+
+        ctk.CTkButton(item, text="x", width=24, height=24,
+                      fg_color="#555555", hover_color=RED,
+                      font=("Segoe UI", 11),
+                      command=lambda p=path: self.remove(p)).pack(side="left", padx=(0, 4))
+        self._items[path] = (item, image_lbl, name_lbl)
+
+    def _apply(self, path: str, info: ImageInfo):
+        item = self._items.get(path)
+        if item is None:
+            return
+        frame, image_lbl, name_lbl = item
+        if info.thumb is not None and path not in self._images:
+            self._images[path] = ctk.CTkImage(light_image=info.thumb, dark_image=info.thumb,
+                                              size=info.thumb.size)
+            image_lbl.configure(image=self._images[path], text="")
+        if info.problem:
+            if info.thumb is None:
+                image_lbl.configure(text="!", text_color=RED)
+            frame.configure(border_width=1, border_color=RED)
+            name_lbl.configure(text_color=RED)
+            if self.on_problem:
+                self.on_problem(path, info.problem)
+
+    def _update_count(self):
+        total = len(self.paths)
+        self.count_label.configure(text=f"{total} image{'s' if total > 1 else ''}"
+                                   if total else "No images")
+
+    def _schedule_poll(self):
+        if self._poll_job is None and _cache.pending():
+            self._poll_job = self.after(POLL_MS, self._poll)
+
+    def _poll(self):
+        self._poll_job = None
+        _cache.poll()
+        self._schedule_poll()
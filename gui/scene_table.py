@@ -0,0 +1,246 @@
+import customtkinter as ctk
+
+ACCENT = "#3498db"
+GREEN = "#2ecc71"
+RED = "#e74c3c"
+ORANGE = "#f39c12"
+GRAY = "#7f8c8d"
+INPUT_BG = "#1e1e1e"
+HIGHLIGHT_BG = "#2c3e50"
+
+STATUS_COLORS = {
+    "pending": GRAY,
+    "submitting": ORANGE,
+    "processing": ACCENT,
+    "downloading": ACCENT,
+    "completed": GREEN,
+    "failed": RED,
+}
+
+STATUS_TEXT = {
+    "pending": "Pending",
+    "submitting": "Submitting...",
+    "processing": "Generating...",
+    "downloading": "Downloading...",
+    "completed": "Done",
+    "failed": "FAILED",
+}
+
+# Filter name -> statuses shown (None = all)
+FILTERS = {
+    "All": None,
+    "In flight": ("submitting", "processing", "downloading"),
+    "Failed": ("failed",),
+    "Pending": ("pending",),
+    "Done": ("completed",),
+}
+
+VISIBLE_ROWS = 14
+ROW_HEIGHT = 28
+PROMPT_CHARS = 55
+
+
+class SceneTable(ctk.CTkFrame):
+    """
+    Scene status list that only creates widgets for the visible window.
+
+    Scene data lives in plain dicts; a fixed pool of row widgets is re-bound
+    to whichever scenes are scrolled into view, so the widget count stays the
+    same for 10 or 10,000 scenes. Supports filtering by status and jumping
+    to a scene number.
+    """
+
+    def __init__(self, parent, visible_rows: int = VISIBLE_ROWS):
+        super().__init__(parent, fg_color="transparent")
+        self.visible_rows = visible_rows
+        self._prompts: dict[int, str] = {}   # scene_id -> shortened prompt
+        self._status: dict[int, str] = {}    # scene_id -> status (insertion order = scene order)
+        self._view: list[int] = []           # scene ids matching the filter
+        self._offset = 0                     # index in _view of the first visible row
+        self._highlight: int | None = None   # scene jumped to
+        self._rows: list[tuple] = []         # (frame, id label, prompt label, status label)
+        self._build_ui()
+
+    def _build_ui(self):
+        # Toolbar: filter, count, jump to scene
+        toolbar = ctk.CTkFrame(self, fg_color="transparent")
+        toolbar.pack(fill="x", pady=(0, 4))
+
+        ctk.CTkLabel(toolbar, text="Show", font=("Segoe UI", 11, "bold"),
+                     text_color=GRAY).pack(side="left", padx=(0, 5))
+        self.filter_var = ctk.StringVar(value="All")
+        ctk.CTkOptionMenu(toolbar, variable=self.filter_var, values=list(FILTERS),
+                          width=110, height=28,
+                          command=lambda _: self._on_filter()).pack(side="left")
+        self.count_label = ctk.CTkLabel(toolbar, text="", font=("Segoe UI", 11),
+                                        text_color=GRAY)
+        self.count_label.pack(side="left", padx=10)
+
+        ctk.CTkButton(toolbar, text="Go", width=40, height=28,
+                      fg_color="#3a3a3a", hover_color="#4a4a4a",
+                      command=self._on_jump).pack(side="right")
+        self.jump_entry = ctk.CTkEntry(toolbar, width=70, height=28, font=("Consolas", 11),
+                                       fg_color=INPUT_BG, placeholder_text="Scene #")
+        self.jump_entry.pack(side="right", padx=(0, 5))
+        self.jump_entry.bind("<Return>", lambda e: self._on_jump())
+
+        # Header
+        header = ctk.CTkFrame(self, fg_color="#222222", corner_radius=6)
+        header.pack(fill="x", pady=(0, 2))
+        ctk.CTkLabel(header, text="#", width=40, font=("Segoe UI", 11, "bold"),
+                     text_color=GRAY).pack(side="left", padx=8)
+        ctk.CTkLabel(header, text="Scene Prompt", font=("Segoe UI", 11, "bold"),
+                     text_color=GRAY).pack(side="left", fill="x", expand=True)
+        ctk.CTkLabel(header, text="Status", width=120, font=("Segoe UI", 11, "bold"),
+                     text_color=GRAY).pack(side="right", padx=8)
+
+        # Fixed pool of rows + scrollbar
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="x")
+
+        self.scrollbar = ctk.CTkScrollbar(body, orientation="vertical",
+                                          height=self.visible_rows * (ROW_HEIGHT + 2),
+                                          command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        rows_frame = ctk.CTkFrame(body, fg_color="transparent")
+        rows_frame.pack(side="left", fill="x", expand=True)
+
+        for _ in range(self.visible_rows):
+            row = ctk.CTkFrame(rows_frame, fg_color="transparent", height=ROW_HEIGHT, corner_radius=4)
+            row.pack(fill="x", pady=1)
+            row.pack_propagate(False)
+
+            id_lbl = ctk.CTkLabel(row, text="", width=40, font=("Consolas", 11), text_color=GRAY)
+            id_lbl.pack(side="left", padx=8)
+            prompt_lbl = ctk.CTkLabel(row, text="", font=("Segoe UI", 11),
+                                      text_color="#cccccc", anchor="w")
+            prompt_lbl.pack(side="left", fill="x", expand=True)
+            status_lbl = ctk.CTkLabel(row, text="", width=120, font=("Segoe UI", 11, "bold"))
+            status_lbl.pack(side="right", padx=8)
+
+            for w in (row, id_lbl, prompt_lbl, status_lbl):
+                w.bind("<MouseWheel>", self._on_wheel)
+                w.bind("<Button-4>", lambda e: self._scroll_by(-3))
+                w.bind("<Button-5>", lambda e: self._scroll_by(3))
+            self._rows.append((row, id_lbl, prompt_lbl, status_lbl))
+
+        self._render()
+
+    # ─── Data ─────────────────────────────────────────────────────
+
+    def set_scenes(self, scenes: list):
+        """Show a new run (list of SceneTask)."""
+        self._prompts = {}
+        self._status = {}
+        for s in scenes:
+            prompt = s.prompt
+            self._prompts[s.scene_id] = (prompt[:PROMPT_CHARS] + "..."
+                                         if len(prompt) > PROMPT_CHARS else prompt)
+            self._status[s.scene_id] = s.status
+        self._offset = 0
+        self._highlight = None
+        self._refilter()
+        self._render()
+
+    def apply(self, changes: dict[int, str]):
+        """
+        Record new statuses (scene_id -> status). Only rows in the visible
+        window are redrawn; with a filter active the view is rebuilt, since
+        scenes move in and out of it.
+        """
+        if not changes:
+            return
+        self._status.update(changes)
+        if FILTERS[self.filter_var.get()] is not None:
+            self._refilter()
+            self._render()
+            return
+        window = self._view[self._offset:self._offset + self.visible_rows]
+        for i, sid in enumerate(window):
+            if sid in changes:
+                self._render_row(i, sid)
+
+    def _refilter(self):
+        statuses = FILTERS[self.filter_var.get()]
+        if statuses is None:
+            self._view = list(self._status)
+        else:
+            self._view = [sid for sid, st in self._status.items() if st in statuses]
+        self._clamp()
+
+    def _clamp(self):
+        self._offset = max(0, min(self._offset, len(self._view) - self.visible_rows))
+
+    # ─── Rendering ────────────────────────────────────────────────
+
+    def _render(self):
+        window = self._view[self._offset:self._offset + self.visible_rows]
+        for i in range(self.visible_rows):
+            self._render_row(i, window[i] if i < len(window) else None)
+
+        total = len(self._view)
+        if total > self.visible_rows:
+            self.scrollbar.set(self._offset / total, (self._offset + self.visible_rows) / total)
+        else:
+            self.scrollbar.set(0, 1)
+        shown = f"{total} of {len(self._status)}" if total != len(self._status) else str(total)
+        self.count_label.configure(text=f"{shown} scene{'s' if len(self._status) != 1 else ''}"
+                                   if self._status else "")
+
+    def _render_row(self, i: int, sid: int | None):
+        row, id_lbl, prompt_lbl, status_lbl = self._rows[i]
+        if sid is None:
+            row.configure(fg_color="transparent")
+            id_lbl.configure(text="")
+            prompt_lbl.configure(text="")
+            status_lbl.configure(text="")
+            return
+        status = self._status[sid]
+        row.configure(fg_color=HIGHLIGHT_BG if sid == self._highlight else "transparent")
+        id_lbl.configure(text=str(sid))
+        prompt_lbl.configure(text=self._prompts[sid])
+        status_lbl.configure(text=STATUS_TEXT.get(status, status),
+                             text_color=STATUS_COLORS.get(status, GRAY))
+
+    # ─── Navigation ───────────────────────────────────────────────
+
+    def _scroll_to(self, offset: int):
+        old = self._offset
+        self._offset = offset
+        self._clamp()
+        if self._offset != old:
+            self._render()
+
+    def _scroll_by(self, rows: int):
+        self._scroll_to(self._offset + rows)
+
+    def _on_wheel(self, event):
+        self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._view)))
+        elif args[0] == "scroll":
+            step = self.visible_rows if args[2] == "pages" else 1
+            self._scroll_by(int(args[1]) * step)
+
+    def _on_filter(self):
+        self._offset = 0
+        self._refilter()
+        self._render()
+
+    def _on_jump(self):
+        try:
+            sid = int(self.jump_entry.get().strip())
+        except ValueError:
+            return
+        if sid not in self._status:
+            return
+        if sid not in self._view:
+            self.filter_var.set("All")
+            self._refilter()
+        self._highlight = sid
+        self._offset = self._view.index(sid)
+        self._clamp()
+        self._render()
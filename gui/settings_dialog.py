@@ -1,10 +1,9 @@
 import customtkinter as ctk
 from tkinter import messagebox
 import threading
-import requests
-import openai
 
-from core.config import load_config, save_config
+from core.config import (load_config, save_config, get_max_concurrent, get_api_keys,
+                         parse_api_keys)
 
 # Colors
 GREEN = "#2ecc71"
@@ -18,7 +17,7 @@ class SettingsDialog(ctk.CTkToplevel):
     def __init__(self, parent):
         super().__init__(parent)
         self.title("Settings")
-        self.geometry("620x580")
+        self.geometry("620x720")
         self.resizable(False, False)
         self.transient(parent)
         self.grab_set()
@@ -27,6 +26,7 @@ class SettingsDialog(ctk.CTkToplevel):
         self.config = load_config()
         self.key_entries = {}
         self.status_labels = {}
+        self.concurrency_entries = {}
         self._build_ui()
         self._load_values()
 
@@ -39,12 +39,16 @@ class SettingsDialog(ctk.CTkToplevel):
         ctk.CTkLabel(main, text="OpenAI key + at least 1 video provider required.",
                      font=("Segoe UI", 12), text_color=GRAY).pack(anchor="w", pady=(2, 15))
 
+        ctk.CTkLabel(main, text="Video providers accept several keys, comma separated, "
+                                "to run more jobs in parallel.",
+                     font=("Segoe UI", 11), text_color=GRAY).pack(anchor="w", pady=(0, 10))
+
         providers = [
             ("openai", "OpenAI (ChatGPT)", "Prompt enhancement engine"),
-            ("veo3", "Google Veo 3", "Google AI Studio key"),
-            ("runway", "Runway Gen-4", "Runway developer key"),
-            ("kling", "Kling AI", "Kling API key"),
-            ("minimax", "Minimax Hailuo", "Minimax platform key"),
+            ("veo3", "Google Veo 3", "Google AI Studio key(s)"),
+            ("runway", "Runway Gen-4", "Runway developer key(s)"),
+            ("kling", "Kling AI", "Kling API key(s)"),
+            ("minimax", "Minimax Hailuo", "Minimax platform key(s)"),
         ]
 
         for key, label, hint in providers:
@@ -91,6 +95,43 @@ class SettingsDialog(ctk.CTkToplevel):
                           values=["gpt-4o", "gpt-4o-mini"],
                           width=150, height=34).pack(side="right")
 
+        # Parallel jobs per provider (used when frame chaining is off)
+        conc_frame = ctk.CTkFrame(main, fg_color=CARD_BG, corner_radius=10)
+        conc_frame.pack(fill="x", pady=(12, 0))
+
+        conc_header = ctk.CTkFrame(conc_frame, fg_color="transparent")
+        conc_header.pack(fill="x", padx=12, pady=(10, 0))
+        ctk.CTkLabel(conc_header, text="Parallel Jobs", font=("Segoe UI", 13, "bold")).pack(side="left")
+        ctk.CTkLabel(conc_header, text="Max jobs in flight per API key",
+                     font=("Segoe UI", 11), text_color=GRAY).pack(side="right")
+
+        conc_inner = ctk.CTkFrame(conc_frame, fg_color="transparent")
+        conc_inner.pack(fill="x", padx=12, pady=(6, 8))
+
+        for key, label in [("veo3", "Veo 3"), ("runway", "Runway"),
+                           ("kling", "Kling"), ("minimax", "Minimax")]:
+            ctk.CTkLabel(conc_inner, text=label, font=("Segoe UI", 12),
+                         text_color=GRAY).pack(side="left", padx=(0, 5))
+            entry = ctk.CTkEntry(conc_inner, width=50, height=30, font=("Consolas", 12))
+            entry.pack(side="left", padx=(0, 15))
+            self.concurrency_entries[key] = entry
+
+        engine_row = ctk.CTkFrame(conc_frame, fg_color="transparent")
+        engine_row.pack(fill="x", padx=12, pady=(0, 12))
+        ctk.CTkLabel(engine_row, text="Engine", font=("Segoe UI", 12),
+                     text_color=GRAY).pack(side="left", padx=(0, 5))
+        self.engine_var = ctk.StringVar(value="threads")
+        ctk.CTkOptionMenu(engine_row, variable=self.engine_var,
+                          values=["threads", "asyncio"],
+                          width=110, height=30).pack(side="left")
+        ctk.CTkLabel(engine_row, text="asyncio = hundreds of jobs in flight",
+                     font=("Segoe UI", 11), text_color=GRAY).pack(side="right")
+
+        # Generation cache
+        self.cache_var = ctk.BooleanVar(value=True)
+        ctk.CTkCheckBox(main, text="Reuse videos already generated from identical scenes (cache)",
+                        variable=self.cache_var, font=("Segoe UI", 12)).pack(anchor="w", pady=(12, 0))
+
         # Buttons
         btn_frame = ctk.CTkFrame(main, fg_color="transparent")
         btn_frame.pack(fill="x", pady=(20, 0))
@@ -105,12 +146,15 @@ class SettingsDialog(ctk.CTkToplevel):
                       command=self._save).pack(side="right", padx=(0, 10))
 
     def _load_values(self):
-        keys = self.config.get("api_keys", {})
         for key, entry in self.key_entries.items():
-            val = keys.get(key, "")
+            val = ", ".join(get_api_keys(self.config, key))
             if val:
                 entry.insert(0, val)
         self.model_var.set(self.config.get("settings", {}).get("chatgpt_model", "gpt-4o"))
+        for key, entry in self.concurrency_entries.items():
+            entry.insert(0, str(get_max_concurrent(self.config, key)))
+        self.engine_var.set(self.config.get("settings", {}).get("engine", "threads"))
+        self.cache_var.set(self.config.get("settings", {}).get("generation_cache", True))
 
     def _toggle_show(self):
         show = "" if self.show_var.get() else "*"
@@ -118,16 +162,22 @@ class SettingsDialog(ctk.CTkToplevel):
             entry.configure(show=show)
 
     def _test_key(self, provider: str):
-        api_key = self.key_entries[provider].get().strip()
+        api_keys = parse_api_keys(self.key_entries[provider].get())
         lbl = self.status_labels[provider]
-        if not api_key:
+        if not api_keys:
             lbl.configure(text="No key entered", text_color=RED)
             return
 
         lbl.configure(text="Testing...", text_color=BLUE)
 
         def run_test():
-            ok, msg = _test_api_key(provider, api_key)
+            results = [_test_api_key(provider, k) for k in api_keys]
+            if len(results) == 1:
+                ok, msg = results[0]
+            else:
+                valid = sum(1 for ok, _ in results if ok)
+                ok = valid == len(results)
+                msg = f"{valid}/{len(results)} keys valid"
             self.after(0, lambda: lbl.configure(
                 text=msg, text_color=GREEN if ok else RED
             ))
@@ -136,17 +186,32 @@ class SettingsDialog(ctk.CTkToplevel):
 
     def _save(self):
         for key, entry in self.key_entries.items():
-            self.config["api_keys"][key] = entry.get().strip()
+            self.config["api_keys"][key] = ", ".join(parse_api_keys(entry.get()))
         self.config["settings"]["chatgpt_model"] = self.model_var.get()
+        limits = {}
+        for key, entry in self.concurrency_entries.items():
+            try:
+                limits[key] = max(1, int(entry.get().strip()))
+            except ValueError:
+                limits[key] = get_max_concurrent(self.config, key)
+        self.config["settings"]["max_concurrent"] = limits
+        self.config["settings"]["engine"] = self.engine_var.get()
+        self.config["settings"]["generation_cache"] = self.cache_var.get()
         save_config(self.config)
         self.destroy()
 
 
 def _test_api_key(provider: str, api_key: str) -> tuple[bool, str]:
+    # SDKs are imported on the worker thread, only when a key is tested
+    import requests
+
     try:
         if provider == "openai":
-            client = openai.OpenAI(api_key=api_key)
-            client.models.list()
+            import openai
+            try:
+                openai.OpenAI(api_key=api_key).models.list()
+            except openai.AuthenticationError:
+                return False, "Invalid key"
             return True, "Connected"
 
         elif provider == "veo3":
@@ -188,8 +253,6 @@ def _test_api_key(provider: str, api_key: str) -> tuple[bool, str]:
 
         return False, "Unknown"
 
-    except openai.AuthenticationError:
-        return False, "Invalid key"
     except requests.ConnectionError:
         return False, "No connection"
     except requests.Timeout:
@@ -0,0 +1,37 @@
+"""
+Provider registry.
+
+Provider modules are imported on first use, so starting the app does not
+load google-genai or any other SDK; only the providers a run actually
+creates are imported. build.spec lists every module in hiddenimports
+because PyInstaller cannot see imports made through importlib.
+"""
+import importlib
+import threading
+
+# Config key -> "module:class"
+REGISTRY = {
+    "kling": "providers.kling:KlingProvider",
+    "minimax": "providers.minimax:MinimaxProvider",
+    "runway": "providers.runway:RunwayProvider",
+    "veo3": "providers.veo3:Veo3Provider",
+}
+
+PROVIDER_NAMES = tuple(REGISTRY)
+
+_classes: dict = {}
+_lock = threading.Lock()
+
+
+def get_provider_class(name: str):
+    """Provider class for a config key, importing its module the first time."""
+    cls = _classes.get(name)
+    if cls is not None:
+        return cls
+    if name not in REGISTRY:
+        raise ValueError(f"Unknown provider: {name}")
+    module_name, class_name = REGISTRY[name].split(":")
+    with _lock:
+        if name not in _classes:
+            _classes[name] = getattr(importlib.import_module(module_name), class_name)
+    return _classes[name]
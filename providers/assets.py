@@ -0,0 +1,108 @@
+import io
+import os
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Provider -> how images are sent. Larger images do not improve the result
+# (the video is at most 1080p) and only slow the submit down or exceed the
+# request size limit.
+PROFILES = {
+    "kling": {"max_side": 1920, "format": "JPEG", "quality": 92},
+    "runway": {"max_side": 1280, "format": "JPEG", "quality": 92},
+    "minimax": {"max_side": 1920, "format": "JPEG", "quality": 92},
+    "veo3": {"max_side": 1920, "format": "JPEG", "quality": 95},
+}
+DEFAULT_PROFILE = {"max_side": 1920, "format": "JPEG", "quality": 92}
+
+MIME_TYPES = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg",
+              ".webp": "image/webp"}
+CACHE_SIZE = 64
+
+_digests: dict = {}                     # (path, mtime_ns, size) -> sha1 of the file
+_prepared: OrderedDict = OrderedDict()  # (sha1, provider) -> PreparedImage
+_lock = threading.Lock()
+
+
+class PreparedImage:
+    """Image bytes ready to send to one provider, with the base64 form computed once."""
+
+    def __init__(self, data: bytes, mime: str, width: int = 0, height: int = 0):
+        self.data = data
+        self.mime = mime
+        self.width = width
+        self.height = height
+        self._b64 = None
+
+    @property
+    def b64(self) -> str:
+        if self._b64 is None:
+            self._b64 = base64.b64encode(self.data).decode()
+        return self._b64
+
+    @property
+    def data_uri(self) -> str:
+        return f"data:{self.mime};base64,{self.b64}"
+
+
+def _encode(data: bytes, path: str, profile: dict) -> PreparedImage:
+    """Resize to the profile's longest side and re-encode; the original bytes if that fails."""
+    mime = MIME_TYPES.get(os.path.splitext(path)[1].lower(), "image/png")
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as img:
+            source_format = img.format
+            resized = img.convert("RGB")
+            if max(resized.size) > profile["max_side"]:
+                resized.thumbnail((profile["max_side"], profile["max_side"]), Image.LANCZOS)
+            out = io.BytesIO()
+            resized.save(out, profile["format"], quality=profile["quality"], optimize=True)
+        width, height = resized.size
+        if (source_format in ("JPEG", "PNG") and (width, height) == img.size
+                and out.tell() >= len(data)):
+            # Already small; keep the original rather than a lossy copy of it
+            return PreparedImage(data, Image.MIME[source_format], width, height)
+        return PreparedImage(out.getvalue(), Image.MIME[profile["format"]], width, height)
+    except Exception:
+        return PreparedImage(data, mime)
+
+
+def content_hash(path: str) -> str:
+    """sha1 of the file, remembered per (path, mtime, size) so unchanged files are not re-read."""
+    st = os.stat(path)
+    file_key = (path, st.st_mtime_ns, st.st_size)
+    with _lock:
+        digest = _digests.get(file_key)
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        with _lock:
+            if len(_digests) > CACHE_SIZE * 16:
+                _digests.clear()
+            _digests[file_key] = digest
+    return digest
+
+
+def prepare_image(path: str, provider: str) -> PreparedImage:
+    """
+    Image at path, prepared for provider (see PROFILES).
+
+    Results are memoized by file content, so a chain frame or reference image
+    is read and encoded once however many scenes and retries use it.
+    """
+    key = (content_hash(path), provider)
+    with _lock:
+        prepared = _prepared.get(key)
+        if prepared is not None:
+            _prepared.move_to_end(key)
+            return prepared
+
+    with open(path, "rb") as f:
+        prepared = _encode(f.read(), path, PROFILES.get(provider, DEFAULT_PROFILE))
+    with _lock:
+        _prepared[key] = prepared
+        while len(_prepared) > CACHE_SIZE:
+            _prepared.popitem(last=False)
+    return prepared
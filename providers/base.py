@@ -1,14 +1,21 @@
+import asyncio
 from abc import ABC, abstractmethod
 
+from . import rate_limit, transport
+from .download import download_file, adownload_file
+
 
 class BaseProvider(ABC):
     """Abstract base class for all AI video generation providers."""
 
     name: str = "base"
     supports_image_to_video: bool = False
+    warm_url: str = ""   # any URL on the API host, opened by warm_up()
 
     def __init__(self, api_key: str):
         self.api_key = api_key
+        self._aclient = None       # httpx.AsyncClient, created per event loop
+        self._aclient_loop = None
 
     @abstractmethod
     def submit_text_to_video(self, prompt: str, duration: int = 8,
@@ -29,10 +36,114 @@ class BaseProvider(ABC):
                   "video_url": str|None, "error": str|None}
         """
 
-    @abstractmethod
     def download_video(self, video_url: str, save_path: str) -> str:
         """Download video to local path. Returns save_path."""
+        return self._download(video_url, save_path)
 
     def get_cost_estimate(self, duration: int, resolution: str) -> float:
         """Estimated cost per video in USD. Override in subclass."""
         return 0.0
+
+    def cache_identity(self) -> dict | None:
+        """
+        Provider settings that change the generated video, as a JSON-able dict
+        (the scene's prompt, image, seed, duration and resolution are added by
+        the TaskManager). None if results cannot be cached. Subclasses add
+        their model and options.
+        """
+        return {"provider": self.name}
+
+    def task_namespace(self) -> str:
+        """What this provider's task ids are valid for (a journaled id is re-attached only here)."""
+        return self.name
+
+    def warm_up(self):
+        """
+        Open connections (and create SDK clients) before the first request.
+        Blocks for up to a few seconds, so call it from a background thread.
+        """
+        if self.warm_url:
+            transport.warm_up(self.warm_url)
+
+    def _http(self, url: str):
+        """Pooled keep-alive session for url's host; use instead of module-level requests calls."""
+        return transport.session(url)
+
+    # ─── Rate limiting ────────────────────────────────────────────
+    # Call before every API request: kind is "submit", "poll" or "download".
+
+    def _throttle(self, kind: str):
+        """Wait for a rate-limit token (and check the daily quota before submits)."""
+        if kind == "submit":
+            rate_limit.check_quota(self.name, self.api_key)
+        bucket = rate_limit.get_bucket(self.name, self.api_key, kind)
+        if bucket:
+            bucket.acquire()
+
+    async def _athrottle(self, kind: str):
+        if kind == "submit":
+            rate_limit.check_quota(self.name, self.api_key)
+        bucket = rate_limit.get_bucket(self.name, self.api_key, kind)
+        if bucket:
+            await bucket.aacquire()
+
+    def _count_submit(self):
+        """Count an accepted submit against the daily quota."""
+        rate_limit.count_submit(self.name, self.api_key)
+
+    # ─── Async API ────────────────────────────────────────────────
+    # Used by the asyncio engine. The defaults run the blocking methods in a
+    # worker thread; providers override them with native async HTTP calls.
+
+    async def asubmit_text_to_video(self, prompt: str, duration: int = 8,
+                                    resolution: str = "720p", seed: int = 0) -> str:
+        return await asyncio.to_thread(self.submit_text_to_video, prompt, duration,
+                                       resolution, seed)
+
+    async def asubmit_image_to_video(self, prompt: str, image_path: str,
+                                     duration: int = 8, resolution: str = "720p",
+                                     seed: int = 0) -> str:
+        return await asyncio.to_thread(self.submit_image_to_video, prompt, image_path,
+                                       duration, resolution, seed)
+
+    async def acheck_status(self, task_id: str) -> dict:
+        return await asyncio.to_thread(self.check_status, task_id)
+
+    async def adownload_video(self, video_url: str, save_path: str) -> str:
+        return await self._adownload(video_url, save_path)
+
+    async def aclose(self):
+        """Release async resources held for the current event loop."""
+        if self._aclient is not None:
+            client, self._aclient, self._aclient_loop = self._aclient, None, None
+            await client.aclose()
+
+    def _async_client(self):
+        """httpx.AsyncClient bound to the running event loop (created lazily)."""
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            size = transport.pool_size()
+            self._aclient = httpx.AsyncClient(
+                timeout=60, http2=transport.http2_enabled(),
+                limits=httpx.Limits(max_connections=max(200, size), max_keepalive_connections=size),
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    # ─── Downloads ────────────────────────────────────────────────
+    # Parallel ranged segments, resume from .part files, atomic rename
+    # (see download.py).
+
+    def _download(self, url: str, save_path: str, headers: dict = None,
+                  timeout: float = 120) -> str:
+        self._throttle("download")
+        return download_file(url, save_path, headers=headers, timeout=timeout,
+                             session=self._http(url))
+
+    async def _adownload(self, url: str, save_path: str, headers: dict = None,
+                         timeout: float = 120) -> str:
+        await self._athrottle("download")
+        return await adownload_file(self._async_client(), url, save_path,
+                                    headers=headers, timeout=timeout)
@@ -0,0 +1,237 @@
+import time
+import threading
+
+from .base import BaseProvider
+from core.retry import PERMANENT, classify_error, status_code
+
+EMA_ALPHA = 0.3
+DEFAULT_LATENCY = 180     # seconds, until a member has finished a job
+ERROR_COOLDOWN = 60       # seconds a member is skipped after a failed call
+
+
+def _member_fault(exc: Exception) -> bool:
+    """A submit error caused by the member (its load, outage or key), not by the request."""
+    if classify_error(exc) != PERMANENT:
+        return True
+    return status_code(exc) in (401, 403) or "api key" in str(exc).lower()
+
+
+class Member:
+    """Dispatch state for one provider wrapped by a CompositeProvider."""
+
+    def __init__(self, tag: str, provider: BaseProvider, capacity: int = 1):
+        self.tag = tag
+        self.provider = provider
+        self.capacity = max(1, capacity)
+        self.in_flight = 0
+        self.latency = None        # EMA of submit -> completed, seconds
+        self.cooldown_until = 0.0
+        self.failures = 0
+
+    def expected_latency(self) -> float:
+        return self.latency if self.latency is not None else DEFAULT_LATENCY
+
+    def available(self, now: float) -> bool:
+        return now >= self.cooldown_until
+
+
+class CompositeProvider(BaseProvider):
+    """
+    A provider that dispatches each submit to one of several member providers.
+
+    Subclasses decide the order members are tried in (_rank). Task ids are
+    returned as "<member tag>:<task id>" so status checks and downloads go
+    back to the member that owns the job, including after a resume. A member
+    that errors on submit (rate limit, outage, bad key) is put on cooldown and
+    the next one is tried; a refused request (content policy, bad input) is
+    raised as is, since every member would refuse it.
+    """
+
+    def __init__(self, name: str, members: list[Member]):
+        super().__init__("")
+        if not members:
+            raise ValueError(f"{type(self).__name__} needs at least one provider")
+        self.name = name
+        self.members = {m.tag: m for m in members}
+        self.supports_image_to_video = any(m.provider.supports_image_to_video for m in members)
+        self._submitted: dict[str, float] = {}  # tagged task_id -> submit time
+        self._url_owner: dict[str, str] = {}    # video_url -> member tag
+        self._lock = threading.Lock()
+
+    def total_capacity(self) -> int:
+        return sum(m.capacity for m in self.members.values())
+
+    def _rank(self, needs_image: bool) -> list[Member]:
+        """Members to try for a new submit, best first. Called under the lock."""
+        raise NotImplementedError
+
+    def _after_status(self, task_id: str, member: Member, result: dict) -> dict:
+        """Hook to adjust a non-final status result (e.g. enforce a latency SLO)."""
+        return result
+
+    def _candidates(self, needs_image: bool) -> list[Member]:
+        with self._lock:
+            return self._rank(needs_image)
+
+    def _owner(self, task_id: str) -> tuple[Member, str]:
+        tag, _, inner = task_id.partition(":")
+        member = self.members.get(tag)
+        if member is None:
+            raise ValueError(f"No provider for task id {task_id} in {self.name}")
+        return member, inner
+
+    def _on_submitted(self, member: Member, inner_id: str) -> str:
+        task_id = f"{member.tag}:{inner_id}"
+        with self._lock:
+            member.in_flight += 1
+            member.failures = 0
+            self._submitted[task_id] = time.monotonic()
+        return task_id
+
+    def _on_error(self, member: Member, cooldown: float = ERROR_COOLDOWN):
+        with self._lock:
+            member.failures += 1
+            member.cooldown_until = time.monotonic() + cooldown * member.failures
+
+    def _on_status(self, task_id: str, member: Member, result: dict) -> dict:
+        if result.get("status") not in ("completed", "failed"):
+            return self._after_status(task_id, member, result)
+
+        now = time.monotonic()
+        with self._lock:
+            started = self._submitted.pop(task_id, None)
+            if started is not None:
+                member.in_flight = max(0, member.in_flight - 1)
+            if result.get("status") == "completed":
+                if started is not None:
+                    elapsed = now - started
+                    member.latency = elapsed if member.latency is None else (
+                        EMA_ALPHA * elapsed + (1 - EMA_ALPHA) * member.latency)
+                if result.get("video_url"):
+                    self._url_owner[result["video_url"]] = member.tag
+            else:
+                member.cooldown_until = max(member.cooldown_until, now + ERROR_COOLDOWN)
+        return result
+
+    def _release(self, task_id: str, member: Member):
+        """Stop tracking a job that is being abandoned."""
+        with self._lock:
+            if self._submitted.pop(task_id, None) is not None:
+                member.in_flight = max(0, member.in_flight - 1)
+
+    def _on_poll_error(self, task_id: str, member: Member, exc: Exception):
+        """A permanent poll error ends the job for TaskManager: free its slot."""
+        if classify_error(exc) == PERMANENT:
+            self._release(task_id, member)
+
+    def _reset_in_flight(self):
+        """Forget jobs of a finished run (stopped or given up ones never reported back)."""
+        with self._lock:
+            self._submitted.clear()
+            for member in self.members.values():
+                member.in_flight = 0
+
+    def _download_owner(self, video_url: str) -> BaseProvider:
+        tag = self._url_owner.get(video_url)
+        if tag in self.members:
+            return self.members[tag].provider
+        return next(iter(self.members.values())).provider
+
+    # ─── BaseProvider ─────────────────────────────────────────────
+
+    def _submit(self, needs_image: bool, call) -> str:
+        last_error = None
+        for member in self._candidates(needs_image):
+            try:
+                inner_id = call(member.provider)
+            except Exception as e:
+                if not _member_fault(e):
+                    raise
+                last_error = e
+                self._on_error(member)
+                continue
+            return self._on_submitted(member, inner_id)
+        raise last_error or RuntimeError(f"No provider available in {self.name}")
+
+    def submit_text_to_video(self, prompt: str, duration: int = 8,
+                             resolution: str = "720p", seed: int = 0) -> str:
+        return self._submit(False, lambda p: p.submit_text_to_video(
+            prompt, duration, resolution, seed))
+
+    def submit_image_to_video(self, prompt: str, image_path: str,
+                              duration: int = 8, resolution: str = "720p",
+                              seed: int = 0) -> str:
+        return self._submit(True, lambda p: p.submit_image_to_video(
+            prompt, image_path, duration, resolution, seed))
+
+    def check_status(self, task_id: str) -> dict:
+        member, inner = self._owner(task_id)
+        try:
+            result = member.provider.check_status(inner)
+        except Exception as e:
+            self._on_poll_error(task_id, member, e)
+            raise
+        return self._on_status(task_id, member, result)
+
+    def download_video(self, video_url: str, save_path: str) -> str:
+        return self._download_owner(video_url).download_video(video_url, save_path)
+
+    def get_cost_estimate(self, duration: int, resolution: str) -> float:
+        """Upper bound: the most expensive member."""
+        return max(m.provider.get_cost_estimate(duration, resolution)
+                   for m in self.members.values())
+
+    def cache_identity(self) -> dict | None:
+        return None   # the member that runs a job is only known at submit time
+
+    def task_namespace(self) -> str:
+        # Tagged ids only resolve with the same members (keys or providers)
+        return f"{self.name}[{','.join(sorted(self.members))}]"
+
+    def warm_up(self):
+        for member in self.members.values():
+            member.provider.warm_up()
+
+    # ─── Async ────────────────────────────────────────────────────
+
+    async def _asubmit(self, needs_image: bool, call) -> str:
+        last_error = None
+        for member in self._candidates(needs_image):
+            try:
+                inner_id = await call(member.provider)
+            except Exception as e:
+                if not _member_fault(e):
+                    raise
+                last_error = e
+                self._on_error(member)
+                continue
+            return self._on_submitted(member, inner_id)
+        raise last_error or RuntimeError(f"No provider available in {self.name}")
+
+    async def asubmit_text_to_video(self, prompt: str, duration: int = 8,
+                                    resolution: str = "720p", seed: int = 0) -> str:
+        return await self._asubmit(False, lambda p: p.asubmit_text_to_video(
+            prompt, duration, resolution, seed))
+
+    async def asubmit_image_to_video(self, prompt: str, image_path: str,
+                                     duration: int = 8, resolution: str = "720p",
+                                     seed: int = 0) -> str:
+        return await self._asubmit(True, lambda p: p.asubmit_image_to_video(
+            prompt, image_path, duration, resolution, seed))
+
+    async def acheck_status(self, task_id: str) -> dict:
+        member, inner = self._owner(task_id)
+        try:
+            result = await member.provider.acheck_status(inner)
+        except Exception as e:
+            self._on_poll_error(task_id, member, e)
+            raise
+        return self._on_status(task_id, member, result)
+
+    async def adownload_video(self, video_url: str, save_path: str) -> str:
+        return await self._download_owner(video_url).adownload_video(video_url, save_path)
+
+    async def aclose(self):
+        self._reset_in_flight()
+        for member in self.members.values():
+            await member.provider.aclose()
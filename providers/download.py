@@ -0,0 +1,298 @@
+"""
+Download engine shared by every provider.
+
+A download writes to "<file>.part" and is renamed into place only once its
+size is verified, so a half-written video never looks finished. When the
+server supports Range requests, large files are fetched as a few parallel
+segments; the segment layout is kept in "<file>.part.json" and each segment
+in its own part file, so a retry continues where the last attempt stopped
+instead of starting over.
+"""
+import os
+import json
+import asyncio
+import shutil
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK = 1024 * 1024             # read size and file buffer
+SEGMENT_MIN = 8 * 1024 * 1024   # smaller files are not split
+MAX_SEGMENTS = 4
+
+_CONTENT_RANGE = re.compile(r"bytes\s+\d+-\d+/(\d+)")
+
+
+class CannotResume(Exception):
+    """The server ignored the Range request or the file changed; start over."""
+
+
+class _Download:
+    """One file being downloaded: target paths, segment plan and request headers."""
+
+    def __init__(self, url: str, save_path: str, headers: dict = None, timeout: float = 120):
+        self.url = url
+        self.save_path = save_path
+        self.part = save_path + ".part"
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.total = None                 # full size, None if the server did not say
+        self.plan = [(0, None)]           # inclusive byte ranges; (0, None) = no ranges
+        self.validator = ""               # ETag / Last-Modified of the first response
+
+    # ─── Plan ─────────────────────────────────────────────────────
+
+    def load(self) -> bool:
+        """Pick up the plan of an interrupted download. False if there is none."""
+        try:
+            with open(self.part + ".json", "r", encoding="utf-8") as f:
+                state = json.load(f)
+            self.total = state["size"]
+            self.plan = [tuple(r) for r in state["segments"]]
+            self.validator = state.get("validator", "")
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+    def start(self, status: int, headers):
+        """Plan the download from the first response (a reply to "Range: bytes=0-")."""
+        self.discard()
+        self.total = _total_size(status, headers)
+        if status != 206 or not self.total:
+            self.plan = [(0, None)]
+            return
+        count = max(1, min(MAX_SEGMENTS, self.total // SEGMENT_MIN))
+        bounds = [self.total * i // count for i in range(count + 1)]
+        self.plan = [(bounds[i], bounds[i + 1] - 1) for i in range(count)]
+        self.validator = headers.get("ETag") or headers.get("Last-Modified") or ""
+        with open(self.part + ".json", "w", encoding="utf-8") as f:
+            json.dump({"size": self.total, "segments": self.plan,
+                       "validator": self.validator}, f)
+
+    def discard(self):
+        for path in [self.part + ".json"] + [self.segment_path(i) for i in range(MAX_SEGMENTS)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def segment_path(self, index: int) -> str:
+        return self.part if index == 0 else f"{self.part}{index}"
+
+    def first_length(self) -> int | None:
+        start, end = self.plan[0]
+        return None if end is None else end - start + 1
+
+    def missing(self, first: int = 0) -> list[tuple[int, int, int]]:
+        """(segment, offset, end) for every segment not yet complete."""
+        todo = []
+        for i in range(first, len(self.plan)):
+            start, end = self.plan[i]
+            offset = start + self.segment_size(i)
+            if offset <= end:
+                todo.append((i, offset, end))
+        return todo
+
+    def segment_size(self, index: int) -> int:
+        """Bytes held for a segment; anything written past its range is cut off."""
+        start, end = self.plan[index]
+        path = self.segment_path(index)
+        size = _size(path)
+        if end is not None and size > end - start + 1:
+            size = end - start + 1
+            with open(path, "r+b") as f:
+                f.truncate(size)
+        return size
+
+    def range_headers(self, start: int, end: int = None) -> dict:
+        headers = {**self.headers, "Range": f"bytes={start}-{'' if end is None else end}"}
+        if self.validator and end is not None:
+            headers["If-Range"] = self.validator   # a changed file comes back as 200
+        return headers
+
+    def check_range(self, status: int, headers):
+        if status != 206 or _total_size(status, headers) != self.total:
+            raise CannotResume(self.url)
+
+    # ─── Completion ───────────────────────────────────────────────
+
+    def finish(self) -> str:
+        """Check every segment, join them and move the file into place."""
+        if self.plan[0][1] is None:
+            # No ranges: nothing to resume, so a short file is simply discarded
+            size = _size(self.part)
+            if self.total is not None and size != self.total:
+                self.discard()
+                raise IOError(f"Incomplete download: {size} of {self.total} bytes")
+        else:
+            for i, (start, end) in enumerate(self.plan):
+                size = self.segment_size(i)
+                if size != end - start + 1:
+                    # Parts are kept: the retry fetches only what is missing
+                    raise IOError(f"Incomplete download: segment {i + 1}/{len(self.plan)} "
+                                  f"has {size} of {end - start + 1} bytes")
+            with open(self.part, "ab") as out:
+                for i in range(1, len(self.plan)):
+                    with open(self.segment_path(i), "rb") as src:
+                        shutil.copyfileobj(src, out, CHUNK)
+            size = _size(self.part)
+            if size != self.total:
+                self.discard()
+                raise IOError(f"Download size mismatch: {size} of {self.total} bytes")
+        os.replace(self.part, self.save_path)
+        self.discard()   # the plan and segment files; the part itself was moved
+        return self.save_path
+
+
+def _size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _total_size(status: int, headers) -> int | None:
+    """Full file size from a 206 Content-Range or a 200 Content-Length."""
+    if status == 206:
+        match = _CONTENT_RANGE.match(headers.get("Content-Range", ""))
+        return int(match.group(1)) if match else None
+    if headers.get("Content-Encoding"):
+        return None   # Content-Length is the compressed size
+    length = headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else None
+
+
+def _clip(chunk: bytes, limit: int | None) -> tuple[bytes, int | None]:
+    if limit is None:
+        return chunk, None
+    chunk = chunk[:limit]
+    return chunk, limit - len(chunk)
+
+
+# ─── Blocking (requests) ──────────────────────────────────────────
+
+def download_file(url: str, save_path: str, headers: dict = None, timeout: float = 120,
+                  session=None) -> str:
+    """Download url to save_path, in parallel ranged segments when the server allows."""
+    import requests
+
+    http = session or requests
+    job = _Download(url, save_path, headers, timeout)
+    os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
+    if job.load():
+        try:
+            _fetch_missing(http, job)
+            return job.finish()
+        except CannotResume:
+            pass
+
+    # The first request doubles as segment 0 when the server supports ranges
+    resp = http.get(url, headers=job.range_headers(0), stream=True, timeout=timeout)
+    with resp:
+        resp.raise_for_status()
+        job.start(resp.status_code, resp.headers)
+        if len(job.plan) == 1:
+            _write(resp, job.part, job.first_length())
+        else:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                rest = pool.submit(_fetch_missing, http, job, 1)
+                _write(resp, job.part, job.first_length())
+                rest.result()
+    return job.finish()
+
+
+def _fetch_missing(http, job: _Download, first: int = 0):
+    todo = job.missing(first)
+    if len(todo) == 1:
+        _fetch_range(http, job, *todo[0])
+    elif todo:
+        with ThreadPoolExecutor(max_workers=len(todo)) as pool:
+            for f in [pool.submit(_fetch_range, http, job, *t) for t in todo]:
+                f.result()
+
+
+def _fetch_range(http, job: _Download, index: int, offset: int, end: int):
+    resp = http.get(job.url, headers=job.range_headers(offset, end), stream=True,
+                    timeout=job.timeout)
+    with resp:
+        resp.raise_for_status()
+        job.check_range(resp.status_code, resp.headers)
+        _write(resp, job.segment_path(index), end - offset + 1, "ab")
+
+
+def _write(resp, path: str, limit: int | None, mode: str = "wb"):
+    """Copy the body to path, stopping after limit bytes."""
+    with open(path, mode, buffering=CHUNK) as f:
+        for chunk in resp.iter_content(chunk_size=CHUNK):
+            chunk, limit = _clip(chunk, limit)
+            f.write(chunk)
+            if limit == 0:
+                break
+
+
+# ─── Async (httpx) ────────────────────────────────────────────────
+
+async def adownload_file(client, url: str, save_path: str, headers: dict = None,
+                         timeout: float = 120) -> str:
+    """
+    download_file with an httpx.AsyncClient. File work (segment writes, and
+    joining and verifying the result) runs in worker threads, so a large
+    video does not stall the event loop.
+    """
+    job = _Download(url, save_path, headers, timeout)
+    os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
+    if await asyncio.to_thread(job.load):
+        try:
+            await _afetch_missing(client, job)
+            return await asyncio.to_thread(job.finish)
+        except CannotResume:
+            pass
+
+    async with client.stream("GET", url, headers=job.range_headers(0), timeout=timeout,
+                             follow_redirects=True) as resp:
+        resp.raise_for_status()
+        await asyncio.to_thread(job.start, resp.status_code, resp.headers)
+        await _all(_awrite(resp, job.part, job.first_length()),
+                   _afetch_missing(client, job, 1))
+    return await asyncio.to_thread(job.finish)
+
+
+async def _all(*coros):
+    """
+    Run coros concurrently. On the first failure the others are cancelled
+    and awaited before it is raised, so no segment is still being appended
+    to when the download is retried.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _afetch_missing(client, job: _Download, first: int = 0):
+    todo = await asyncio.to_thread(job.missing, first)
+    await _all(*(_afetch_range(client, job, *t) for t in todo))
+
+
+async def _afetch_range(client, job: _Download, index: int, offset: int, end: int):
+    async with client.stream("GET", job.url, headers=job.range_headers(offset, end),
+                             timeout=job.timeout, follow_redirects=True) as resp:
+        resp.raise_for_status()
+        job.check_range(resp.status_code, resp.headers)
+        await _awrite(resp, job.segment_path(index), end - offset + 1, "ab")
+
+
+async def _awrite(resp, path: str, limit: int | None, mode: str = "wb"):
+    """_write for an httpx response; the file is written from a worker thread."""
+    f = await asyncio.to_thread(open, path, mode, buffering=CHUNK)
+    try:
+        async for chunk in resp.aiter_bytes(chunk_size=CHUNK):
+            chunk, limit = _clip(chunk, limit)
+            await asyncio.to_thread(f.write, chunk)
+            if limit == 0:
+                break
+    finally:
+        await asyncio.to_thread(f.close)
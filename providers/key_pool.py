@@ -0,0 +1,42 @@
+import time
+
+from .base import BaseProvider
+from .composite import CompositeProvider, Member
+from . import rate_limit
+
+
+class KeyPoolProvider(CompositeProvider):
+    """Spreads one provider's jobs over its API keys: least-loaded key with quota left first."""
+
+    def __init__(self, providers: list[BaseProvider], capacity_per_key: int = 1):
+        if not providers:
+            raise ValueError("KeyPoolProvider needs at least one API key")
+        super().__init__(providers[0].name, [
+            Member(rate_limit.key_fingerprint(p.api_key), p, capacity_per_key)
+            for p in providers
+        ])
+
+    def cache_identity(self) -> dict | None:
+        # Every key runs the same provider and options
+        return next(iter(self.members.values())).provider.cache_identity()
+
+    @property
+    def key_count(self) -> int:
+        return len(self.members)
+
+    def _rank(self, needs_image: bool) -> list[Member]:
+        now = time.monotonic()
+        members = list(self.members.values())
+        quota = {m.tag: rate_limit.remaining_quota(self.name, m.provider.api_key)
+                 for m in members}
+        usable = [m for m in members if quota[m.tag] != 0 and m.available(now)]
+        if not usable:
+            # Nothing left: try the soonest-available key so the real error surfaces
+            return sorted(members, key=lambda m: m.cooldown_until)
+
+        def load(m: Member):
+            full = m.in_flight >= m.capacity
+            left = quota[m.tag]
+            return (full, m.in_flight / m.capacity, -(left if left is not None else float("inf")))
+
+        return sorted(usable, key=load)
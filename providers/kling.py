@@ -1,6 +1,6 @@
-import requests
-import os
+import asyncio
 from .base import BaseProvider
+from .assets import prepare_image
 
 BASE_URL = "https://api.klingapi.com/v1"
 
@@ -8,6 +8,7 @@ BASE_URL = "https://api.klingapi.com/v1"
 class KlingProvider(BaseProvider):
     name = "kling"
     supports_image_to_video = True
+    warm_url = BASE_URL
 
     def __init__(self, api_key: str, model: str = "kling-v1"):
         super().__init__(api_key)
@@ -19,11 +20,9 @@ class KlingProvider(BaseProvider):
             "Content-Type": "application/json",
         }
 
-    def submit_text_to_video(self, prompt: str, duration: int = 8,
-                             resolution: str = "720p", seed: int = 0) -> str:
-        url = f"{BASE_URL}/videos/text2video"
+    def _text_payload(self, prompt: str, duration: int) -> dict:
         duration = max(5, min(duration, 10))
-        payload = {
+        return {
             "model_name": self.model,
             "prompt": prompt,
             "cfg_scale": 0.5,
@@ -32,64 +31,95 @@ class KlingProvider(BaseProvider):
             "aspect_ratio": "16:9",
         }
 
-        resp = requests.post(url, json=payload, headers=self._headers(), timeout=60)
-        resp.raise_for_status()
-        data = resp.json()
+    def _image_payload(self, prompt: str, image_path: str, duration: int) -> dict:
+        payload = self._text_payload(prompt, duration)
+        payload["image"] = prepare_image(image_path, self.name).b64
+        return payload
+
+    @staticmethod
+    def _task_id(data: dict) -> str:
         # Kling returns {"code": 0, "data": {"task_id": "..."}}
         task_data = data.get("data", {})
         return task_data.get("task_id", "")
 
+    @staticmethod
+    def _parse_status(data: dict) -> dict:
+        task_data = data.get("data", {})
+        status = task_data.get("task_status", "")
+
+        if status == "succeed":
+            works = task_data.get("task_result", {}).get("videos", [])
+            video_url = works[0].get("url", "") if works else ""
+            return {"status": "completed", "video_url": video_url}
+        elif status == "failed":
+            return {"status": "failed", "error": task_data.get("task_status_msg", "Unknown")}
+        else:
+            return {"status": "processing"}
+
+    def submit_text_to_video(self, prompt: str, duration: int = 8,
+                             resolution: str = "720p", seed: int = 0) -> str:
+        url = f"{BASE_URL}/videos/text2video"
+        payload = self._text_payload(prompt, duration)
+
+        self._throttle("submit")
+        resp = self._http(url).post(url, json=payload, headers=self._headers(), timeout=60)
+        resp.raise_for_status()
+        self._count_submit()
+        return self._task_id(resp.json())
+
     def submit_image_to_video(self, prompt: str, image_path: str,
                               duration: int = 8, resolution: str = "720p",
                               seed: int = 0) -> str:
-        import base64
-        with open(image_path, "rb") as f:
-            image_b64 = base64.b64encode(f.read()).decode()
-
         url = f"{BASE_URL}/videos/image2video"
-        duration = max(5, min(duration, 10))
-        payload = {
-            "model_name": self.model,
-            "prompt": prompt,
-            "image": image_b64,
-            "cfg_scale": 0.5,
-            "mode": "std",
-            "duration": str(duration),
-            "aspect_ratio": "16:9",
-        }
+        payload = self._image_payload(prompt, image_path, duration)
 
-        resp = requests.post(url, json=payload, headers=self._headers(), timeout=60)
+        self._throttle("submit")
+        resp = self._http(url).post(url, json=payload, headers=self._headers(), timeout=60)
         resp.raise_for_status()
-        data = resp.json()
-        task_data = data.get("data", {})
-        return task_data.get("task_id", "")
+        self._count_submit()
+        return self._task_id(resp.json())
 
     def check_status(self, task_id: str) -> dict:
         url = f"{BASE_URL}/videos/text2video/{task_id}"
-        resp = requests.get(url, headers=self._headers(), timeout=30)
+        self._throttle("poll")
+        resp = self._http(url).get(url, headers=self._headers(), timeout=30)
         resp.raise_for_status()
-        data = resp.json()
+        return self._parse_status(resp.json())
 
-        task_data = data.get("data", {})
-        status = task_data.get("task_status", "")
+    # ─── Async ────────────────────────────────────────────────────
 
-        if status == "succeed":
-            works = task_data.get("task_result", {}).get("videos", [])
-            video_url = works[0].get("url", "") if works else ""
-            return {"status": "completed", "video_url": video_url}
-        elif status == "failed":
-            return {"status": "failed", "error": task_data.get("task_status_msg", "Unknown")}
-        else:
-            return {"status": "processing"}
+    async def asubmit_text_to_video(self, prompt: str, duration: int = 8,
+                                    resolution: str = "720p", seed: int = 0) -> str:
+        url = f"{BASE_URL}/videos/text2video"
+        payload = self._text_payload(prompt, duration)
 
-    def download_video(self, video_url: str, save_path: str) -> str:
-        resp = requests.get(video_url, stream=True, timeout=120)
+        await self._athrottle("submit")
+        resp = await self._async_client().post(url, json=payload, headers=self._headers(), timeout=60)
         resp.raise_for_status()
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        with open(save_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
-        return save_path
+        self._count_submit()
+        return self._task_id(resp.json())
+
+    async def asubmit_image_to_video(self, prompt: str, image_path: str,
+                                     duration: int = 8, resolution: str = "720p",
+                                     seed: int = 0) -> str:
+        url = f"{BASE_URL}/videos/image2video"
+        payload = await asyncio.to_thread(self._image_payload, prompt, image_path, duration)
+
+        await self._athrottle("submit")
+        resp = await self._async_client().post(url, json=payload, headers=self._headers(), timeout=60)
+        resp.raise_for_status()
+        self._count_submit()
+        return self._task_id(resp.json())
+
+    async def acheck_status(self, task_id: str) -> dict:
+        url = f"{BASE_URL}/videos/text2video/{task_id}"
+        await self._athrottle("poll")
+        resp = await self._async_client().get(url, headers=self._headers(), timeout=30)
+        resp.raise_for_status()
+        return self._parse_status(resp.json())
+
+    def cache_identity(self) -> dict:
+        return {**super().cache_identity(), "model": self.model}
 
     def get_cost_estimate(self, duration: int, resolution: str) -> float:
         # Kling: ~$0.01-0.05/video
@@ -1,7 +1,6 @@
-import requests
-import os
-import base64
+import asyncio
 from .base import BaseProvider
+from .assets import prepare_image
 
 BASE_URL = "https://api.minimaxi.chat/v1"
 
@@ -9,6 +8,7 @@ BASE_URL = "https://api.minimaxi.chat/v1"
 class MinimaxProvider(BaseProvider):
     name = "minimax"
     supports_image_to_video = True
+    warm_url = BASE_URL
 
     def __init__(self, api_key: str, model: str = "T2V-01"):
         super().__init__(api_key)
@@ -20,73 +20,125 @@ class MinimaxProvider(BaseProvider):
             "Content-Type": "application/json",
         }
 
-    def submit_text_to_video(self, prompt: str, duration: int = 8,
-                             resolution: str = "720p", seed: int = 0) -> str:
-        url = f"{BASE_URL}/video_generation"
-        payload = {
+    def _text_payload(self, prompt: str) -> dict:
+        return {
             "model": self.model,
             "prompt": prompt,
         }
 
-        resp = requests.post(url, json=payload, headers=self._headers(), timeout=60)
+    def _image_payload(self, prompt: str, image_path: str) -> dict:
+        payload = self._text_payload(prompt)
+        payload["first_frame_image"] = prepare_image(image_path, self.name).data_uri
+        return payload
+
+    @staticmethod
+    def _parse_status(data: dict) -> tuple[dict, str]:
+        """Returns (status dict, file_id). file_id is set when the video is ready."""
+        status = data.get("status", "")
+        if status == "Success":
+            file_id = data.get("file_id", "")
+            if file_id:
+                return {"status": "completed"}, file_id
+            return {"status": "failed", "error": "No file_id returned"}, ""
+        elif status == "Fail":
+            return {"status": "failed", "error": data.get("base_resp", {}).get("status_msg", "Unknown")}, ""
+        else:
+            return {"status": "processing"}, ""
+
+    def submit_text_to_video(self, prompt: str, duration: int = 8,
+                             resolution: str = "720p", seed: int = 0) -> str:
+        url = f"{BASE_URL}/video_generation"
+        payload = self._text_payload(prompt)
+
+        self._throttle("submit")
+        resp = self._http(url).post(url, json=payload, headers=self._headers(), timeout=60)
         resp.raise_for_status()
+        self._count_submit()
         data = resp.json()
         return data.get("task_id", "")
 
     def submit_image_to_video(self, prompt: str, image_path: str,
                               duration: int = 8, resolution: str = "720p",
                               seed: int = 0) -> str:
-        with open(image_path, "rb") as f:
-            image_b64 = base64.b64encode(f.read()).decode()
-
         url = f"{BASE_URL}/video_generation"
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "first_frame_image": f"data:image/png;base64,{image_b64}",
-        }
+        payload = self._image_payload(prompt, image_path)
 
-        resp = requests.post(url, json=payload, headers=self._headers(), timeout=60)
+        self._throttle("submit")
+        resp = self._http(url).post(url, json=payload, headers=self._headers(), timeout=60)
         resp.raise_for_status()
+        self._count_submit()
         data = resp.json()
         return data.get("task_id", "")
 
     def check_status(self, task_id: str) -> dict:
         url = f"{BASE_URL}/query/video_generation"
         params = {"task_id": task_id}
-        resp = requests.get(url, params=params, headers=self._headers(), timeout=30)
+        self._throttle("poll")
+        resp = self._http(url).get(url, params=params, headers=self._headers(), timeout=30)
         resp.raise_for_status()
-        data = resp.json()
 
-        status = data.get("status", "")
-        if status == "Success":
-            file_id = data.get("file_id", "")
-            if file_id:
-                video_url = self._get_download_url(file_id)
-                return {"status": "completed", "video_url": video_url}
-            return {"status": "failed", "error": "No file_id returned"}
-        elif status == "Fail":
-            return {"status": "failed", "error": data.get("base_resp", {}).get("status_msg", "Unknown")}
-        else:
-            return {"status": "processing"}
+        result, file_id = self._parse_status(resp.json())
+        if file_id:
+            result["video_url"] = self._get_download_url(file_id)
+        return result
 
     def _get_download_url(self, file_id: str) -> str:
         url = f"{BASE_URL}/files/retrieve"
         params = {"file_id": file_id}
-        resp = requests.get(url, params=params, headers=self._headers(), timeout=30)
+        self._throttle("poll")
+        resp = self._http(url).get(url, params=params, headers=self._headers(), timeout=30)
         resp.raise_for_status()
         data = resp.json()
         file_data = data.get("file", {})
         return file_data.get("download_url", "")
 
-    def download_video(self, video_url: str, save_path: str) -> str:
-        resp = requests.get(video_url, stream=True, timeout=120)
+    # ─── Async ────────────────────────────────────────────────────
+
+    async def asubmit_text_to_video(self, prompt: str, duration: int = 8,
+                                    resolution: str = "720p", seed: int = 0) -> str:
+        url = f"{BASE_URL}/video_generation"
+        payload = self._text_payload(prompt)
+
+        await self._athrottle("submit")
+        resp = await self._async_client().post(url, json=payload, headers=self._headers(), timeout=60)
+        resp.raise_for_status()
+        self._count_submit()
+        return resp.json().get("task_id", "")
+
+    async def asubmit_image_to_video(self, prompt: str, image_path: str,
+                                     duration: int = 8, resolution: str = "720p",
+                                     seed: int = 0) -> str:
+        url = f"{BASE_URL}/video_generation"
+        payload = await asyncio.to_thread(self._image_payload, prompt, image_path)
+
+        await self._athrottle("submit")
+        resp = await self._async_client().post(url, json=payload, headers=self._headers(), timeout=60)
+        resp.raise_for_status()
+        self._count_submit()
+        return resp.json().get("task_id", "")
+
+    async def acheck_status(self, task_id: str) -> dict:
+        url = f"{BASE_URL}/query/video_generation"
+        params = {"task_id": task_id}
+        await self._athrottle("poll")
+        resp = await self._async_client().get(url, params=params, headers=self._headers(), timeout=30)
         resp.raise_for_status()
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        with open(save_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
-        return save_path
+
+        result, file_id = self._parse_status(resp.json())
+        if file_id:
+            result["video_url"] = await self._aget_download_url(file_id)
+        return result
+
+    async def _aget_download_url(self, file_id: str) -> str:
+        url = f"{BASE_URL}/files/retrieve"
+        params = {"file_id": file_id}
+        await self._athrottle("poll")
+        resp = await self._async_client().get(url, params=params, headers=self._headers(), timeout=30)
+        resp.raise_for_status()
+        return resp.json().get("file", {}).get("download_url", "")
+
+    def cache_identity(self) -> dict:
+        return {**super().cache_identity(), "model": self.model}
 
     def get_cost_estimate(self, duration: int, resolution: str) -> float:
         return 0.05
@@ -0,0 +1,174 @@
+import os
+import json
+import time
+import asyncio
+import hashlib
+import threading
+from datetime import date
+
+KINDS = ("submit", "poll", "download")
+BURST_SECONDS = 5  # a bucket holds this many seconds worth of tokens
+
+
+class QuotaExhausted(PermissionError):
+    """Daily submit quota used up. Permanent for this run: retrying will not refill it."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Callers reserve a token and sleep until it is theirs."""
+
+    def __init__(self, rate_per_min: float):
+        self.rate = rate_per_min / 60.0
+        self.capacity = max(1.0, self.rate * BURST_SECONDS)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token; returns how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def aacquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class DailyQuota:
+    """Submits per provider and API key for the current day, persisted to a JSON file."""
+
+    def __init__(self, path: str = None):
+        self.path = path
+        self.counts: dict[str, dict] = {}  # "provider|key fingerprint" -> {"date", "used"}
+        self._lock = threading.Lock()
+        if path and os.path.isfile(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.counts = json.load(f)
+            except (OSError, ValueError):
+                self.counts = {}
+
+    def used(self, provider: str, api_key: str) -> int:
+        with self._lock:
+            entry = self.counts.get(_slot(provider, api_key), {})
+            return entry.get("used", 0) if entry.get("date") == date.today().isoformat() else 0
+
+    def add(self, provider: str, api_key: str):
+        today = date.today().isoformat()
+        with self._lock:
+            slot = _slot(provider, api_key)
+            entry = self.counts.get(slot, {})
+            if entry.get("date") != today:
+                entry = {"date": today, "used": 0}
+            entry["used"] += 1
+            self.counts[slot] = entry
+            self._save()
+
+    def used_by_provider(self, provider: str) -> int:
+        today = date.today().isoformat()
+        with self._lock:
+            return sum(e.get("used", 0) for slot, e in self.counts.items()
+                       if slot.split("|")[0] == provider and e.get("date") == today)
+
+    def _save(self):
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.counts, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Short stable id for an API key. Never store the key itself on disk."""
+    return hashlib.sha1(api_key.encode("utf-8")).hexdigest()[:10]
+
+
+def _slot(provider: str, api_key: str) -> str:
+    return f"{provider}|{key_fingerprint(api_key)}"
+
+
+# Shared by every provider instance in the process
+_limits: dict[str, dict] = {}
+_buckets: dict[tuple[str, str, str], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+_quota = DailyQuota()
+
+
+def configure(limits: dict, quota_path: str = None):
+    """
+    Set per-provider limits, e.g. {"kling": {"submit": 10, "poll": 60,
+    "download": 30, "daily_quota": 0}}. Rates are calls per minute per API key,
+    0 disables a bucket; daily_quota 0 means unlimited.
+    """
+    global _quota
+    with _buckets_lock:
+        _limits.clear()
+        _limits.update(limits or {})
+        _buckets.clear()
+    if quota_path != _quota.path:
+        _quota = DailyQuota(quota_path)
+
+
+def get_bucket(provider: str, api_key: str, kind: str) -> TokenBucket | None:
+    rate = _limits.get(provider, {}).get(kind, 0)
+    if not rate:
+        return None
+    slot = (provider, api_key, kind)
+    with _buckets_lock:
+        bucket = _buckets.get(slot)
+        if bucket is None:
+            bucket = _buckets[slot] = TokenBucket(rate)
+        return bucket
+
+
+def daily_limit(provider: str) -> int:
+    return int(_limits.get(provider, {}).get("daily_quota", 0) or 0)
+
+
+def check_quota(provider: str, api_key: str):
+    limit = daily_limit(provider)
+    if limit and _quota.used(provider, api_key) >= limit:
+        raise QuotaExhausted(f"Daily quota used up for {provider} ({limit} submits)")
+
+
+def count_submit(provider: str, api_key: str):
+    _quota.add(provider, api_key)
+
+
+def remaining_quota(provider: str, api_key: str) -> int | None:
+    """Submits left today for one key, or None if unlimited."""
+    limit = daily_limit(provider)
+    if not limit:
+        return None
+    return max(0, limit - _quota.used(provider, api_key))
+
+
+def quota_summary(providers: dict[str, int]) -> str:
+    """
+    One-line summary of today's usage for the GUI, e.g. "kling 12/150".
+    providers maps provider name -> number of API keys in use (the quota is per key).
+    """
+    parts = []
+    for name, keys in providers.items():
+        limit = daily_limit(name) * max(1, keys)
+        used = _quota.used_by_provider(name)
+        if limit:
+            parts.append(f"{name} {used}/{limit}")
+        elif used:
+            parts.append(f"{name} {used}")
+    return "  ".join(parts)
@@ -0,0 +1,75 @@
+import time
+
+from .base import BaseProvider
+from .composite import CompositeProvider, Member
+
+SLO_COOLDOWN = 300        # seconds a provider is skipped after missing the latency SLO
+
+
+class RoutingProvider(CompositeProvider):
+    """Routes each scene to the provider with the lowest expected wait (latency, queue, cost)."""
+
+    def __init__(self, providers: list[BaseProvider], capacities: dict[str, int] = None,
+                 latency_slo: float = 0, cost_weight: float = 60):
+        capacities = capacities or {}
+        super().__init__("router", [Member(p.name, p, capacities.get(p.name, 1))
+                                    for p in providers])
+        self.latency_slo = latency_slo    # seconds, 0 = no SLO
+        self.cost_weight = cost_weight    # seconds of latency worth $1
+        self._duration = 8
+        self._resolution = "720p"
+
+    # ─── Routing ──────────────────────────────────────────────────
+
+    def _score(self, member: Member) -> float:
+        cost = member.provider.get_cost_estimate(self._duration, self._resolution)
+        queue = member.in_flight / member.capacity
+        return member.expected_latency() * (1 + queue) + cost * self.cost_weight
+
+    def _rank(self, needs_image: bool) -> list[Member]:
+        now = time.monotonic()
+        members = [m for m in self.members.values()
+                   if not needs_image or m.provider.supports_image_to_video]
+        ready = [m for m in members if m.available(now)]
+        # Everyone on cooldown: still try, soonest-available first
+        if not ready:
+            return sorted(members, key=lambda m: m.cooldown_until)
+        return sorted(ready, key=self._score)
+
+    def _after_status(self, task_id: str, member: Member, result: dict) -> dict:
+        """Turn a still-running job past the SLO into a failure (so it is re-routed)."""
+        if not self.latency_slo:
+            return result
+        started = self._submitted.get(task_id)
+        if started is None or time.monotonic() - started < self.latency_slo:
+            return result
+        self._release(task_id, member)
+        with self._lock:
+            member.cooldown_until = time.monotonic() + SLO_COOLDOWN
+        return {"status": "failed",
+                "error": f"{member.provider.name} exceeded latency SLO ({self.latency_slo:.0f}s)"}
+
+    # ─── BaseProvider ─────────────────────────────────────────────
+
+    def submit_text_to_video(self, prompt: str, duration: int = 8,
+                             resolution: str = "720p", seed: int = 0) -> str:
+        self._duration, self._resolution = duration, resolution
+        return super().submit_text_to_video(prompt, duration, resolution, seed)
+
+    def submit_image_to_video(self, prompt: str, image_path: str,
+                              duration: int = 8, resolution: str = "720p",
+                              seed: int = 0) -> str:
+        self._duration, self._resolution = duration, resolution
+        return super().submit_image_to_video(prompt, image_path, duration, resolution, seed)
+
+    async def asubmit_text_to_video(self, prompt: str, duration: int = 8,
+                                    resolution: str = "720p", seed: int = 0) -> str:
+        self._duration, self._resolution = duration, resolution
+        return await super().asubmit_text_to_video(prompt, duration, resolution, seed)
+
+    async def asubmit_image_to_video(self, prompt: str, image_path: str,
+                                     duration: int = 8, resolution: str = "720p",
+                                     seed: int = 0) -> str:
+        self._duration, self._resolution = duration, resolution
+        return await super().asubmit_image_to_video(prompt, image_path, duration,
+                                                    resolution, seed)
@@ -1,8 +1,7 @@
-import requests
-import os
+import asyncio
 import time
-import base64
 from .base import BaseProvider
+from .assets import prepare_image
 
 BASE_URL = "https://api.dev.runwayml.com/v1"
 
@@ -10,6 +9,7 @@ BASE_URL = "https://api.dev.runwayml.com/v1"
 class RunwayProvider(BaseProvider):
     name = "runway"
     supports_image_to_video = True
+    warm_url = BASE_URL
 
     def __init__(self, api_key: str, model: str = "gen4_turbo"):
         super().__init__(api_key)
@@ -22,9 +22,7 @@ class RunwayProvider(BaseProvider):
             "X-Runway-Version": "2024-11-06",
         }
 
-    def submit_text_to_video(self, prompt: str, duration: int = 8,
-                             resolution: str = "720p", seed: int = 0) -> str:
-        url = f"{BASE_URL}/text_to_video"
+    def _text_payload(self, prompt: str, duration: int, seed: int) -> dict:
         duration = max(5, min(duration, 10))
         payload = {
             "model": self.model,
@@ -34,59 +32,91 @@ class RunwayProvider(BaseProvider):
         }
         if seed > 0:
             payload["seed"] = seed
+        return payload
+
+    def _image_payload(self, prompt: str, image_path: str, duration: int, seed: int) -> dict:
+        payload = self._text_payload(prompt, duration, seed)
+        payload["promptImage"] = prepare_image(image_path, self.name).data_uri
+        return payload
+
+    @staticmethod
+    def _parse_status(data: dict) -> dict:
+        status = data.get("status", "").upper()
+        if status == "SUCCEEDED":
+            outputs = data.get("output", [])
+            video_url = outputs[0].get("url", "") if outputs else ""
+            return {"status": "completed", "video_url": video_url}
+        elif status == "FAILED":
+            return {"status": "failed", "error": data.get("failure", "Unknown error")}
+        else:
+            return {"status": "processing"}
+
+    def submit_text_to_video(self, prompt: str, duration: int = 8,
+                             resolution: str = "720p", seed: int = 0) -> str:
+        url = f"{BASE_URL}/text_to_video"
+        payload = self._text_payload(prompt, duration, seed)
 
-        resp = requests.post(url, json=payload, headers=self._headers(), timeout=60)
+        self._throttle("submit")
+        resp = self._http(url).post(url, json=payload, headers=self._headers(), timeout=60)
         resp.raise_for_status()
+        self._count_submit()
         data = resp.json()
         return data.get("id", "")
 
     def submit_image_to_video(self, prompt: str, image_path: str,
                               duration: int = 8, resolution: str = "720p",
                               seed: int = 0) -> str:
-        with open(image_path, "rb") as f:
-            image_b64 = base64.b64encode(f.read()).decode()
-
         url = f"{BASE_URL}/image_to_video"
-        duration = max(5, min(duration, 10))
-        payload = {
-            "model": self.model,
-            "promptImage": f"data:image/png;base64,{image_b64}",
-            "promptText": prompt[:1000],
-            "duration": duration,
-            "ratio": "1280:720",
-        }
-        if seed > 0:
-            payload["seed"] = seed
+        payload = self._image_payload(prompt, image_path, duration, seed)
 
-        resp = requests.post(url, json=payload, headers=self._headers(), timeout=60)
+        self._throttle("submit")
+        resp = self._http(url).post(url, json=payload, headers=self._headers(), timeout=60)
         resp.raise_for_status()
+        self._count_submit()
         data = resp.json()
         return data.get("id", "")
 
     def check_status(self, task_id: str) -> dict:
         url = f"{BASE_URL}/tasks/{task_id}"
-        resp = requests.get(url, headers=self._headers(), timeout=30)
+        self._throttle("poll")
+        resp = self._http(url).get(url, headers=self._headers(), timeout=30)
         resp.raise_for_status()
-        data = resp.json()
+        return self._parse_status(resp.json())
 
-        status = data.get("status", "").upper()
-        if status == "SUCCEEDED":
-            outputs = data.get("output", [])
-            video_url = outputs[0].get("url", "") if outputs else ""
-            return {"status": "completed", "video_url": video_url}
-        elif status == "FAILED":
-            return {"status": "failed", "error": data.get("failure", "Unknown error")}
-        else:
-            return {"status": "processing"}
+    # ─── Async ────────────────────────────────────────────────────
+
+    async def asubmit_text_to_video(self, prompt: str, duration: int = 8,
+                                    resolution: str = "720p", seed: int = 0) -> str:
+        url = f"{BASE_URL}/text_to_video"
+        payload = self._text_payload(prompt, duration, seed)
+
+        await self._athrottle("submit")
+        resp = await self._async_client().post(url, json=payload, headers=self._headers(), timeout=60)
+        resp.raise_for_status()
+        self._count_submit()
+        return resp.json().get("id", "")
 
-    def download_video(self, video_url: str, save_path: str) -> str:
-        resp = requests.get(video_url, stream=True, timeout=120)
+    async def asubmit_image_to_video(self, prompt: str, image_path: str,
+                                     duration: int = 8, resolution: str = "720p",
+                                     seed: int = 0) -> str:
+        url = f"{BASE_URL}/image_to_video"
+        payload = await asyncio.to_thread(self._image_payload, prompt, image_path, duration, seed)
+
+        await self._athrottle("submit")
+        resp = await self._async_client().post(url, json=payload, headers=self._headers(), timeout=60)
+        resp.raise_for_status()
+        self._count_submit()
+        return resp.json().get("id", "")
+
+    async def acheck_status(self, task_id: str) -> dict:
+        url = f"{BASE_URL}/tasks/{task_id}"
+        await self._athrottle("poll")
+        resp = await self._async_client().get(url, headers=self._headers(), timeout=30)
         resp.raise_for_status()
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        with open(save_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
-        return save_path
+        return self._parse_status(resp.json())
+
+    def cache_identity(self) -> dict:
+        return {**super().cache_identity(), "model": self.model}
 
     def get_cost_estimate(self, duration: int, resolution: str) -> float:
         # Gen-4 Turbo: ~$0.05/sec
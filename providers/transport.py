@@ -0,0 +1,71 @@
+"""
+Pooled HTTP connections shared by every provider.
+
+One requests.Session per host keeps connections alive between submits,
+polls and downloads, so only the first call to a host pays for the TCP and
+TLS handshakes. Pool sizes follow the scheduler's concurrency (configure()),
+and warm_up() opens a connection before the first real request.
+"""
+import threading
+import importlib.util
+from urllib.parse import urlsplit
+
+DEFAULT_POOL_SIZE = 10
+WARM_UP_TIMEOUT = 5
+
+_pool_size = DEFAULT_POOL_SIZE
+_http2 = False
+_sessions: dict = {}   # "scheme://host" -> requests.Session
+_lock = threading.Lock()
+
+
+def configure(pool_size: int = None, http2: bool = None):
+    """Set the connections kept per host (and HTTP/2 for async clients); resizes open sessions."""
+    global _pool_size, _http2
+    with _lock:
+        if pool_size:
+            _pool_size = max(DEFAULT_POOL_SIZE, int(pool_size))
+        if http2 is not None:
+            _http2 = bool(http2)
+        for session in _sessions.values():
+            _mount(session)
+
+
+def pool_size() -> int:
+    return _pool_size
+
+
+def http2_enabled() -> bool:
+    """HTTP/2 was asked for and the h2 package httpx needs for it is installed."""
+    return _http2 and importlib.util.find_spec("h2") is not None
+
+
+def session(url: str):
+    """The shared session for url's host."""
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    with _lock:
+        s = _sessions.get(origin)
+        if s is None:
+            import requests
+
+            s = requests.Session()
+            _mount(s)
+            _sessions[origin] = s
+    return s
+
+
+def _mount(s):
+    from requests.adapters import HTTPAdapter
+
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_pool_size)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+
+
+def warm_up(url: str):
+    """Open a kept-alive connection to url's host. Errors are ignored."""
+    try:
+        session(url).head(url, timeout=WARM_UP_TIMEOUT)
+    except Exception:
+        pass
@@ -1,9 +1,70 @@
-import os
 import time
+import asyncio
+import threading
 from .base import BaseProvider
+from .assets import prepare_image, content_hash
+from .rate_limit import key_fingerprint
+from . import transport
+from core.retry import PERMANENT, classify_error
 
-from google import genai
-from google.genai import types
+# google-genai takes a second or more to import; it is loaded the first time
+# a Veo client is actually needed, not when this module is imported.
+
+UPLOAD_TTL = 48 * 3600        # Files API deletes uploads after 48 hours
+EXPIRY_MARGIN = 3600          # re-upload this long before the server-side expiry
+
+
+class _Upload:
+    """One uploaded file, shared by every submit that uses the same image content."""
+
+    def __init__(self):
+        self.lock = threading.Lock()   # held while uploading, so each content uploads once
+        self.file = None
+        self.expires = 0.0
+
+
+_uploads: dict = {}   # (API key fingerprint, content hash) -> _Upload
+_uploads_lock = threading.Lock()
+
+# Words in a rejected submit's error that point at the uploaded file itself
+_FILE_ERROR_HINTS = ("file", "not found", "expired", "uri")
+
+# One genai.Client per API key, shared by every provider instance (and run),
+# so its connection pool stays warm between runs.
+_clients: dict = {}
+_clients_lock = threading.Lock()
+
+DOWNLOAD_HOST = "https://generativelanguage.googleapis.com"
+
+
+def _rejects_upload(exc: Exception) -> bool:
+    """
+    A submit failed because its uploaded file reference is no longer valid.
+    Rate limits, 5xx and timeouts are retried with the same upload.
+    """
+    if classify_error(exc) != PERMANENT:
+        return False
+    text = str(exc).lower()
+    return any(h in text for h in _FILE_ERROR_HINTS)
+
+
+def _get_client(api_key: str):
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            from google import genai
+            client = _clients[api_key] = genai.Client(api_key=api_key)
+    return client
+
+
+def _expiry(uploaded) -> float:
+    expiration = getattr(uploaded, "expiration_time", None)
+    if expiration is not None:
+        try:
+            return expiration.timestamp() - EXPIRY_MARGIN
+        except (AttributeError, ValueError):
+            pass
+    return time.time() + UPLOAD_TTL - EXPIRY_MARGIN
 
 
 class Veo3Provider(BaseProvider):
@@ -34,7 +95,32 @@ class Veo3Provider(BaseProvider):
         self.person_generation = person_generation
         self.subject_refs = subject_refs or []
         self.bg_refs = bg_refs or []
-        self.client = genai.Client(api_key=api_key)
+
+    @property
+    def client(self):
+        """genai.Client, created (and the SDK imported) on first use."""
+        return _get_client(self.api_key)
+
+    def cache_identity(self) -> dict:
+        identity = {
+            **super().cache_identity(),
+            "model": self.model_name,
+            "aspect_ratio": self.aspect_ratio,
+            "resolution": self._resolution,
+            "generate_audio": self.generate_audio,
+            "negative_prompt": self.negative_prompt,
+            "person_generation": self.person_generation,
+        }
+        if self._is_veo31():   # reference images are only sent to Veo 3.1
+            subjects = self.subject_refs[:2]
+            identity["subject_refs"] = [content_hash(p) for p in subjects]
+            identity["bg_refs"] = [content_hash(p) for p in self.bg_refs[:3 - len(subjects)]]
+        return identity
+
+    def warm_up(self):
+        """Import the SDK, create the client and open the video download host."""
+        self.client
+        transport.warm_up(DOWNLOAD_HOST)
 
     def _is_veo31(self) -> bool:
         return "3.1" in self.model_name
@@ -47,16 +133,36 @@ class Veo3Provider(BaseProvider):
             uploaded = self.client.files.get(name=uploaded.name)
         return uploaded
 
-    def _read_image_bytes(self, image_path: str) -> tuple[bytes, str]:
-        """Đọc ảnh thành bytes + mime type."""
-        ext = os.path.splitext(image_path)[1].lower()
-        mime_map = {".png": "image/png", ".jpg": "image/jpeg",
-                    ".jpeg": "image/jpeg", ".webp": "image/webp"}
-        mime = mime_map.get(ext, "image/png")
-        with open(image_path, "rb") as f:
-            return f.read(), mime
+    def _upload_key(self, image_path: str) -> tuple[str, str]:
+        return key_fingerprint(self.api_key), content_hash(image_path)
+
+    def _cached_upload(self, image_path: str):
+        """
+        Uploaded file for image_path, reusing an earlier upload of the same
+        content (same API key) until it is close to expiring. Different
+        images upload in parallel; the same image uploads once.
+        """
+        key = self._upload_key(image_path)
+        with _uploads_lock:
+            entry = _uploads.setdefault(key, _Upload())
+        with entry.lock:
+            if entry.file is None or time.time() >= entry.expires:
+                entry.file = self._upload_image(image_path)
+                entry.expires = _expiry(entry.file)
+            return entry.file
+
+    def _forget_upload(self, image_path: str):
+        """Drop a cached upload the API rejected, so a retry uploads again."""
+        try:
+            key = self._upload_key(image_path)
+        except OSError:
+            return
+        with _uploads_lock:
+            _uploads.pop(key, None)
+
+    def _make_config(self, duration: int = 8, seed: int = 0) -> "types.GenerateVideosConfig":
+        from google.genai import types
 
-    def _make_config(self, duration: int = 8, seed: int = 0) -> types.GenerateVideosConfig:
         kwargs = {
             "aspect_ratio": self.aspect_ratio,
             "number_of_videos": 1,
@@ -88,24 +194,26 @@ class Veo3Provider(BaseProvider):
 
         return types.GenerateVideosConfig(**kwargs)
 
-    def _build_reference_images(self) -> list[types.VideoGenerationReferenceImage]:
+    def _build_reference_images(self) -> list["types.VideoGenerationReferenceImage"]:
         """Tạo danh sách ảnh tham chiếu (tối đa 3, chỉ Veo 3.1)."""
+        from google.genai import types
+
         refs = []
 
         # Ảnh chủ thể → referenceType = ASSET
         for path in self.subject_refs[:2]:  # tối đa 2 ảnh chủ thể
-            img_bytes, mime = self._read_image_bytes(path)
+            img = prepare_image(path, self.name)   # đọc + nén 1 lần, dùng lại cho mọi scene
             refs.append(types.VideoGenerationReferenceImage(
-                image=types.Image(image_bytes=img_bytes, mime_type=mime),
+                image=types.Image(image_bytes=img.data, mime_type=img.mime),
                 reference_type="ASSET",
             ))
 
         # Ảnh bối cảnh → referenceType = STYLE
         remaining = 3 - len(refs)
         for path in self.bg_refs[:remaining]:  # tổng tối đa 3
-            img_bytes, mime = self._read_image_bytes(path)
+            img = prepare_image(path, self.name)
             refs.append(types.VideoGenerationReferenceImage(
-                image=types.Image(image_bytes=img_bytes, mime_type=mime),
+                image=types.Image(image_bytes=img.data, mime_type=img.mime),
                 reference_type="STYLE",
             ))
 
@@ -115,31 +223,44 @@ class Veo3Provider(BaseProvider):
                              resolution: str = "720p", seed: int = 0) -> str:
         config = self._make_config(duration, seed)
 
+        self._throttle("submit")
         operation = self.client.models.generate_videos(
             model=self.model_name,
             prompt=prompt,
             config=config,
         )
+        self._count_submit()
         return operation.name
 
     def submit_image_to_video(self, prompt: str, image_path: str,
                               duration: int = 8, resolution: str = "720p",
                               seed: int = 0) -> str:
         """Tạo video từ ảnh (first frame / frame chaining)."""
-        uploaded_file = self._upload_image(image_path)
+        uploaded_file = self._cached_upload(image_path)
         config = self._make_config(duration, seed)
 
-        operation = self.client.models.generate_videos(
-            model=self.model_name,
-            prompt=prompt,
-            image=uploaded_file,
-            config=config,
-        )
+        self._throttle("submit")
+        try:
+            operation = self.client.models.generate_videos(
+                model=self.model_name,
+                prompt=prompt,
+                image=uploaded_file,
+                config=config,
+            )
+        except Exception as e:
+            if _rejects_upload(e):
+                self._forget_upload(image_path)
+            raise
+        self._count_submit()
         return operation.name
 
     def check_status(self, task_id: str) -> dict:
+        self._throttle("poll")
         operation = self.client.operations.get(operation=task_id)
+        return self._parse_operation(operation)
 
+    @staticmethod
+    def _parse_operation(operation) -> dict:
         if operation.done:
             if hasattr(operation, 'error') and operation.error:
                 return {"status": "failed", "error": str(operation.error)}
@@ -163,28 +284,67 @@ class Veo3Provider(BaseProvider):
 
         return {"status": "processing"}
 
-    def download_video(self, video_url: str, save_path: str) -> str:
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-        import requests as req
-        headers = {"x-goog-api-key": self.api_key}
-
+    def _download_request(self, video_url: str) -> tuple[str, dict]:
+        """URL tải thực tế + headers cho một video_url (Files API, gs:// hoặc URL thường)."""
         if "generativelanguage.googleapis.com" in video_url:
             sep = "&" if "?" in video_url else "?"
-            download_url = f"{video_url}{sep}alt=media"
-            resp = req.get(download_url, headers=headers, stream=True, timeout=300)
+            return f"{video_url}{sep}alt=media", {"x-goog-api-key": self.api_key}
         elif video_url.startswith("gs://"):
             gcs_path = video_url.replace("gs://", "")
-            download_url = f"https://storage.googleapis.com/{gcs_path}"
-            resp = req.get(download_url, stream=True, timeout=300)
-        else:
-            resp = req.get(video_url, stream=True, timeout=300)
-
-        resp.raise_for_status()
-        with open(save_path, "wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                f.write(chunk)
-        return save_path
+            return f"https://storage.googleapis.com/{gcs_path}", {}
+        return video_url, {}
+
+    def download_video(self, video_url: str, save_path: str) -> str:
+        download_url, headers = self._download_request(video_url)
+        return self._download(download_url, save_path, headers=headers, timeout=300)
+
+    # ─── Async (client.aio) ───────────────────────────────────────
+
+    async def asubmit_text_to_video(self, prompt: str, duration: int = 8,
+                                    resolution: str = "720p", seed: int = 0) -> str:
+        # Reference images are read and resized here: keep that off the event loop
+        config = await asyncio.to_thread(self._make_config, duration, seed)
+
+        await self._athrottle("submit")
+        operation = await self.client.aio.models.generate_videos(
+            model=self.model_name,
+            prompt=prompt,
+            config=config,
+        )
+        self._count_submit()
+        return operation.name
+
+    async def asubmit_image_to_video(self, prompt: str, image_path: str,
+                                     duration: int = 8, resolution: str = "720p",
+                                     seed: int = 0) -> str:
+        # Upload cache is shared with the threaded path; waiting for it in a
+        # worker thread keeps one upload per image across both engines
+        uploaded_file = await asyncio.to_thread(self._cached_upload, image_path)
+        config = await asyncio.to_thread(self._make_config, duration, seed)
+
+        await self._athrottle("submit")
+        try:
+            operation = await self.client.aio.models.generate_videos(
+                model=self.model_name,
+                prompt=prompt,
+                image=uploaded_file,
+                config=config,
+            )
+        except Exception as e:
+            if _rejects_upload(e):
+                self._forget_upload(image_path)
+            raise
+        self._count_submit()
+        return operation.name
+
+    async def acheck_status(self, task_id: str) -> dict:
+        await self._athrottle("poll")
+        operation = await self.client.aio.operations.get(operation=task_id)
+        return self._parse_operation(operation)
+
+    async def adownload_video(self, video_url: str, save_path: str) -> str:
+        download_url, headers = self._download_request(video_url)
+        return await self._adownload(download_url, save_path, headers=headers, timeout=300)
 
     def get_cost_estimate(self, duration: int, resolution: str) -> float:
         if "fast" in self.model_name:
@@ -7,7 +7,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from providers.veo3 import Veo3Provider
 from core.config import load_config, get_api_key
-from gui.prompt_editor import _parse_scene_text
+from core.script import parse_scene_text
 
 # --- Config ---
 config = load_config()
@@ -39,7 +39,7 @@ eye opening, amber iris reflecting sunlight, detailed scales and skin
 texture, cinematic lighting, shallow depth of field"""
 
 # --- Parse scenes ---
-scenes = _parse_scene_text(RAW_PROMPTS)
+scenes = parse_scene_text(RAW_PROMPTS)
 print(f"Parsed {len(scenes)} scenes\n")
 
 # --- Init provider ---